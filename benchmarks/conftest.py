@@ -0,0 +1,97 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Literal
+
+import pytest
+import yaml
+
+from envix.cache.config_cache import config_cache
+from envix.envname import ENVIX_CONFIG_DIR
+
+ConfigFormat = Literal["yaml", "json", "toml"]
+
+
+def envname(prefix: str, index: int) -> str:
+    """
+    Env names may only contain uppercase letters and underscores.
+    """
+
+    suffix = ""
+    while True:
+        index, remainder = divmod(index, 26)
+        suffix = chr(ord("A") + remainder) + suffix
+        if index == 0:
+            return f"{prefix}_{suffix}"
+
+        index -= 1
+
+
+def raw_config(
+    entries: int,
+    includes: list[str] | None = None,
+    prefix: str = "ENVIX_BENCH",
+) -> dict[str, Any]:
+    return {
+        "envix": {"version": 1},
+        "includes": includes or [],
+        "envs": [
+            {
+                "type": "Raw",
+                "items": {envname(prefix, i): f"value_{i}" for i in range(entries)},
+            }
+        ],
+    }
+
+
+def dump_toml(config: dict[str, Any]) -> str:
+    # Only the shape of `raw_config` is supported, which is enough for the benchmarks.
+    lines = [
+        f"includes = {json.dumps(config['includes'])}",
+        "",
+        "[envix]",
+        f"version = {config['envix']['version']}",
+    ]
+    for envs in config["envs"]:
+        lines.extend(["", "[[envs]]", f"type = {json.dumps(envs['type'])}"])
+        lines.extend(["", "[envs.items]"])
+        lines.extend(
+            f"{envname} = {json.dumps(value)}"
+            for envname, value in envs["items"].items()
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_config(
+    filepath: Path, config: dict[str, Any], format: ConfigFormat = "yaml"
+) -> Path:
+    filepath = filepath.with_suffix(f".{format}" if format != "yaml" else ".yml")
+
+    match format:
+        case "yaml":
+            filepath.write_text(yaml.safe_dump(config))
+
+        case "json":
+            filepath.write_text(json.dumps(config))
+
+        case "toml":
+            filepath.write_text(dump_toml(config))
+
+    return filepath
+
+
+@pytest.fixture(autouse=True)
+def config_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    config_dir = tmp_path.joinpath("config")
+    config_dir.mkdir()
+    monkeypatch.setitem(os.environ, ENVIX_CONFIG_DIR, os.fspath(config_dir))
+
+    return config_dir
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    config_cache.clear()
+    yield
+    config_cache.clear()
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.conftest import raw_config, write_config
+
+COMMANDS = {
+    "inject": ["inject", "--", sys.executable, "-c", "pass"],
+    "export": ["export"],
+}
+
+
+@pytest.mark.parametrize("command", COMMANDS.keys())
+def test_cold_start(benchmark: BenchmarkFixture, tmp_path: Path, command: str):
+    write_config(tmp_path.joinpath("envix"), raw_config(10))
+
+    def run():
+        subprocess.run(
+            [sys.executable, "-m", "envix.cli", *COMMANDS[command]],
+            cwd=tmp_path,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+
+    benchmark.pedantic(run, rounds=10, warmup_rounds=1)
@@ -0,0 +1,75 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.conftest import envname, raw_config, write_config
+from envix.cache.config_cache import config_cache
+from envix.config.config import Config
+from envix.loader import collect_secrets
+from envix.loader.session import LoaderSession
+
+INCLUDES = 50
+ENTRIES = 10
+
+
+def write_deep_tree(directory: Path) -> Path:
+    """
+    Each config includes the next one.
+    """
+
+    filepath = write_config(
+        directory.joinpath(f"envix_{INCLUDES}"),
+        raw_config(ENTRIES, prefix=envname("ENVIX_BENCH", INCLUDES)),
+    )
+    for i in reversed(range(INCLUDES)):
+        filepath = write_config(
+            directory.joinpath(f"envix_{i}"),
+            raw_config(
+                ENTRIES, includes=[filepath.name], prefix=envname("ENVIX_BENCH", i)
+            ),
+        )
+
+    return filepath
+
+
+def write_wide_tree(directory: Path) -> Path:
+    """
+    The root config includes every other config.
+    """
+
+    includes = [
+        write_config(
+            directory.joinpath(f"envix_{i}"),
+            raw_config(ENTRIES, prefix=envname("ENVIX_BENCH", i)),
+        ).name
+        for i in range(INCLUDES)
+    ]
+
+    return write_config(
+        directory.joinpath("envix"), raw_config(ENTRIES, includes=includes)
+    )
+
+
+@pytest.mark.parametrize("tree", ["deep", "wide"])
+def test_collect_secrets(benchmark: BenchmarkFixture, tmp_path: Path, tree: str):
+    filepath = (write_deep_tree if tree == "deep" else write_wide_tree)(tmp_path)
+
+    def setup():
+        config_cache.clear()
+
+        return (), {}
+
+    async def collect():
+        async with LoaderSession(use_cache=False) as session:
+            return await collect_secrets(
+                Config.load(filepath), filepath, session=session
+            )
+
+    secrets, errors = benchmark.pedantic(
+        lambda: asyncio.run(collect()), setup=setup, rounds=20
+    )
+
+    assert len(secrets) == (INCLUDES + 1) * ENTRIES
+    assert errors == []
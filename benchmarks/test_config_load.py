@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.conftest import ConfigFormat, raw_config, write_config
+from envix.cache.config_cache import config_cache
+from envix.config.config import Config
+
+
+@pytest.mark.parametrize("format", ["yaml", "json", "toml"])
+@pytest.mark.parametrize("entries", [10, 100, 1000])
+def test_config_load(
+    benchmark: BenchmarkFixture,
+    tmp_path: Path,
+    format: ConfigFormat,
+    entries: int,
+):
+    filepath = write_config(tmp_path.joinpath("envix"), raw_config(entries), format)
+
+    def setup():
+        # Measure the cold load, as every envix process does.
+        config_cache.clear()
+
+        return (filepath,), {}
+
+    config = benchmark.pedantic(Config.load, setup=setup, rounds=20)
+
+    assert len(config.root.envs[0].items) == entries
@@ -0,0 +1,56 @@
+import asyncio
+from typing import cast
+
+import pytest
+from google.cloud import secretmanager
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from benchmarks.conftest import envname
+from envix.config.v1.envs.google_cloud_secret_manager_envs_v1 import (
+    GoogleCloudSecretManagerEnvsV1,
+)
+from envix.loader.google_cloud_secret_manager import (
+    FakeSecretManagerFixture,
+    FakeSecretManagerServiceAsyncClient,
+)
+from envix.loader.v1_loader import load_google_cloud_secret_manager_envs_v1
+
+
+@pytest.mark.parametrize("latency", [0.0, 0.01])
+@pytest.mark.parametrize("entries", [1, 10, 100])
+def test_load_google_cloud_secret_manager_envs_v1(
+    benchmark: BenchmarkFixture,
+    latency: float,
+    entries: int,
+):
+    envs = GoogleCloudSecretManagerEnvsV1(
+        type="GoogleCloudSecretManager",
+        project_id="my-project",
+        items={
+            envname(
+                "ENVIX_BENCH", i
+            ): f"secrets/{envname('ENVIX_BENCH', i)}/versions/latest"
+            for i in range(entries)
+        },
+    )
+    client = cast(
+        secretmanager.SecretManagerServiceAsyncClient,
+        FakeSecretManagerServiceAsyncClient(
+            FakeSecretManagerFixture(
+                latency=latency,
+                secrets={
+                    f"projects/my-project/secrets/{envname('ENVIX_BENCH', i)}": f"value_{i}"
+                    for i in range(entries)
+                },
+            )
+        ),
+    )
+
+    secrets, errors = benchmark(
+        lambda: asyncio.run(
+            load_google_cloud_secret_manager_envs_v1(envs, {}, client=client)
+        )
+    )
+
+    assert len(secrets) == entries
+    assert errors == []
@@ -1,3 +1,14 @@
-import importlib.metadata
+from typing import Any
 
-__version__ = importlib.metadata.version(__name__)
+
+def __getattr__(name: str) -> Any:
+    # importlib.metadata is slow to import, so the version is resolved on first access.
+    if name == "__version__":
+        import importlib.metadata
+
+        global __version__
+        __version__ = importlib.metadata.version(__name__)
+
+        return __version__
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
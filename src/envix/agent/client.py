@@ -0,0 +1,84 @@
+import os
+import socket
+from logging import getLogger
+from pathlib import Path
+
+from pydantic import SecretStr, ValidationError
+
+from envix.agent.protocol import AgentRequest, AgentResponse
+from envix.default import DEFAULT_AGENT_TIMEOUT, DEFAULT_CONCURRENCY
+from envix.exception import EnvixAgentError, EnvixEnvInjectionError
+from envix.path import get_agent_socket_path
+from envix.trace import span
+from envix.types import Secrets
+
+logger = getLogger(__name__)
+
+
+def request_secrets(
+    config_filepaths: list[Path],
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    environ: dict[str, str] | None = None,
+    socket_path: Path | None = None,
+    timeout: float = DEFAULT_AGENT_TIMEOUT,
+) -> tuple[Secrets, list[EnvixEnvInjectionError]] | None:
+    """
+    Resolve the secrets with the envix agent.
+
+    Returns None when no agent is running or it does not answer within the timeout,
+    so that the caller resolves them by itself.
+    """
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    try:
+        socket_path = socket_path or get_agent_socket_path()
+        if not socket_path.exists():
+            return None
+
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"envix agent socket is not available: {e}")
+        return None
+
+    request = AgentRequest(
+        config_filepaths=[filepath.resolve() for filepath in config_filepaths],
+        concurrency=concurrency,
+        environ=dict(os.environ) if environ is None else environ,
+    )
+
+    try:
+        with (
+            span("request", "agent", socket=str(socket_path)),
+            socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock,
+        ):
+            sock.settimeout(timeout)
+            sock.connect(os.fspath(socket_path))
+            sock.sendall(request.model_dump_json().encode("UTF-8"))
+            sock.shutdown(socket.SHUT_WR)
+
+            chunks: list[bytes] = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+
+    except OSError as e:
+        logger.debug(f"envix agent is not available: {socket_path}, {e}")
+        return None
+
+    try:
+        response = AgentResponse.model_validate_json(b"".join(chunks))
+
+    except ValidationError as e:
+        logger.debug(f"envix agent returned an invalid response: {e}")
+        return None
+
+    if response.error is not None:
+        raise EnvixAgentError(response.error)
+
+    logger.debug(f"Resolved secrets with envix agent: {socket_path}")
+
+    return (
+        {envname: SecretStr(secret) for envname, secret in response.secrets.items()},
+        [EnvixAgentError(error) for error in response.errors],
+    )
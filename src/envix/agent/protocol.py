@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from envix.default import DEFAULT_CONCURRENCY
+
+
+class AgentRequest(BaseModel):
+    """
+    Request to resolve the secrets of the configs.
+
+    `environ` is the environment of the client,
+    which decides `overwrite` and the values of Local envs.
+    """
+
+    config_filepaths: list[Path]
+    concurrency: int = DEFAULT_CONCURRENCY
+    environ: dict[str, str] = {}
+
+
+class AgentResponse(BaseModel):
+    """
+    Resolved secrets, or the error which stopped the resolution.
+    """
+
+    secrets: dict[str, str] = {}
+    errors: list[str] = []
+    error: str | None = None
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import signal
+import socket
+import struct
+from logging import getLogger
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from envix.agent.protocol import AgentRequest, AgentResponse
+from envix.exception import EnvixAgentError
+from envix.loader import load_secrets
+from envix.loader.session import LoaderSession
+
+logger = getLogger(__name__)
+
+
+class AgentServer:
+    """
+    Resolve secrets for `inject` and `export` over a Unix socket.
+
+    The validated configs, the authenticated clients and the secret cache
+    are kept in memory, so repeated requests skip most of the work.
+    The socket is only accessible to the user who runs the agent.
+    """
+
+    def __init__(self, socket_path: Path, session: LoaderSession) -> None:
+        self.socket_path = socket_path
+        self.session = session
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._remove_stale_socket()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Create the socket without access for others, before chmod is applied.
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=self.socket_path
+            )
+
+        finally:
+            os.umask(umask)
+
+        os.chmod(self.socket_path, 0o600)
+        logger.info(f"envix agent is listening on {self.socket_path}")
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        self.socket_path.unlink(missing_ok=True)
+        await self.session.close()
+
+    async def serve_forever(self) -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+
+        await self.start()
+        try:
+            await stop.wait()
+
+        finally:
+            await self.close()
+            logger.info("envix agent stopped.")
+
+    async def resolve(self, request: AgentRequest) -> AgentResponse:
+        try:
+            secrets, errors = await load_secrets(
+                request.config_filepaths,
+                concurrency=request.concurrency,
+                session=self.session,
+                environ=request.environ,
+            )
+
+        except Exception as e:
+            # The agent keeps serving the other requests.
+            logger.debug(f"Failed to resolve the agent request: {e}", exc_info=True)
+            return AgentResponse(error=str(e))
+
+        return AgentResponse(
+            secrets={
+                envname: secret.get_secret_value()
+                for envname, secret in secrets.items()
+            },
+            errors=[str(error) for error in errors],
+        )
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            if not self._is_same_user(writer.get_extra_info("socket")):
+                logger.warning("Rejected a request from another user.")
+                return
+
+            try:
+                request = AgentRequest.model_validate_json(await reader.read())
+                response = await self.resolve(request)
+
+            except ValidationError as e:
+                response = AgentResponse(error=f"Invalid agent request: {e}")
+
+            writer.write(response.model_dump_json().encode("UTF-8"))
+            await writer.drain()
+
+        except OSError as e:
+            logger.debug(f"Failed to respond to the agent request: {e}")
+
+        finally:
+            writer.close()
+
+    def _is_same_user(self, sock: socket.socket | None) -> bool:
+        # The permission of the socket already restricts the access.
+        # The peer is checked again where the platform supports it.
+        if sock is None or not hasattr(socket, "SO_PEERCRED"):
+            return True
+
+        credentials = sock.getsockopt(
+            socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+        )
+        _, uid, _ = struct.unpack("3i", credentials)
+
+        return uid == os.getuid()
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(os.fspath(self.socket_path))
+
+            except OSError:
+                self.socket_path.unlink(missing_ok=True)
+                return
+
+        raise EnvixAgentError(f"envix agent is already running: {self.socket_path}")
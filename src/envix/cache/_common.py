@@ -0,0 +1,17 @@
+import os
+from pathlib import Path
+
+
+def write_private_file(filepath: Path, content: bytes) -> None:
+    """
+    Atomically write a file which only the current user can read.
+    """
+
+    filepath.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    tmp_filepath = filepath.with_name(f".{filepath.name}.{os.getpid()}")
+    fd = os.open(tmp_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(content)
+
+    os.replace(tmp_filepath, filepath)
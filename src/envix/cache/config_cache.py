@@ -0,0 +1,142 @@
+import hashlib
+import os
+import pickle
+from collections.abc import Callable
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import envix
+from envix.cache._common import write_private_file
+from envix.envname import ENVIX_CONFIG_CACHE
+from envix.path import get_user_cache_dir
+
+if TYPE_CHECKING:
+    from envix.config.config import Config
+
+logger = getLogger(__name__)
+
+ConfigKey = tuple[int, int]
+
+
+def get_config_cache_dir() -> Path:
+    return get_user_cache_dir().joinpath("configs")
+
+
+class ConfigCache:
+    """
+    Cache of the validated config models.
+
+    Configs are kept in memory for a single run, keyed by the file path, mtime and size,
+    and by the content hash.
+    When `ENVIX_CONFIG_CACHE` is enabled, they are also pickled on disk,
+    and reused only if the content hash of the file is unchanged.
+    When the cache directory cannot be used, the disk is skipped.
+    """
+
+    def __init__(self, cache_dir: Path | None = None, *, persist: bool | None = None):
+        self._cache_dir = cache_dir
+        self._persist = persist
+        self._configs: dict[Path, tuple[ConfigKey, Config]] = {}
+        self._validated: dict[str, Config] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or get_config_cache_dir()
+
+    @property
+    def persist(self) -> bool:
+        if self._persist is None:
+            return os.getenv(ENVIX_CONFIG_CACHE, "").lower() in ("1", "true", "yes")
+
+        return self._persist
+
+    def load(self, filepath: Path, parse: Callable[[bytes], "Config"]) -> "Config":
+        filepath = filepath.resolve()
+        stat = filepath.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        if (cached := self._configs.get(filepath)) and cached[0] == key:
+            return cached[1]
+
+        content = filepath.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+
+        # Content which has already passed validation is not validated again,
+        # e.g. when the file is only touched or saved without changes.
+        config = self._validated.get(digest)
+        if config is None and self.persist:
+            config = self._load_pickle(filepath, digest)
+
+        if config is None:
+            config = parse(content)
+
+            if self.persist:
+                self._dump_pickle(filepath, digest, config)
+
+        self._configs[filepath] = (key, config)
+        self._validated[digest] = config
+
+        return config
+
+    def clear(self) -> int:
+        self._configs.clear()
+        self._validated.clear()
+
+        count = 0
+        try:
+            if self.cache_dir.exists():
+                for pickle_path in self.cache_dir.glob("*.pickle"):
+                    pickle_path.unlink(missing_ok=True)
+                    count += 1
+
+        except OSError as e:
+            logger.debug(f"Failed to clear config cache: {e}")
+
+        return count
+
+    def _pickle_path(self, filepath: Path) -> Path:
+        digest = hashlib.sha256(os.fsencode(filepath)).hexdigest()
+
+        return self.cache_dir.joinpath(f"{digest}.pickle")
+
+    def _load_pickle(self, filepath: Path, digest: str) -> "Config | None":
+        try:
+            with open(self._pickle_path(filepath), "rb") as f:
+                version, path, cached_digest, config = pickle.load(f)
+
+        except FileNotFoundError:
+            return None
+
+        except (
+            OSError,
+            EOFError,
+            pickle.UnpicklingError,
+            AttributeError,
+            ImportError,
+            TypeError,
+            ValueError,
+        ) as e:
+            # Pickles of other versions may refer to classes which are moved or changed.
+            logger.debug(f"Discard broken config cache: {filepath}, {e}")
+            return None
+
+        if (version, path, cached_digest) != (envix.__version__, filepath, digest):
+            return None
+
+        logger.debug(f"Use config cache: {filepath}")
+
+        return config
+
+    def _dump_pickle(self, filepath: Path, digest: str, config: "Config") -> None:
+        try:
+            write_private_file(
+                self._pickle_path(filepath),
+                pickle.dumps((envix.__version__, filepath, digest, config)),
+            )
+
+        except OSError as e:
+            logger.debug(f"Failed to write config cache: {filepath}, {e}")
+
+
+config_cache = ConfigCache()
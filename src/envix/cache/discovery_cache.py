@@ -0,0 +1,156 @@
+import json
+import os
+from collections.abc import Sequence
+from logging import getLogger
+from pathlib import Path
+from typing import Final
+
+from pydantic import BaseModel, ValidationError
+
+from envix.cache._common import write_private_file
+from envix.path import get_user_cache_dir
+
+logger = getLogger(__name__)
+
+# Number of working directories whose results are kept on disk.
+MAX_ENTRIES: Final[int] = 256
+
+
+def get_discovery_cache_path() -> Path:
+    return get_user_cache_dir().joinpath("discovery.json")
+
+
+class DiscoveryEntry(BaseModel):
+    config_filepath: Path | None
+    # mtimes of the listed directories, which change when a file is added or removed.
+    directory_mtimes: dict[Path, int]
+
+    def is_valid(self) -> bool:
+        for directory, mtime_ns in self.directory_mtimes.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime_ns:
+                    return False
+
+            except OSError:
+                return False
+
+        return True
+
+
+class DiscoveryCache:
+    """
+    Cache of the config file found from each working directory.
+
+    Each directory from the working directory up to the config file is listed once
+    with `os.scandir`, instead of checking every file name of the config.
+    The result is stored in the user cache dir keyed by the working directory,
+    and reused while the mtimes of the listed directories are unchanged.
+    When the cache cannot be read or written, the directories are scanned every time.
+    """
+
+    def __init__(self, cache_path: Path | None = None, *, persist: bool = True):
+        self._cache_path = cache_path
+        self.persist = persist
+        self._entries: dict[Path, DiscoveryEntry] | None = None
+
+    @property
+    def cache_path(self) -> Path:
+        return self._cache_path or get_discovery_cache_path()
+
+    def find(self, cwd: Path, filenames: Sequence[str]) -> Path | None:
+        entries = self._load()
+
+        if (entry := entries.get(cwd)) is not None and entry.is_valid():
+            return entry.config_filepath
+
+        entry = _discover(cwd, filenames)
+
+        entries.pop(cwd, None)
+        entries[cwd] = entry
+        while len(entries) > MAX_ENTRIES:
+            del entries[next(iter(entries))]
+
+        self._dump(entries)
+
+        return entry.config_filepath
+
+    def clear(self) -> int:
+        count = len(self._load())
+
+        self._entries = None
+        try:
+            self.cache_path.unlink(missing_ok=True)
+
+        except OSError as e:
+            logger.debug(f"Failed to remove discovery cache: {e}")
+
+        return count
+
+    def _load(self) -> dict[Path, DiscoveryEntry]:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if not self.persist:
+            return self._entries
+
+        try:
+            with open(self.cache_path, "rb") as f:
+                self._entries = {
+                    Path(cwd): DiscoveryEntry.model_validate(entry)
+                    for cwd, entry in json.load(f).items()
+                }
+
+        except FileNotFoundError:
+            pass
+
+        except OSError as e:
+            logger.debug(f"Failed to read discovery cache: {e}")
+
+        except (ValueError, AttributeError, ValidationError) as e:
+            logger.debug(f"Discard broken discovery cache: {e}")
+
+        return self._entries
+
+    def _dump(self, entries: dict[Path, DiscoveryEntry]) -> None:
+        if not self.persist:
+            return
+
+        try:
+            write_private_file(
+                self.cache_path,
+                json.dumps(
+                    {
+                        os.fspath(cwd): entry.model_dump(mode="json")
+                        for cwd, entry in entries.items()
+                    }
+                ).encode("UTF-8"),
+            )
+
+        except OSError as e:
+            logger.debug(f"Failed to write discovery cache: {e}")
+
+
+def _discover(cwd: Path, filenames: Sequence[str]) -> DiscoveryEntry:
+    directory_mtimes: dict[Path, int] = {}
+
+    for directory in (cwd, *cwd.parents):
+        try:
+            directory_mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as it:
+                names = {entry.name for entry in it if entry.is_file()}
+
+        except OSError:
+            continue
+
+        for filename in filenames:
+            if filename in names:
+                return DiscoveryEntry(
+                    config_filepath=directory / filename,
+                    directory_mtimes=directory_mtimes,
+                )
+
+    return DiscoveryEntry(config_filepath=None, directory_mtimes=directory_mtimes)
+
+
+discovery_cache = DiscoveryCache()
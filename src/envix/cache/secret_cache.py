@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import time
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel, SecretStr, ValidationError
+
+from envix.cache._common import write_private_file
+from envix.envname import ENVIX_CACHE_KEY
+from envix.exception import EnvixCacheKeyError
+from envix.path import get_user_cache_dir
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+logger = getLogger(__name__)
+
+
+def get_secret_cache_dir(*, create: bool = True) -> Path:
+    return get_user_cache_dir(create=create).joinpath("secrets")
+
+
+class SecretCacheEntry(BaseModel):
+    name: str
+    value: SecretStr
+    version: str | None = None
+    expires_at: float | None = None
+
+    def dump_json(self) -> bytes:
+        return json.dumps(
+            {**self.model_dump(), "value": self.value.get_secret_value()}
+        ).encode("UTF-8")
+
+    @property
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at < time.time()
+
+
+class SecretCacheStats(BaseModel):
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses, {self.revalidated} revalidated"
+
+
+class SecretCache:
+    """
+    Encrypted on-disk cache of secret values, keyed by the resolved secret name.
+
+    Entries are encrypted with Fernet. The key is read from the `ENVIX_CACHE_KEY`
+    environment variable, or generated once and stored next to the cache.
+
+    Entries are also kept in memory for the lifetime of the cache.
+    When `persist` is False, the cache is never written to disk.
+    When the cache directory cannot be used, the disk is skipped as a cache miss.
+    When `read_only` is True, the disk is only read: neither the directory,
+    the key nor the entries are created, and the cache misses when there is no key.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        *,
+        refresh: bool = False,
+        persist: bool = True,
+        read_only: bool = False,
+    ) -> None:
+        self._cache_dir = cache_dir
+        self.refresh = refresh
+        self.persist = persist
+        self.read_only = read_only
+        self.stats = SecretCacheStats()
+        self._fernet: Fernet | None = None
+        self._entries: dict[str, SecretCacheEntry] = {}
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or get_secret_cache_dir(create=not self.read_only)
+
+    @property
+    def fernet(self) -> "Fernet":
+        if self._fernet is None:
+            from cryptography.fernet import Fernet
+
+            try:
+                self._fernet = Fernet(self._load_key())
+            except ValueError as e:
+                raise EnvixCacheKeyError(ENVIX_CACHE_KEY) from e
+
+        return self._fernet
+
+    def get(self, name: str) -> SecretCacheEntry | None:
+        """
+        Get the cached entry. Expired entries are also returned for revalidation.
+        """
+
+        from cryptography.fernet import InvalidToken
+
+        if self.refresh:
+            return None
+
+        if name in self._entries:
+            return self._entries[name]
+
+        if not self.persist:
+            return None
+
+        try:
+            filepath = self._entry_path(name)
+            token = filepath.read_bytes()
+
+        except FileNotFoundError:
+            return None
+
+        except OSError as e:
+            logger.debug(f"Failed to read secret cache: {name}, {e}")
+            return None
+
+        try:
+            entry = SecretCacheEntry.model_validate_json(self.fernet.decrypt(token))
+
+        except OSError as e:
+            logger.debug(f"Failed to read secret cache key: {e}")
+            return None
+
+        except (InvalidToken, ValidationError):
+            logger.debug(f"Discard broken secret cache: {name}")
+            if not self.read_only:
+                filepath.unlink(missing_ok=True)
+            return None
+
+        if entry.name != name:
+            return None
+
+        self._entries[name] = entry
+
+        return entry
+
+    def set(
+        self,
+        name: str,
+        secret: SecretStr,
+        *,
+        ttl: int | None,
+        version: str | None = None,
+    ) -> SecretCacheEntry:
+        """
+        Cache the secret. The entry never expires when `ttl` is None.
+        """
+
+        entry = SecretCacheEntry(
+            name=name,
+            value=secret,
+            version=version,
+            expires_at=None if ttl is None else time.time() + ttl,
+        )
+
+        self._entries[name] = entry
+
+        if self.persist and not self.read_only:
+            try:
+                write_private_file(
+                    self._entry_path(name),
+                    self.fernet.encrypt(entry.dump_json()),
+                )
+
+            except OSError as e:
+                logger.debug(f"Failed to write secret cache: {name}, {e}")
+
+        return entry
+
+    def discard(self, name: str) -> None:
+        self._entries.pop(name, None)
+
+        if self.persist and not self.read_only:
+            try:
+                self._entry_path(name).unlink(missing_ok=True)
+
+            except OSError as e:
+                logger.debug(f"Failed to discard secret cache: {name}, {e}")
+
+    def clear(self) -> int:
+        self._entries.clear()
+
+        count = 0
+        if self.cache_dir.exists():
+            for filepath in self.cache_dir.glob("*.entry"):
+                filepath.unlink(missing_ok=True)
+                count += 1
+
+        return count
+
+    def _entry_path(self, name: str) -> Path:
+        digest = hashlib.sha256(name.encode("UTF-8")).hexdigest()
+
+        return self.cache_dir.joinpath(f"{digest}.entry")
+
+    def _load_key(self) -> bytes:
+        from cryptography.fernet import Fernet
+
+        if key := os.getenv(ENVIX_CACHE_KEY):
+            return key.encode("UTF-8")
+
+        key_path = self.cache_dir.joinpath("cache.key")
+        if key_path.exists() or self.read_only:
+            return key_path.read_bytes()
+
+        key = Fernet.generate_key()
+        write_private_file(key_path, key)
+
+        return key
@@ -1,15 +1,18 @@
 import logging
 import sys
-from argparse import ArgumentParser, BooleanOptionalAction
-from typing import NoReturn
-
-from rich.console import Console as RichConsole
-from rich.logging import RichHandler
-from rich_argparse import ArgumentDefaultsRichHelpFormatter
-
-import envix
-
-from .commands import config, export, inject
+from argparse import (
+    Action,
+    ArgumentParser,
+    BooleanOptionalAction,
+    HelpFormatter,
+    Namespace,
+    _VersionAction,
+)
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, NoReturn
+
+from .parsers import agent, config, export, inject, plan
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,82 @@ class EnvixArgumentParser(ArgumentParser):
         self.print_usage(sys.stderr)
         raise RuntimeError(message)
 
+    def add_argument(self, *args: Any, **kwargs: Any) -> Action:
+        # argparse formats every argument to validate its metavar.
+        with self._plain_formatter():
+            return super().add_argument(*args, **kwargs)
+
+    def add_subparsers(self, **kwargs: Any) -> Any:
+        # argparse formats the usage to build the prog of the subcommands.
+        with self._plain_formatter():
+            return super().add_subparsers(**kwargs)
+
+    @contextmanager
+    def _plain_formatter(self) -> Iterator[None]:
+        """
+        Use the plain formatter while building the parser,
+        so that rich is imported only when the help is actually printed.
+        """
+
+        formatter_class = self.formatter_class
+        self.formatter_class = HelpFormatter
+        try:
+            yield
+
+        finally:
+            self.formatter_class = formatter_class
+
+
+def rich_help_formatter(prog: str, *args: Any, **kwargs: Any) -> HelpFormatter:
+    from rich_argparse import ArgumentDefaultsRichHelpFormatter
+
+    ArgumentDefaultsRichHelpFormatter.styles["argparse.default"] = "dark_orange"
+
+    return ArgumentDefaultsRichHelpFormatter(prog, *args, **kwargs)
+
+
+class VersionAction(_VersionAction):
+    def __call__(
+        self,
+        parser: ArgumentParser,
+        namespace: Namespace,
+        values: str | Sequence[Any] | None,
+        option_string: str | None = None,
+    ) -> None:
+        import envix
+
+        self.version = f"[argparse.prog]%(prog)s[/] {envix.__version__}"
+
+        super().__call__(parser, namespace, values, option_string)
+
+
+class LazyRichHandler(logging.Handler):
+    """
+    Log handler which creates the rich handler on the first record,
+    since importing rich takes a large part of the startup time.
+    """
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self._handler: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            from rich.console import Console as RichConsole
+            from rich.logging import RichHandler
+
+            self._handler = RichHandler(
+                level=self.level,
+                console=RichConsole(stderr=True),
+                show_time=False,
+                show_path=False,
+                rich_tracebacks=True,
+                markup=True,
+            )
+            self._handler.setFormatter(self.formatter)
+
+        self._handler.emit(record)
+
 
 class App:
     @classmethod
@@ -29,32 +108,19 @@ class App:
             logging.basicConfig(
                 format="%(message)s",
                 level=logging.INFO,
-                handlers=[
-                    RichHandler(
-                        level=logging.DEBUG,
-                        console=RichConsole(stderr=True),
-                        show_time=False,
-                        show_path=False,
-                        rich_tracebacks=True,
-                        markup=True,
-                    )
-                ],
+                handlers=[LazyRichHandler(level=logging.DEBUG)],
             )
             logging.root.setLevel(logging.DEBUG if verbose else logging.INFO)
 
-            formatter_class = ArgumentDefaultsRichHelpFormatter
-            formatter_class.styles["argparse.default"] = "dark_orange"
-
             parser = EnvixArgumentParser(
                 prog="envix",
                 description="A tool to retrieve environment variables from the Secret Manager and execute commands.",
-                formatter_class=formatter_class,
+                formatter_class=rich_help_formatter,
             )
 
             parser.add_argument(
                 "--version",
-                action="version",
-                version=f"[argparse.prog]%(prog)s[/] {envix.__version__}",
+                action=VersionAction,
             )
 
             parser.add_argument(
@@ -70,6 +136,8 @@ class App:
 
             inject.add_subparser(subparser, formatter_class=parser.formatter_class)
             export.add_subparser(subparser, formatter_class=parser.formatter_class)
+            plan.add_subparser(subparser, formatter_class=parser.formatter_class)
+            agent.add_subparser(subparser, formatter_class=parser.formatter_class)
             config.add_subparser(subparser, formatter_class=parser.formatter_class)
 
             parser.set_defaults(handler=lambda _: parser.print_help())
@@ -0,0 +1,22 @@
+from typing import Literal
+
+# The choices are kept apart from the commands,
+# so that the parser is built without importing pydantic.
+
+OutputFormat = Literal[
+    "dotenv",
+    "json",
+    "ndjson",
+]
+
+# The snapshot is a binary format, which is not written by the streaming writers.
+ExportFormat = Literal[OutputFormat, "snapshot"]
+
+PlanFormat = Literal["text", "json"]
+
+# How a command supervised by envix takes the rotated secrets.
+RotationAction = Literal[
+    "restart",
+    "signal",
+    "rewrite",
+]
@@ -0,0 +1,33 @@
+from pathlib import Path
+from typing import Annotated
+
+from pydantic import BaseModel, Field
+
+
+class Args(BaseModel):
+    socket: Path | None
+    ttl: Annotated[int, Field(ge=0)]
+    no_cache: bool
+    gcp_endpoint: str | None
+
+
+def agent_command(args: Args) -> None:
+    import asyncio
+
+    from envix.agent.server import AgentServer
+    from envix.config.v1.secret_cache_v1 import SecretCacheV1
+    from envix.loader.session import LoaderSession
+    from envix.path import get_agent_socket_path
+
+    async def serve() -> None:
+        session = LoaderSession(
+            use_cache=not args.no_cache,
+            persist_cache=False,
+            default_cache=SecretCacheV1(ttl=args.ttl),
+            google_cloud_secret_manager_endpoint=args.gcp_endpoint,
+        )
+        await AgentServer(
+            args.socket or get_agent_socket_path(), session
+        ).serve_forever()
+
+    asyncio.run(serve())
@@ -0,0 +1,17 @@
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+
+def clear_secret_cache() -> None:
+    from envix.cache.config_cache import config_cache
+    from envix.cache.discovery_cache import discovery_cache
+    from envix.cache.secret_cache import SecretCache
+
+    secret_count = SecretCache().clear()
+    config_count = config_cache.clear()
+    discovery_cache.clear()
+
+    logger.info(
+        f"Removed {secret_count} cached secrets and {config_count} cached configs."
+    )
@@ -1,7 +1,5 @@
 import os
-from argparse import ArgumentParser, _SubParsersAction
 from logging import getLogger
-from typing import Any, cast
 
 from pydantic import BaseModel
 
@@ -14,29 +12,6 @@ class Args(BaseModel):
     config_name: str
 
 
-def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
-    help = "Edit all available configurations."
-
-    parser = cast(
-        ArgumentParser,
-        subparsers.add_parser(
-            "edit",
-            description=help,
-            help=help,
-            **kwargs,
-        ),
-    )
-
-    parser.add_argument(
-        "config_name",
-        metavar="CONFIG_NAME",
-        help="user registered setting name.",
-        type=str,
-    )
-
-    parser.set_defaults(handler=lambda space: edit_user_config(Args(**vars(space))))
-
-
 def edit_user_config(args: Args) -> None:
     import subprocess
 
@@ -1,134 +1,327 @@
-import asyncio
-import json
-from argparse import ArgumentParser, FileType, _SubParsersAction
-from io import TextIOWrapper
+import os
+from logging import DEBUG, getLogger
 from pathlib import Path
-from shlex import quote
-from typing import Annotated, Any, Literal, assert_never, cast, get_args
+from typing import TYPE_CHECKING, Annotated
 
-from pydantic import BaseModel, ConfigDict, SecretStr
+from pydantic import BaseModel, Field, SecretStr
 
-from envix.cli.default import AUTO_SEARCH, STDOUT
-from envix.cli.field import ConfigFileValidator, OutputFileValidator
+from envix.cli.choices import ExportFormat
+from envix.cli.field import ConfigFileValidator
+from envix.cli.options import get_selection, use_agent
+from envix.envname import ENVIX_SNAPSHOT_KEY
+from envix.types import Secrets
 
-OutputFormat = Literal[
-    "dotenv",
-    "json",
-]
+if TYPE_CHECKING:
+    from envix.cli.dotenv_file import DotenvEntries
+    from envix.cli.writer import SecretsWriter
 
+logger = getLogger(__name__)
 
-class Args(BaseModel):
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
+class Args(BaseModel):
     config_file: Annotated[Path | None, ConfigFileValidator]
     config_name: list[str] | None
-    output_file: Annotated[TextIOWrapper | None, OutputFileValidator]
-    format: OutputFormat
+    only: list[str] | None
+    only_prefix: list[str] | None
+    allowlist_file: Path | None
+    output_file: Path | None
+    format: ExportFormat
     dotenv: list[Path] | None
+    concurrency: Annotated[int, Field(ge=1)]
+    no_cache: bool
+    refresh: bool
+    gcp_endpoint: str | None
+    trace_file: Path | None
+    watch: bool
+    # Stored as an unsigned 32-bit integer in the snapshot header.
+    snapshot_ttl: Annotated[int, Field(ge=0, lt=2**32)]
+    encrypt: bool
 
 
-def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
-    help = "Output environment variables to a file."
+def export_command(args: Args) -> None:
+    import asyncio
 
-    parser = cast(
-        ArgumentParser,
-        subparsers.add_parser(
-            "export",
-            description=help,
-            help=help,
-            **kwargs,
-        ),
+    from envix.agent.client import request_secrets
+    from envix.cli.dotenv_file import read_dotenv
+    from envix.cli.writer import create_writer, open_output
+    from envix.exception import (
+        EnvixEnvInjectionError,
+        EnvixLoadEnvsError,
+        EnvixSnapshotError,
+        EnvixWatchOutputError,
     )
+    from envix.loader import load_secrets
+    from envix.loader.session import LoaderSession
+    from envix.path import collect_config_filepaths
+    from envix.trace import trace_command
 
-    parser.add_argument(
-        "--config-file",
-        "--file",
-        metavar="CONFIG_FILE",
-        help="config file path.",
-        type=Path,
-        default=AUTO_SEARCH,
-    )
+    if args.dotenv == []:
+        args.dotenv = [Path(".env")]
 
-    parser.add_argument(
-        "--config-name",
-        "--config",
-        metavar="CONFIG_NAME",
-        help="user registered setting name.",
-        type=str,
-        nargs="*",
-    )
+    if args.watch:
+        if args.output_file is None:
+            raise EnvixWatchOutputError()
 
-    parser.add_argument(
-        "--output-file",
-        "-o",
-        help="output file path.",
-        type=FileType("w"),
-        default=STDOUT,
-    )
+        if args.format == "snapshot":
+            raise EnvixSnapshotError("--watch does not support the snapshot format.")
 
-    parser.add_argument(
-        "--format",
-        help="output format.",
-        choices=get_args(OutputFormat),
-        default="dotenv",
-    )
+        asyncio.run(watch_export(args))
+        return
 
-    parser.add_argument(
-        "--dotenv",
-        metavar="DOTENV",
-        help="Path to the .env file.",
-        type=Path,
-        default=None,
-        nargs="*",
-    )
+    if args.format == "snapshot":
+        export_snapshot(args)
+        return
 
-    parser.set_defaults(handler=lambda space: export_command(Args(**vars(space))))
+    # Only the names are known before loading, since the values may refer to the secrets.
+    dotenv_entries = read_dotenv(args.dotenv)
+    dotenv_envnames = {envname for envname, _ in dotenv_entries}
 
+    selection = get_selection(args)
 
-def export_command(args: Args) -> None:
-    from dotenv.main import DotEnv
+    with trace_command(args.trace_file):
+        config_filepaths = collect_config_filepaths(args.config_file, args.config_name)
 
-    from envix.config.config import collect_config_filepaths
-    from envix.exception import (
-        EnvixLoadEnvsError,
-    )
-    from envix.loader import load_secrets
+        assert args.format != "snapshot"
+        with (
+            open_output(args.output_file) as file,
+            create_writer(args.format, file) as writer,
+        ):
+            # The secrets which the .env files may override are written at the end.
+            overridden: Secrets = {}
 
-    secrets, errors = asyncio.run(
-        load_secrets(collect_config_filepaths(args.config_file, args.config_name))
-    )
+            def write_secret(envname: str, secret: SecretStr) -> None:
+                if envname in dotenv_envnames:
+                    overridden[envname] = secret
+                else:
+                    writer.write(envname, secret)
 
-    if args.dotenv == []:
-        args.dotenv = [Path(".env")]
+            async def load(
+                config_filepaths: list[Path],
+            ) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+                async with LoaderSession(
+                    use_cache=not args.no_cache,
+                    refresh_cache=args.refresh,
+                    google_cloud_secret_manager_endpoint=args.gcp_endpoint,
+                ) as session:
+                    return await load_secrets(
+                        config_filepaths,
+                        concurrency=args.concurrency,
+                        session=session,
+                        on_secret=write_secret,
+                        selection=selection,
+                    )
 
-    for dotenv in args.dotenv or []:
-        for key, value in DotEnv(dotenv, override=True).dict().items():
-            if value:
-                secrets[key] = SecretStr(value)
-
-    if errors:
-        raise EnvixLoadEnvsError(errors)
-
-    match args.format:
-        case "dotenv":
-            print(
-                "\n".join(
-                    f"{envname}={quote(secret.get_secret_value())}"
-                    for envname, secret in secrets.items()
-                ),
-                file=args.output_file,
+            resolved = (
+                request_secrets(
+                    config_filepaths,
+                    concurrency=args.concurrency,
+                    environ=dict(os.environ),
+                )
+                if use_agent(args, selection)
+                else None
             )
+            if resolved is not None:
+                secrets, errors = resolved
+                for envname, secret in secrets.items():
+                    write_secret(envname, secret)
+
+            else:
+                secrets, errors = asyncio.run(load(config_filepaths))
+
+            _write_dotenv(writer, dotenv_entries, secrets, overridden)
+
+            # Raised within the writer, so that the output file is not replaced.
+            if errors:
+                raise EnvixLoadEnvsError(errors)
 
-        case "json":
-            print(
-                json.dumps(
-                    {
-                        envname: secret.get_secret_value()
-                        for envname, secret in secrets.items()
-                    }
-                ),
-                file=args.output_file,
+
+def export_snapshot(args: Args) -> None:
+    """
+    Write the resolved secrets as a snapshot, which `envix inject --from-snapshot` replays.
+
+    The hashes of every config in the include graph are recorded,
+    so that the snapshot is known to be stale when any of them changes.
+    """
+
+    import asyncio
+    import sys
+
+    from envix.cache._common import write_private_file
+    from envix.cli.dotenv_file import load_dotenv
+    from envix.exception import EnvixLoadEnvsError, EnvixSnapshotError
+    from envix.loader.planner import SecretsPlan, execute_plan, plan_secrets
+    from envix.loader.session import LoaderSession
+    from envix.path import collect_config_filepaths
+    from envix.snapshot import create_snapshot, get_snapshot_key
+    from envix.trace import trace_command
+
+    key = get_snapshot_key() if args.encrypt else None
+    if args.encrypt and key is None:
+        raise EnvixSnapshotError(f"--encrypt requires the key of {ENVIX_SNAPSHOT_KEY}.")
+
+    async def load(plan: SecretsPlan) -> Secrets:
+        async with LoaderSession(
+            use_cache=not args.no_cache,
+            refresh_cache=args.refresh,
+            google_cloud_secret_manager_endpoint=args.gcp_endpoint,
+        ) as session:
+            secrets, errors = await execute_plan(
+                plan, concurrency=args.concurrency, session=session
             )
 
-        case _:
-            assert_never(args.format)
+        if errors:
+            raise EnvixLoadEnvsError(errors)
+
+        return secrets
+
+    with trace_command(args.trace_file):
+        plan = plan_secrets(
+            collect_config_filepaths(args.config_file, args.config_name),
+            selection=get_selection(args),
+        )
+        secrets = asyncio.run(load(plan))
+
+    secrets.update(_get_dotenv_secrets(load_dotenv(args.dotenv, _get_environ(secrets))))
+    content = create_snapshot(
+        secrets, plan.config_filepaths, ttl=args.snapshot_ttl
+    ).dump(key)
+
+    if args.output_file is None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(content)
+        sys.stdout.buffer.flush()
+
+    else:
+        # The values may not be encrypted.
+        write_private_file(args.output_file, content)
+
+
+async def watch_export(args: Args) -> None:
+    """
+    Rewrite the output file whenever a config file in the include graph changes.
+
+    The whole graph is planned again on every change, which is cheap with the config cache,
+    but only the Secret Manager blocks of the changed files are resolved again.
+    The output file is replaced atomically, and kept as it is when the loading fails.
+    """
+
+    from envix.cli.dotenv_file import read_dotenv
+    from envix.cli.writer import create_writer, open_atomic
+    from envix.exception import EnvixLoadEnvsError
+    from envix.loader.planner import SecretsPlan, execute_plan, plan_secrets
+    from envix.loader.session import LoaderSession
+    from envix.path import collect_config_filepaths
+    from envix.watch import FileWatcher
+
+    assert args.output_file is not None and args.format != "snapshot"
+    output_filepath = args.output_file
+    output_format = args.format
+    selection = get_selection(args)
+
+    async def export(session: LoaderSession, plan: SecretsPlan) -> None:
+        dotenv_entries = read_dotenv(args.dotenv)
+        dotenv_envnames = {envname for envname, _ in dotenv_entries}
+
+        with (
+            open_atomic(output_filepath) as file,
+            create_writer(output_format, file) as writer,
+        ):
+            overridden: Secrets = {}
+
+            def write_secret(envname: str, secret: SecretStr) -> None:
+                if envname in dotenv_envnames:
+                    overridden[envname] = secret
+                else:
+                    writer.write(envname, secret)
+
+            secrets, errors = await execute_plan(
+                plan,
+                concurrency=args.concurrency,
+                session=session,
+                on_secret=write_secret,
+            )
+            if errors:
+                raise EnvixLoadEnvsError(errors)
+
+            _write_dotenv(writer, dotenv_entries, secrets, overridden)
+
+    async with LoaderSession(
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh,
+        google_cloud_secret_manager_endpoint=args.gcp_endpoint,
+        memoize=True,
+    ) as session:
+        watcher = FileWatcher()
+        try:
+            while True:
+                config_filepaths = collect_config_filepaths(
+                    args.config_file, args.config_name
+                )
+                # The root files are watched even if they fail to be planned.
+                watched = [*config_filepaths, *(args.dotenv or [])]
+                watcher.update(watched)
+
+                try:
+                    plan = plan_secrets(config_filepaths, selection=selection)
+                    watcher.update([*watched, *plan.config_filepaths])
+                    await export(session, plan)
+                    logger.info(f"Exported: {output_filepath}")
+
+                except Exception as e:
+                    # The output is exported again on the next change,
+                    # and the traceback is shown with --verbose as the app does.
+                    logger.error(e, exc_info=logger.isEnabledFor(DEBUG))
+
+                changed = await watcher.wait()
+                logger.info(
+                    "Changed: "
+                    + ", ".join(str(filepath) for filepath in sorted(changed))
+                )
+                session.invalidate(changed)
+
+        finally:
+            watcher.close()
+
+
+def _write_dotenv(
+    writer: "SecretsWriter",
+    dotenv_entries: "DotenvEntries",
+    secrets: Secrets,
+    overridden: Secrets,
+) -> None:
+    """
+    Write the values of the .env files after the config,
+    with the secrets of the config they leave empty.
+    """
+
+    from envix.cli.dotenv_file import interpolate_dotenv
+
+    dotenv_secrets = _get_dotenv_secrets(
+        interpolate_dotenv(dotenv_entries, _get_environ(secrets))
+    )
+    for envname, secret in overridden.items():
+        if envname not in dotenv_secrets:
+            writer.write(envname, secret)
+
+    for envname, secret in dotenv_secrets.items():
+        writer.write(envname, secret)
+
+
+def _get_environ(secrets: Secrets) -> dict[str, str]:
+    """
+    The environment which `${NAME}` of the .env files is interpolated with.
+    """
+
+    return {
+        **os.environ,
+        **{envname: secret.get_secret_value() for envname, secret in secrets.items()},
+    }
+
+
+def _get_dotenv_secrets(values: dict[str, str]) -> Secrets:
+    """
+    Values of the .env files, which take precedence over the config.
+    Empty values are left out, so that they do not hide the config.
+    """
+
+    return {envname: SecretStr(value) for envname, value in values.items() if value}
@@ -1,11 +1,20 @@
 import os
-from argparse import ArgumentParser, _SubParsersAction
+from logging import getLogger
 from pathlib import Path
-from typing import Annotated, Any, cast
+from typing import TYPE_CHECKING, Annotated
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from envix.cli.choices import RotationAction
 from envix.cli.field import ConfigFileValidator
+from envix.cli.options import get_selection, use_agent
+from envix.exception import EnvixEnvInjectionError
+from envix.types import Secrets
+
+if TYPE_CHECKING:
+    from envix.loader.selection import EnvnameSelection
+
+logger = getLogger(__name__)
 
 
 class Args(BaseModel):
@@ -13,91 +22,230 @@ class Args(BaseModel):
     args: list[str]
     config_file: Annotated[Path | None, ConfigFileValidator]
     config_name: list[str] | None
+    only: list[str] | None
+    only_prefix: list[str] | None
+    allowlist_file: Path | None
     clear_environments: bool
     dotenv: list[Path] | None
+    concurrency: Annotated[int, Field(ge=1)]
+    no_cache: bool
+    refresh: bool
+    gcp_endpoint: str | None
+    trace_file: Path | None
+    exec: bool
+    rotation_interval: Annotated[int | None, Field(ge=1)]
+    on_rotation: RotationAction
+    rotation_signal: str
+    rotation_env_file: Path | None
+    from_snapshot: Path | None
 
 
-def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
-    help = "Inject environment variables and execute the command."
-
-    parser = cast(
-        ArgumentParser,
-        subparsers.add_parser(
-            "inject",
-            description=help,
-            help=help,
-            **kwargs,
-        ),
-    )
-
-    parser.add_argument(
-        "command",
-        metavar="COMMAND",
-    )
-
-    parser.add_argument("args", metavar="ARGS", nargs="*")
+def inject_command(args: Args) -> None:
+    import sys
 
-    parser.add_argument(
-        "--config-file",
-        "--file",
-        metavar="CONFIG_FILE",
-        help="config file path.",
-        type=Path,
-        default=None,
-    )
+    from envix.cli.dotenv_file import load_dotenv
+    from envix.exception import EnvixLoadEnvsError
+    from envix.path import collect_config_filepaths
+    from envix.process import can_exec, exec_command, run_command
+    from envix.trace import trace_command
 
-    parser.add_argument(
-        "--config-name",
-        "--config",
-        metavar="CONFIG_NAME",
-        help="user registered setting name.",
-        type=str,
-        nargs="*",
-    )
+    environ = {} if args.clear_environments else dict(os.environ)
 
-    parser.add_argument(
-        "--clear-environments",
-        action="store_true",
-        help="Running commands with no environment variables set.",
-        default=False,
-    )
+    if args.dotenv == []:
+        args.dotenv = [Path(".env")]
 
-    parser.add_argument(
-        "--dotenv",
-        metavar="DOTENV",
-        help="Path to the .env file.",
-        type=Path,
-        default=None,
-        nargs="*",
+    command = [args.command] + args.args
+
+    if args.rotation_interval is not None:
+        import asyncio
+
+        sys.exit(asyncio.run(supervise_command(args, command, environ)))
+
+    selection = get_selection(args)
+
+    def resolve(
+        config_filepaths: list[Path],
+    ) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+        import asyncio
+
+        from envix.agent.client import request_secrets
+        from envix.loader import load_secrets
+        from envix.loader.session import LoaderSession
+
+        async def load() -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+            async with LoaderSession(
+                use_cache=not args.no_cache,
+                refresh_cache=args.refresh,
+                google_cloud_secret_manager_endpoint=args.gcp_endpoint,
+            ) as session:
+                return await load_secrets(
+                    config_filepaths,
+                    concurrency=args.concurrency,
+                    session=session,
+                    environ=environ,
+                    selection=selection,
+                )
+
+        return (
+            request_secrets(
+                config_filepaths,
+                concurrency=args.concurrency,
+                environ=environ,
+            )
+            if use_agent(args, selection)
+            else None
+        ) or asyncio.run(load())
+
+    with trace_command(args.trace_file):
+        resolved = (
+            _load_snapshot(args.from_snapshot, selection)
+            if args.from_snapshot is not None
+            else None
+        )
+
+        if resolved is None:
+            config_filepaths = collect_config_filepaths(
+                args.config_file, args.config_name
+            )
+
+            # Without any config, nothing is resolved and the loaders are not imported.
+            resolved = resolve(config_filepaths) if config_filepaths else ({}, [])
+
+        secrets, errors = resolved
+
+    environ.update(
+        (envname, secret.get_secret_value()) for envname, secret in secrets.items()
     )
+    environ.update(load_dotenv(args.dotenv, environ))
 
-    parser.set_defaults(handler=lambda space: inject_command(Args(**vars(space))))
+    if errors:
+        raise EnvixLoadEnvsError(errors)
 
+    if args.exec and can_exec():
+        exec_command(command, environ)
 
-def inject_command(args: Args) -> None:
-    import asyncio
-    import subprocess
+    if returncode := run_command(command, environ):
+        sys.exit(returncode)
 
-    from dotenv import load_dotenv
 
-    from envix.config.config import collect_config_filepaths
-    from envix.exception import EnvixLoadEnvsError
-    from envix.loader import load_secrets
+async def supervise_command(
+    args: Args, command: list[str], environ: dict[str, str]
+) -> int:
+    """
+    Run the command, and keep its secrets up to date with the rotation.
 
-    if args.clear_environments:
-        os.environ.clear()
+    The agent is bypassed, because the versions of the secrets are tracked on the session.
+    """
 
-    _, errors = asyncio.run(
-        load_secrets(collect_config_filepaths(args.config_file, args.config_name))
-    )
+    import signal
 
-    if args.dotenv == []:
-        args.dotenv = [Path(".env")]
-
-    for dotenv in args.dotenv or []:
-        load_dotenv(dotenv, override=True)
-
-    if errors:
-        raise EnvixLoadEnvsError(errors)
+    from pydantic import SecretStr
 
-    subprocess.call([args.command] + args.args)
+    from envix.cli.dotenv_file import load_dotenv
+    from envix.cli.rotation import RotationSupervisor
+    from envix.exception import EnvixLoadEnvsError, EnvixRotationError
+    from envix.loader import load_secrets
+    from envix.loader.session import LoaderSession
+    from envix.path import collect_config_filepaths
+
+    assert args.rotation_interval is not None
+
+    try:
+        rotation_signal = signal.Signals[args.rotation_signal.upper()]
+    except KeyError:
+        raise EnvixRotationError(f"Unknown signal: {args.rotation_signal}")
+
+    if args.on_rotation == "rewrite" and args.rotation_env_file is None:
+        raise EnvixRotationError("--on-rotation rewrite requires --rotation-env-file.")
+
+    # envix keeps running to supervise the command, and resolves the config on every check.
+    for option, given in [
+        ("--exec", args.exec),
+        ("--from-snapshot", args.from_snapshot is not None),
+        ("--trace-file", args.trace_file is not None),
+    ]:
+        if given:
+            raise EnvixRotationError(f"--rotation-interval does not support {option}.")
+
+    config_filepaths = collect_config_filepaths(args.config_file, args.config_name)
+    selection = get_selection(args)
+
+    async with LoaderSession(
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh,
+        google_cloud_secret_manager_endpoint=args.gcp_endpoint,
+    ) as session:
+
+        async def load() -> Secrets:
+            secrets, errors = await load_secrets(
+                config_filepaths,
+                concurrency=args.concurrency,
+                session=session,
+                environ=environ,
+                selection=selection,
+            )
+            if errors:
+                raise EnvixLoadEnvsError(errors)
+
+            secrets.update(
+                (key, SecretStr(value))
+                for key, value in load_dotenv(
+                    args.dotenv,
+                    {
+                        **environ,
+                        **{
+                            envname: secret.get_secret_value()
+                            for envname, secret in secrets.items()
+                        },
+                    },
+                ).items()
+            )
+
+            return secrets
+
+        supervisor = RotationSupervisor(
+            command,
+            environ,
+            load=load,
+            session=session,
+            interval=args.rotation_interval,
+            action=args.on_rotation,
+            rotation_signal=rotation_signal,
+            env_file=args.rotation_env_file,
+        )
+
+        return await supervisor.run()
+
+
+def _load_snapshot(
+    snapshot_filepath: Path, selection: "EnvnameSelection | None"
+) -> tuple[Secrets, list[EnvixEnvInjectionError]] | None:
+    """
+    Secrets of the snapshot, or None when it is stale and the config should be resolved.
+
+    Only the selected envs are injected, as when the config is resolved.
+    """
+
+    from envix.exception import EnvixSnapshotError
+    from envix.snapshot import Snapshot, get_snapshot_key
+    from envix.trace import span
+
+    with span("load", "snapshot", path=str(snapshot_filepath)):
+        try:
+            content = snapshot_filepath.read_bytes()
+        except OSError as e:
+            raise EnvixSnapshotError(
+                f"Failed to read the snapshot: {snapshot_filepath}, {e}"
+            )
+
+        snapshot = Snapshot.load(content, get_snapshot_key())
+
+    if not snapshot.is_fresh():
+        logger.info(f"Snapshot is stale, resolving the config: {snapshot_filepath}")
+        return None
+
+    return {
+        envname: secret
+        for envname, secret in snapshot.secrets.items()
+        if selection is None or envname in selection
+    }, []
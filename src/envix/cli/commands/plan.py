@@ -0,0 +1,94 @@
+import os
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+from pydantic import BaseModel
+
+from envix.cli.choices import PlanFormat
+from envix.cli.field import ConfigFileValidator
+from envix.cli.options import get_selection
+
+if TYPE_CHECKING:
+    from envix.loader.report import PlanReport
+
+logger = getLogger(__name__)
+
+
+class Args(BaseModel):
+    config_file: Annotated[Path | None, ConfigFileValidator]
+    config_name: list[str] | None
+    only: list[str] | None
+    only_prefix: list[str] | None
+    allowlist_file: Path | None
+    format: PlanFormat
+    clear_environments: bool
+    no_cache: bool
+
+
+def plan_command(args: Args) -> None:
+    import sys
+
+    from envix.cache.secret_cache import SecretCache
+    from envix.loader import plan_secrets
+    from envix.loader.report import report_plan
+    from envix.path import collect_config_filepaths
+
+    config_filepaths = collect_config_filepaths(args.config_file, args.config_name)
+
+    report = report_plan(
+        plan_secrets(config_filepaths, selection=get_selection(args)),
+        environ={} if args.clear_environments else os.environ,
+        # Planning never creates the cache directory nor its key.
+        secret_cache=None if args.no_cache else SecretCache(read_only=True),
+    )
+
+    match args.format:
+        case "text":
+            print(format_report(report), end="")
+
+        case "json":
+            print(report.model_dump_json(indent=2))
+
+    if report.errors:
+        sys.exit(1)
+
+
+def format_report(report: "PlanReport") -> str:
+    lines: list[str] = []
+    config_filepath: Path | None = None
+
+    for envs in report.envs:
+        if envs.config_filepath != config_filepath:
+            config_filepath = envs.config_filepath
+            lines.append(os.fspath(config_filepath))
+
+        summary = f"{len(envs.envnames)} envs"
+        if envs.remote_secrets:
+            summary += (
+                f", {len(envs.remote_secrets)} remote secrets"
+                f", {len(envs.cache_hits)} cache hits"
+                f", {envs.remote_calls} remote calls"
+            )
+        lines.append(f"  {envs.type}: {summary}")
+
+        if envs.shadows:
+            lines.append(
+                "    shadows: "
+                + ", ".join(
+                    f"{envname} ({source})" for envname, source in envs.shadows.items()
+                )
+            )
+
+        if envs.skips:
+            lines.append("    skips: " + ", ".join(envs.skips))
+
+    lines.extend(f"error: {error}" for error in report.errors)
+    lines.append(
+        f"Total: {len(report.envs)} envs blocks"
+        f", {report.remote_secrets} remote secrets"
+        f", {report.cache_hits} cache hits"
+        f", {report.remote_calls} remote calls"
+    )
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from envix.types import Environ
+
+DotenvEntries = list[tuple[str, str]]
+
+
+def read_dotenv(dotenv_filepaths: list[Path] | None) -> DotenvEntries:
+    """
+    Entries of the .env files in order, before `${NAME}` is interpolated.
+
+    They are read apart from the interpolation, so that the env names are known
+    before the secrets they refer to are resolved.
+    """
+
+    from dotenv.main import DotEnv
+
+    return [
+        (key, value)
+        for dotenv in dotenv_filepaths or []
+        for key, value in DotEnv(dotenv, interpolate=False).dict().items()
+        if value is not None
+    ]
+
+
+def interpolate_dotenv(entries: DotenvEntries, environ: Environ) -> dict[str, str]:
+    """
+    Values of the .env entries, which take precedence over the environment.
+
+    `${NAME}` is interpolated with the environment given, which has the resolved secrets,
+    and with the values of the entries read before, as `load_dotenv` does on os.environ.
+    """
+
+    from dotenv.variables import parse_variables
+
+    values: dict[str, str] = {}
+    variables = dict(environ)
+    for key, value in entries:
+        values[key] = variables[key] = "".join(
+            atom.resolve(variables) for atom in parse_variables(value)
+        )
+
+    return values
+
+
+def load_dotenv(
+    dotenv_filepaths: list[Path] | None, environ: Environ
+) -> dict[str, str]:
+    return interpolate_dotenv(read_dotenv(dotenv_filepaths), environ)
@@ -0,0 +1,79 @@
+import os
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import TYPE_CHECKING, Protocol
+
+from envix.envname import ENVIX_GCP_ENDPOINT
+
+if TYPE_CHECKING:
+    from envix.loader.selection import EnvnameSelection
+
+# The options shared by the commands.
+# They are kept apart from `envix.cli.field`, so that the parser is built without importing pydantic.
+
+
+class SelectionArgs(Protocol):
+    only: list[str] | None
+    only_prefix: list[str] | None
+    allowlist_file: Path | None
+
+
+class AgentArgs(Protocol):
+    no_cache: bool
+    refresh: bool
+    gcp_endpoint: str | None
+
+
+def add_selection_arguments(parser: ArgumentParser) -> None:
+    parser.add_argument(
+        "--only",
+        metavar="NAME,...",
+        help="Load only the env names. Other items are never fetched.",
+        type=str,
+        action="append",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--only-prefix",
+        metavar="PREFIX",
+        help="Load only the env names with the prefix.",
+        type=str,
+        action="append",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--allowlist-file",
+        metavar="ALLOWLIST_FILE",
+        help="Load only the env names listed in the file, one per line. Names ending with `*` are prefixes.",
+        type=Path,
+        default=None,
+    )
+
+
+def get_selection(args: SelectionArgs) -> "EnvnameSelection | None":
+    # Checked before the import, which loads the whole loader package.
+    if args.only is None and args.only_prefix is None and args.allowlist_file is None:
+        return None
+
+    from envix.loader.selection import EnvnameSelection
+
+    return EnvnameSelection.create(
+        only=args.only,
+        only_prefix=args.only_prefix,
+        allowlist_file=args.allowlist_file,
+    )
+
+
+def get_gcp_endpoint(args: AgentArgs) -> str | None:
+    return args.gcp_endpoint or os.getenv(ENVIX_GCP_ENDPOINT)
+
+
+def use_agent(args: AgentArgs, selection: "EnvnameSelection | None") -> bool:
+    # The agent keeps its own cache and client, and resolves every env,
+    # so it is bypassed when the cache is not wanted, another endpoint is given
+    # or only some envs are selected.
+    return not (
+        args.no_cache or args.refresh or get_gcp_endpoint(args) or selection is not None
+    )
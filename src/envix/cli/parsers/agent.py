@@ -0,0 +1,56 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from pathlib import Path
+from typing import Any, cast
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Run the agent which serves resolved secrets to inject and export."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "agent",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.add_argument(
+        "--socket",
+        metavar="SOCKET",
+        help="Unix socket path. ENVIX_AGENT_SOCKET or the envix config directory by default.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--ttl",
+        metavar="SECONDS",
+        help="seconds to keep the latest secret versions in memory, for envs without cache settings.",
+        type=int,
+        default=60,
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not keep the secrets in memory.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--gcp-endpoint",
+        metavar="ENDPOINT",
+        help="Secret Manager endpoint, or `fake:FIXTURE` for the in-process fake. ENVIX_GCP_ENDPOINT by default.",
+        type=str,
+        default=None,
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(space: Namespace) -> None:
+    from envix.cli.commands.agent import Args, agent_command
+
+    agent_command(Args(**vars(space)))
@@ -1,15 +1,7 @@
 from argparse import ArgumentParser, _SubParsersAction
 from typing import Any, cast
 
-from pydantic import BaseModel
-
-from envix.cli.commands import config_edit
-
-from . import config_list, config_schema
-
-
-class Args(BaseModel):
-    commands: list[str]
+from . import config_cache, config_edit, config_list, config_schema
 
 
 def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
@@ -33,5 +25,6 @@ def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
     config_list.add_subparser(subparsers, formatter_class=parser.formatter_class)
     config_edit.add_subparser(subparsers, formatter_class=parser.formatter_class)
     config_schema.add_subparser(subparsers, formatter_class=parser.formatter_class)
+    config_cache.add_subparser(subparsers, formatter_class=parser.formatter_class)
 
     parser.set_defaults(handler=lambda _: parser.print_help())
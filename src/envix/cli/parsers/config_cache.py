@@ -0,0 +1,27 @@
+from argparse import ArgumentParser, _SubParsersAction
+from typing import Any, cast
+
+from . import config_cache_clear
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Operations related to the secret cache."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "cache",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    subparsers = parser.add_subparsers(
+        title="commands",
+        metavar="COMMAND",
+    )
+
+    config_cache_clear.add_subparser(subparsers, formatter_class=parser.formatter_class)
+
+    parser.set_defaults(handler=lambda _: parser.print_help())
@@ -0,0 +1,24 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from typing import Any, cast
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Remove all cached secrets and configs."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "clear",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(_: Namespace) -> None:
+    from envix.cli.commands.config_cache_clear import clear_secret_cache
+
+    clear_secret_cache()
@@ -0,0 +1,31 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from typing import Any, cast
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Edit all available configurations."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "edit",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.add_argument(
+        "config_name",
+        metavar="CONFIG_NAME",
+        help="user registered setting name.",
+        type=str,
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(space: Namespace) -> None:
+    from envix.cli.commands.config_edit import Args, edit_user_config
+
+    edit_user_config(Args(**vars(space)))
@@ -0,0 +1,24 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from typing import Any, cast
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "List all available configurations."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "list",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(_: Namespace) -> None:
+    from envix.cli.commands.config_list import list_user_config
+
+    list_user_config()
@@ -0,0 +1,33 @@
+from argparse import ArgumentParser, FileType, Namespace, _SubParsersAction
+from typing import Any, cast
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Outputs the JSON schema of the envix config file."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "schema",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.add_argument(
+        "--output-file",
+        "-o",
+        metavar="OUTPUT",
+        help="output file path.",
+        type=FileType("w"),
+        default=None,
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(space: Namespace) -> None:
+    from envix.cli.commands.config_schema import Args, config_schema_command
+
+    config_schema_command(Args(**vars(space)))
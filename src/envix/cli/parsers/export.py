@@ -0,0 +1,135 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from pathlib import Path
+from typing import Any, cast, get_args
+
+from envix.cli.choices import ExportFormat
+from envix.cli.default import AUTO_SEARCH
+from envix.cli.options import add_selection_arguments
+from envix.default import DEFAULT_CONCURRENCY
+from envix.envname import ENVIX_SNAPSHOT_KEY
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Output environment variables to a file."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "export",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.add_argument(
+        "--config-file",
+        "--file",
+        metavar="CONFIG_FILE",
+        help="config file path.",
+        type=Path,
+        default=AUTO_SEARCH,
+    )
+
+    parser.add_argument(
+        "--config-name",
+        "--config",
+        metavar="CONFIG_NAME",
+        help="user registered setting name.",
+        type=str,
+        nargs="*",
+    )
+
+    add_selection_arguments(parser)
+
+    parser.add_argument(
+        "--output-file",
+        "-o",
+        help="output file path. The file is replaced only when every env is loaded.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--format",
+        help="output format.",
+        choices=get_args(ExportFormat),
+        default="dotenv",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        metavar="N",
+        help="maximum number of envs blocks resolved concurrently.",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the secret cache.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached secrets and fetch them again.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--gcp-endpoint",
+        metavar="ENDPOINT",
+        help="Secret Manager endpoint, or `fake:FIXTURE` for the in-process fake. ENVIX_GCP_ENDPOINT by default.",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--trace-file",
+        metavar="TRACE_FILE",
+        help="Write the timing of each phase to the file in the Chrome trace format.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Rewrite the output file whenever a config file in the include graph changes.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--snapshot-ttl",
+        metavar="SECONDS",
+        help="seconds the snapshot stays fresh. It never expires when 0.",
+        type=int,
+        default=0,
+    )
+
+    parser.add_argument(
+        "--encrypt",
+        action="store_true",
+        help=f"Encrypt the snapshot with the key of {ENVIX_SNAPSHOT_KEY}.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--dotenv",
+        metavar="DOTENV",
+        help="Path to the .env file.",
+        type=Path,
+        default=None,
+        nargs="*",
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(space: Namespace) -> None:
+    from envix.cli.commands.export import Args, export_command
+
+    export_command(Args(**vars(space)))
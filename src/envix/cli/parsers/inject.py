@@ -0,0 +1,156 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from pathlib import Path
+from typing import Any, cast, get_args
+
+from envix.cli.choices import RotationAction
+from envix.cli.options import add_selection_arguments
+from envix.default import DEFAULT_CONCURRENCY
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Inject environment variables and execute the command."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "inject",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.add_argument(
+        "command",
+        metavar="COMMAND",
+    )
+
+    parser.add_argument("args", metavar="ARGS", nargs="*")
+
+    parser.add_argument(
+        "--config-file",
+        "--file",
+        metavar="CONFIG_FILE",
+        help="config file path.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--config-name",
+        "--config",
+        metavar="CONFIG_NAME",
+        help="user registered setting name.",
+        type=str,
+        nargs="*",
+    )
+
+    add_selection_arguments(parser)
+
+    parser.add_argument(
+        "--clear-environments",
+        action="store_true",
+        help="Running commands with no environment variables set.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        metavar="N",
+        help="maximum number of envs blocks resolved concurrently.",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the secret cache.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the cached secrets and fetch them again.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--exec",
+        action="store_true",
+        help="Replace the envix process with the command instead of running it as a child process.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--gcp-endpoint",
+        metavar="ENDPOINT",
+        help="Secret Manager endpoint, or `fake:FIXTURE` for the in-process fake. ENVIX_GCP_ENDPOINT by default.",
+        type=str,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--trace-file",
+        metavar="TRACE_FILE",
+        help="Write the timing of each phase to the file in the Chrome trace format.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--from-snapshot",
+        metavar="SNAPSHOT",
+        help="Inject the secrets of the snapshot written by `envix export --format snapshot`, while it is fresh.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--rotation-interval",
+        metavar="SECONDS",
+        help="Keep envix running, and check the latest secrets for rotation at the interval.",
+        type=int,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--on-rotation",
+        help="how the command takes the rotated secrets.",
+        choices=get_args(RotationAction),
+        default="restart",
+    )
+
+    parser.add_argument(
+        "--rotation-signal",
+        metavar="SIGNAL",
+        help="signal sent to the command on rotation with `--on-rotation signal`.",
+        type=str,
+        default="SIGHUP",
+    )
+
+    parser.add_argument(
+        "--rotation-env-file",
+        metavar="ENV_FILE",
+        help="Rewrite the secrets to the file on rotation.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--dotenv",
+        metavar="DOTENV",
+        help="Path to the .env file.",
+        type=Path,
+        default=None,
+        nargs="*",
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(space: Namespace) -> None:
+    from envix.cli.commands.inject import Args, inject_command
+
+    inject_command(Args(**vars(space)))
@@ -0,0 +1,69 @@
+from argparse import ArgumentParser, Namespace, _SubParsersAction
+from pathlib import Path
+from typing import Any, cast, get_args
+
+from envix.cli.choices import PlanFormat
+from envix.cli.options import add_selection_arguments
+
+
+def add_subparser(subparsers: "_SubParsersAction[Any]", **kwargs: Any) -> None:
+    help = "Show the envs blocks to resolve and the remote calls, without fetching any value."
+
+    parser = cast(
+        ArgumentParser,
+        subparsers.add_parser(
+            "plan",
+            description=help,
+            help=help,
+            **kwargs,
+        ),
+    )
+
+    parser.add_argument(
+        "--config-file",
+        "--file",
+        metavar="CONFIG_FILE",
+        help="config file path.",
+        type=Path,
+        default=None,
+    )
+
+    parser.add_argument(
+        "--config-name",
+        "--config",
+        metavar="CONFIG_NAME",
+        help="user registered setting name.",
+        type=str,
+        nargs="*",
+    )
+
+    add_selection_arguments(parser)
+
+    parser.add_argument(
+        "--format",
+        help="output format.",
+        choices=get_args(PlanFormat),
+        default="text",
+    )
+
+    parser.add_argument(
+        "--clear-environments",
+        action="store_true",
+        help="Plan as if no environment variables were set.",
+        default=False,
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not count the cached secrets as cache hits.",
+        default=False,
+    )
+
+    parser.set_defaults(handler=_handle)
+
+
+def _handle(space: Namespace) -> None:
+    from envix.cli.commands.plan import Args, plan_command
+
+    plan_command(Args(**vars(space)))
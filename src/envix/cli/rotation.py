@@ -0,0 +1,166 @@
+import asyncio
+import signal
+from collections.abc import Awaitable, Callable, Mapping
+from logging import DEBUG, getLogger
+from pathlib import Path
+from typing import Final, assert_never
+
+from envix.cli.choices import RotationAction
+from envix.cli.writer import DotenvWriter, open_atomic
+from envix.loader.session import LoaderSession
+from envix.process import FORWARDED_SIGNALS
+from envix.types import Secrets
+
+logger = getLogger(__name__)
+
+# Seconds to wait for the command to stop before it is killed on restart.
+DEFAULT_STOP_TIMEOUT: Final[float] = 10.0
+
+
+class RotationSupervisor:
+    """
+    Run the command, and apply the rotated secrets while it is running.
+
+    The latest secrets are checked by their version metadata every `interval` seconds,
+    in a single concurrent pass. When any of them has changed, the secrets are loaded again
+    and the command is restarted, signaled, or only the env file is rewritten.
+
+    `load` resolves the secrets with `session`, so that the versions are recorded on it.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        environ: Mapping[str, str],
+        *,
+        load: Callable[[], Awaitable[Secrets]],
+        session: LoaderSession,
+        interval: float,
+        action: RotationAction = "restart",
+        rotation_signal: signal.Signals = signal.SIGHUP,
+        env_file: Path | None = None,
+        stop_timeout: float = DEFAULT_STOP_TIMEOUT,
+    ) -> None:
+        self.command = command
+        self.environ = environ
+        self.load = load
+        self.session = session
+        self.interval = interval
+        self.action: RotationAction = action
+        self.rotation_signal = rotation_signal
+        self.env_file = env_file
+        self.stop_timeout = stop_timeout
+        self.rotation_count = 0
+        self._process: asyncio.subprocess.Process | None = None
+
+    async def run(self) -> int:
+        """
+        Run the command until it exits, and return its exit code.
+        """
+
+        secrets = await self.load()
+        self._write_env_file(secrets)
+        process = await self._start(secrets)
+
+        loop = asyncio.get_running_loop()
+        for signum in FORWARDED_SIGNALS:
+            loop.add_signal_handler(signum, self._forward, signum)
+        # The terminal already sends SIGINT to the whole process group.
+        loop.add_signal_handler(signal.SIGINT, lambda: None)
+
+        try:
+            while True:
+                wait = asyncio.ensure_future(process.wait())
+                done, _ = await asyncio.wait({wait}, timeout=self.interval)
+                if done:
+                    returncode = wait.result()
+                    return 128 - returncode if returncode < 0 else returncode
+
+                wait.cancel()
+                process = await self.check() or process
+
+        finally:
+            for signum in (*FORWARDED_SIGNALS, signal.SIGINT):
+                loop.remove_signal_handler(signum)
+
+    async def check(self) -> asyncio.subprocess.Process | None:
+        """
+        Apply the rotated secrets, and return the new process when it is restarted.
+        """
+
+        from envix.loader.v1_loader import check_google_cloud_secret_manager_versions
+
+        rotated = await check_google_cloud_secret_manager_versions(self.session)
+        if not rotated:
+            return None
+
+        logger.info(f"Secrets rotated: {', '.join(sorted(rotated))}")
+
+        if self.session.secret_cache is not None:
+            for secret_name in rotated:
+                self.session.secret_cache.discard(secret_name)
+
+        try:
+            secrets = await self.load()
+
+        except Exception as e:
+            # The command keeps running with the previous secrets.
+            logger.error(e, exc_info=logger.isEnabledFor(DEBUG))
+            return None
+
+        self.rotation_count += 1
+        self._write_env_file(secrets)
+
+        match self.action:
+            case "restart":
+                await self._stop()
+                return await self._start(secrets)
+
+            case "signal":
+                self._forward(self.rotation_signal)
+
+            case "rewrite":
+                pass
+
+            case _:
+                assert_never(self.action)
+
+        return None
+
+    async def _start(self, secrets: Secrets) -> asyncio.subprocess.Process:
+        environ = dict(self.environ)
+        environ.update(
+            (envname, secret.get_secret_value()) for envname, secret in secrets.items()
+        )
+
+        self._process = await asyncio.create_subprocess_exec(*self.command, env=environ)
+
+        return self._process
+
+    async def _stop(self) -> None:
+        if self._process is None or self._process.returncode is not None:
+            return
+
+        self._process.terminate()
+        try:
+            await asyncio.wait_for(self._process.wait(), timeout=self.stop_timeout)
+
+        except TimeoutError:
+            self._process.kill()
+            await self._process.wait()
+
+    def _forward(self, signum: int) -> None:
+        if self._process is not None and self._process.returncode is None:
+            self._process.send_signal(signum)
+
+    def _write_env_file(self, secrets: Secrets) -> None:
+        if self.env_file is None:
+            return
+
+        # The secrets are written in plain text, as the snapshot files may be.
+        with (
+            open_atomic(self.env_file, mode=0o600) as file,
+            DotenvWriter(file) as writer,
+        ):
+            for envname, secret in secrets.items():
+                writer.write(envname, secret)
@@ -0,0 +1,162 @@
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from shlex import quote
+from types import TracebackType
+from typing import IO, Final, Self, assert_never
+
+from pydantic import SecretStr
+
+from envix.cli.choices import OutputFormat
+
+# Number of entries written to the output at once.
+DEFAULT_CHUNK_SIZE: Final[int] = 256
+
+
+class SecretsWriter(ABC):
+    """
+    Write secrets to the output one by one, as soon as their values are final.
+
+    Entries are buffered and flushed in chunks,
+    so the whole document is never held in memory.
+    """
+
+    def __init__(self, file: IO[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.count = 0
+        self._chunk: list[str] = []
+
+    def write(self, envname: str, secret: SecretStr) -> None:
+        self._chunk.append(self.format(envname, secret.get_secret_value()))
+        self.count += 1
+
+        if len(self._chunk) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        self.file.write("".join(self._chunk))
+        self.file.flush()
+        self._chunk.clear()
+
+    def open(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def format(self, envname: str, value: str) -> str: ...
+
+    def __enter__(self) -> Self:
+        self.open()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        # Nothing is written when it fails before any entry.
+        # Otherwise, the document is closed so that it stays well-formed.
+        if exc_type is not None and self.count == 0:
+            return
+
+        self.close()
+
+
+class DotenvWriter(SecretsWriter):
+    def format(self, envname: str, value: str) -> str:
+        return f"{envname}={quote(value)}\n"
+
+    def close(self) -> None:
+        if self.count == 0:
+            self._chunk.append("\n")
+
+        super().close()
+
+
+class JsonWriter(SecretsWriter):
+    def open(self) -> None:
+        self._chunk.append("{")
+
+    def format(self, envname: str, value: str) -> str:
+        separator = ", " if self.count else ""
+
+        return f"{separator}{json.dumps(envname)}: {json.dumps(value)}"
+
+    def close(self) -> None:
+        self._chunk.append("}\n")
+
+        super().close()
+
+
+class NdjsonWriter(SecretsWriter):
+    def format(self, envname: str, value: str) -> str:
+        return json.dumps({"name": envname, "value": value}) + "\n"
+
+
+def create_writer(
+    format: OutputFormat, file: IO[str], *, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> SecretsWriter:
+    match format:
+        case "dotenv":
+            return DotenvWriter(file, chunk_size=chunk_size)
+
+        case "json":
+            return JsonWriter(file, chunk_size=chunk_size)
+
+        case "ndjson":
+            return NdjsonWriter(file, chunk_size=chunk_size)
+
+        case _:
+            assert_never(format)
+
+
+@contextmanager
+def open_atomic(filepath: Path, *, mode: int | None = None) -> Iterator[IO[str]]:
+    """
+    Write to a temporary file next to the file, and replace the file on success.
+
+    Readers of the file never see a partially written output.
+    The permission of the existing file is kept, unless the mode is given.
+    """
+
+    tmp_filepath = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_filepath, "w") as f:
+            # Changed before anything is written.
+            if mode is not None:
+                os.chmod(tmp_filepath, mode)
+
+            elif filepath.exists():
+                os.chmod(tmp_filepath, filepath.stat().st_mode & 0o7777)
+
+            yield f
+
+        os.replace(tmp_filepath, filepath)
+
+    finally:
+        tmp_filepath.unlink(missing_ok=True)
+
+
+@contextmanager
+def open_output(filepath: Path | None) -> Iterator[IO[str]]:
+    """
+    Open the output file with `open_atomic`, or stdout when no file is given.
+
+    The output file is kept as it is when the block fails.
+    """
+
+    if filepath is None:
+        yield sys.stdout
+        return
+
+    with open_atomic(filepath) as f:
+        yield f
@@ -1,78 +1,60 @@
 import os
-from logging import getLogger
 from pathlib import Path
-from typing import Self
+from typing import Self, cast
 
 from pydantic import RootModel
 
+from envix.cache.config_cache import config_cache
 from envix.exception import EnvixConfigFileExtensionError, EnvixConfigFileNotFound
-from envix.path import get_user_config_path
+from envix.path import find_config_file
+from envix.trace import span
 
 from .v1.config import ConfigV1
 
-logger = getLogger(__name__)
-
 
 class Config(RootModel):
     root: ConfigV1
 
     @classmethod
     def load(cls, filepath: Path | None) -> Self:
-        import tomllib
-
-        if not (filepath := filepath or _find_config_file()):
+        if not (filepath := filepath or find_config_file()):
             raise EnvixConfigFileNotFound(Path(os.getcwd()).joinpath("envix.yml"))
 
         if not filepath.exists():
             raise EnvixConfigFileNotFound(filepath)
 
+        if filepath.suffix not in (".toml", ".yaml", ".yml", ".json"):
+            raise EnvixConfigFileExtensionError(filepath)
+
+        with span("load", "config", path=str(filepath)):
+            return cast(
+                Self,
+                config_cache.load(
+                    filepath, lambda content: cls.parse(filepath, content)
+                ),
+            )
+
+    @classmethod
+    def parse(cls, filepath: Path, content: bytes) -> Self:
+        with span("parse", "config", path=str(filepath)):
+            return cls._parse(filepath, content)
+
+    @classmethod
+    def _parse(cls, filepath: Path, content: bytes) -> Self:
         match filepath.suffix:
             case ".toml":
-                with open(filepath, "rb") as f:
-                    return cls.model_validate(tomllib.load(f))
+                import tomllib
+
+                return cls.model_validate(tomllib.loads(content.decode("UTF-8")))
 
             case ".yaml" | ".yml":
                 import yaml
 
-                with open(filepath, "rb") as f:
-                    return cls.model_validate(yaml.safe_load(f))
+                return cls.model_validate(yaml.safe_load(content))
 
             case ".json":
-                import json
-
-                with open(filepath, "rb") as f:
-                    return cls.model_validate(json.load(f))
+                # Parsed and validated at once, without building the intermediate dicts.
+                return cls.model_validate_json(content)
 
             case _:
                 raise EnvixConfigFileExtensionError(filepath)
-
-
-def _find_config_file() -> Path | None:
-    import os
-    from pathlib import Path
-
-    cwd = Path(os.getcwd())
-
-    for directory in (cwd, *cwd.parents):
-        for filename in ("envix.yml", "envix.yaml", "envix.toml", "envix.json"):
-            config_filepath = directory / filename
-            if config_filepath.exists():
-                logger.debug(f"Found config file: {config_filepath}")
-                return config_filepath
-
-
-def collect_config_filepaths(
-    config_filepath: Path | None, config_names: list[str] | None = None
-) -> list[Path]:
-    config_filepaths = [
-        get_user_config_path(config_name) for config_name in config_names or []
-    ]
-
-    if config_filepath:
-        config_filepaths = [config_filepath] + config_filepaths
-
-    if not config_filepaths:
-        if config_path := _find_config_file():
-            config_filepaths.append(config_path)
-
-    return config_filepaths
@@ -2,8 +2,18 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
+
 
 class EnvixV1(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     version: Annotated[Literal[1], Field(title="envix version.")]
+
+    cache: Annotated[
+        SecretCacheV1 | None,
+        Field(
+            title="Default secret cache settings.",
+            description="Used by the envs blocks which do not have their own cache settings.",
+        ),
+    ] = None
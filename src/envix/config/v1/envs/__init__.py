@@ -1,7 +1,38 @@
+from typing import Annotated, Any
+
+from pydantic import Discriminator, Tag
+
+from envix.config.v1.envs.bitwarden_secrets_manager_envs_v1 import (
+    BitwardenSecretsManagerEnvsV1,
+)
 from envix.config.v1.envs.file_envs_v1 import FileEnvsV1
+from envix.config.v1.envs.provider_envs_v1 import ProviderEnvsV1
 from envix.config.v1.envs.raw_envs_v1 import RawEnvsV1
 
+from ._common import BUILTIN_ENVS_TYPES
 from .google_cloud_secret_manager_envs_v1 import GoogleCloudSecretManagerEnvsV1
 from .local_envs_v1 import LocalEnvsV1
 
-EnvsV1 = RawEnvsV1 | FileEnvsV1 | LocalEnvsV1 | GoogleCloudSecretManagerEnvsV1
+
+def _envs_tag(value: Any) -> str:
+    """
+    Types which are not built in are left to the providers installed as plugins.
+    """
+
+    type = (
+        value.get("type") if isinstance(value, dict) else getattr(value, "type", None)
+    )
+
+    return type if type in BUILTIN_ENVS_TYPES else "Provider"
+
+
+# Tagged by `type`, so that each envs block is validated only against its own model.
+EnvsV1 = Annotated[
+    Annotated[RawEnvsV1, Tag("Raw")]
+    | Annotated[FileEnvsV1, Tag("File")]
+    | Annotated[LocalEnvsV1, Tag("Local")]
+    | Annotated[GoogleCloudSecretManagerEnvsV1, Tag("GoogleCloudSecretManager")]
+    | Annotated[BitwardenSecretsManagerEnvsV1, Tag("BitwardenSecretsManager")]
+    | Annotated[ProviderEnvsV1, Tag("Provider")],
+    Discriminator(_envs_tag),
+]
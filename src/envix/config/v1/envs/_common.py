@@ -1,4 +1,4 @@
-from typing import Annotated
+from typing import Annotated, Final
 
 from pydantic import Field
 
@@ -9,3 +9,12 @@ OverwriteType = Annotated[
         description="Whether to overwrite existing environment variables.",
     ),
 ]
+
+# Types of the envs blocks of envix. Any other type is left to the providers.
+BUILTIN_ENVS_TYPES: Final = (
+    "Raw",
+    "File",
+    "Local",
+    "GoogleCloudSecretManager",
+    "BitwardenSecretsManager",
+)
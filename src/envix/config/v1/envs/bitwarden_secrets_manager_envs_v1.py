@@ -0,0 +1,67 @@
+from typing import Annotated, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
+from envix.pattern import ENVNAME_PATTERN
+
+from ._common import OverwriteType
+
+
+class BitwardenSecretsManagerEnvsV1(BaseModel):
+    """
+    Bitwarden Secrets Manager environment variables.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    type: Annotated[
+        Literal["BitwardenSecretsManager"],
+        Field(title="Bitwarden Secrets Manager environment variables."),
+    ]
+
+    access_token_envname: Annotated[
+        str,
+        Field(
+            title="Name of the environment variable of the machine account access token.",
+            pattern=ENVNAME_PATTERN,
+        ),
+    ] = "BWS_ACCESS_TOKEN"
+
+    api_url: Annotated[
+        str | None,
+        Field(
+            title="API URL of the self-hosted server.",
+            description="When not specified, the Bitwarden cloud is used.",
+        ),
+    ] = None
+
+    identity_url: Annotated[
+        str | None,
+        Field(
+            title="Identity URL of the self-hosted server.",
+            description="When not specified, the Bitwarden cloud is used.",
+        ),
+    ] = None
+
+    items: dict[
+        Annotated[str, Field(pattern=ENVNAME_PATTERN)],
+        Annotated[
+            str,
+            Field(
+                title="ID of the secret whose value is to be read.",
+                pattern=r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$",
+                examples=["be8e0ad8-d545-4017-a55a-b02f014d4158"],
+            ),
+        ],
+    ]
+
+    overwrite: OverwriteType = True
+
+    cache: Annotated[
+        SecretCacheV1 | None,
+        Field(
+            title="Secret cache settings.",
+            description="When not specified, the cache settings of envix are used. Secrets are cached as the latest versions.",
+        ),
+    ] = None
@@ -3,6 +3,7 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from envix.default import DEFAULT_FILE_ENVS_MAX_SIZE
 from envix.pattern import ENVNAME_PATTERN
 
 from ._common import OverwriteType
@@ -31,4 +32,13 @@ class FileEnvsV1(BaseModel):
         ),
     ]
 
+    max_size: Annotated[
+        int,
+        Field(
+            title="Maximum size of each file in bytes.",
+            description="Files larger than this fail to load, so that a wrong path does not read a huge file into the environment.",
+            gt=0,
+        ),
+    ] = DEFAULT_FILE_ENVS_MAX_SIZE
+
     overwrite: OverwriteType = True
@@ -2,6 +2,7 @@ from typing import Annotated, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
 from envix.pattern import ENVNAME_PATTERN
 
 from ._common import OverwriteType
@@ -46,6 +47,14 @@ class GoogleCloudSecretManagerEnvsV1(BaseModel):
 
     overwrite: OverwriteType = True
 
+    cache: Annotated[
+        SecretCacheV1 | None,
+        Field(
+            title="Secret cache settings.",
+            description="When not specified, the cache settings of envix are used.",
+        ),
+    ] = None
+
     @property
     def secret_items(self) -> dict[str, str]:
         items: dict[str, str] = {}
@@ -0,0 +1,91 @@
+import difflib
+from typing import Annotated, Any, Self
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
+from envix.pattern import ENVNAME_PATTERN
+
+from ._common import BUILTIN_ENVS_TYPES, OverwriteType
+
+
+class ProviderEnvsV1(BaseModel):
+    """
+    Environment variables of a provider installed as a plugin.
+
+    Every envs block whose `type` is not built in falls back to this model,
+    and is validated with the config model of the provider of its `type`.
+    Built-in types never reach the providers, and a misspelled built-in type
+    is reported with the type it is close to.
+    """
+
+    model_config = ConfigDict(extra="allow")
+
+    type: Annotated[
+        str,
+        Field(
+            title="Type of the envs provider.",
+            description="Name of the entry point in the `envix.providers` group.",
+            json_schema_extra={"not": {"enum": list(BUILTIN_ENVS_TYPES)}},
+        ),
+    ]
+
+    items: Annotated[
+        dict[Annotated[str, Field(pattern=ENVNAME_PATTERN)], Any],
+        Field(title="Environment variables and their references in the provider."),
+    ]
+
+    overwrite: OverwriteType = True
+
+    cache: Annotated[
+        SecretCacheV1 | None,
+        Field(
+            title="Secret cache settings.",
+            description="Used only when the provider is cacheable. When not specified, the cache settings of envix are used.",
+        ),
+    ] = None
+
+    _settings: BaseModel | None = PrivateAttr(default=None)
+
+    @field_validator("type")
+    @classmethod
+    def validate_type(cls, type: str) -> str:
+        if type in BUILTIN_ENVS_TYPES:
+            raise ValueError(f"Built-in envs type is not a provider: {type}")
+
+        return type
+
+    @model_validator(mode="after")
+    def validate_provider_settings(self) -> Self:
+        from envix.exception import EnvixProviderNotFoundError
+        from envix.provider import get_provider_class
+
+        try:
+            provider = get_provider_class(self.type)
+
+        except EnvixProviderNotFoundError as e:
+            if matches := difflib.get_close_matches(self.type, BUILTIN_ENVS_TYPES, n=1):
+                raise ValueError(
+                    f"Unknown envs type: {self.type}. Did you mean {matches[0]}?"
+                ) from e
+
+            raise
+
+        self._settings = provider.model.model_validate(
+            self.model_dump(exclude={"overwrite", "cache"})
+        )
+
+        return self
+
+    @property
+    def settings(self) -> BaseModel:
+        assert self._settings is not None
+
+        return self._settings
@@ -0,0 +1,30 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SecretCacheV1(BaseModel):
+    """
+    Local encrypted cache of the secrets fetched from the remote secret managers.
+
+    Secrets of the pinned versions never change, so they are cached without expiry.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    ttl: Annotated[
+        int,
+        Field(
+            title="Time to live of the cached latest version secrets in seconds.",
+            description="Secrets of the latest version are not cached when 0 is specified. Expired secrets are revalidated with the version metadata.",
+            ge=0,
+        ),
+    ]
+
+    latest: Annotated[
+        bool,
+        Field(
+            title="Cache secrets of the latest version.",
+            description="When false, only the secrets of the pinned versions are cached.",
+        ),
+    ] = True
@@ -0,0 +1,16 @@
+from typing import Final
+
+DEFAULT_CONCURRENCY: Final[int] = 8
+
+# Maximum number of concurrent Google Cloud Secret Manager RPCs in a load.
+DEFAULT_GOOGLE_CLOUD_SECRET_MANAGER_CONCURRENCY: Final[int] = 32
+
+# Maximum number of concurrent Bitwarden Secrets Manager requests in a load.
+# Each request fetches every secret of an envs block at once.
+DEFAULT_BITWARDEN_SECRETS_MANAGER_CONCURRENCY: Final[int] = 4
+
+# Maximum size in bytes of a file read by a File envs block.
+DEFAULT_FILE_ENVS_MAX_SIZE: Final[int] = 1024 * 1024
+
+# Seconds to wait for the envix agent, before resolving the secrets without it.
+DEFAULT_AGENT_TIMEOUT: Final[float] = 30.0
@@ -2,3 +2,8 @@ from typing import Final
 
 ENVIX_CONFIG_DIR: Final[str] = "ENVIX_CONFIG_DIR"
 ENVIX_EDITOR: Final[str] = "ENVIX_EDITOR"
+ENVIX_CACHE_KEY: Final[str] = "ENVIX_CACHE_KEY"
+ENVIX_CONFIG_CACHE: Final[str] = "ENVIX_CONFIG_CACHE"
+ENVIX_AGENT_SOCKET: Final[str] = "ENVIX_AGENT_SOCKET"
+ENVIX_SNAPSHOT_KEY: Final[str] = "ENVIX_SNAPSHOT_KEY"
+ENVIX_GCP_ENDPOINT: Final[str] = "ENVIX_GCP_ENDPOINT"
@@ -11,6 +11,19 @@ class EnvixError(Exception, ABC):
         return self.message
 
 
+class EnvixMessageError(EnvixError):
+    """
+    Error whose message is given as it is, for errors which have no fields to format.
+    """
+
+    def __init__(self, message: str):
+        self._message = message
+
+    @property
+    def message(self) -> str:
+        return self._message
+
+
 class EnvixConfigFileExtensionError(EnvixError, ValueError):
     def __init__(self, filename: Path):
         self.filename = filename
@@ -52,6 +65,20 @@ class EnvixEnvironmentFileLoadError(EnvixEnvInjectionError, ValueError):
         return f"Environment {self.envname} file load error: {self.filepath}"
 
 
+class EnvixEnvironmentFileTooLargeError(EnvixEnvInjectionError, ValueError):
+    def __init__(self, envname: str, filepath: Path, max_size: int):
+        self.envname = envname
+        self.filepath = filepath
+        self.max_size = max_size
+
+    @property
+    def message(self) -> str:
+        return (
+            f"Environment {self.envname} file is larger than {self.max_size} bytes: "
+            f"{self.filepath}. Raise `max_size` of the File envs to load it."
+        )
+
+
 class EnvixGoogleCloudSecretManagerError(EnvixEnvInjectionError):
     def __init__(self, envname: str, error: Exception):
         self.envname = envname
@@ -62,6 +89,36 @@ class EnvixGoogleCloudSecretManagerError(EnvixEnvInjectionError):
         return f"Google Cloud Secret Manager error: {self.envname}, {self.error}"
 
 
+class EnvixBitwardenSecretsManagerError(EnvixEnvInjectionError):
+    def __init__(self, envname: str, error: Exception):
+        self.envname = envname
+        self.error = error
+
+    @property
+    def message(self) -> str:
+        return f"Bitwarden Secrets Manager error: {self.envname}, {self.error}"
+
+
+class EnvixProviderError(EnvixEnvInjectionError):
+    def __init__(self, envname: str, type: str, error: Exception):
+        self.envname = envname
+        self.type = type
+        self.error = error
+
+    @property
+    def message(self) -> str:
+        return f"{self.type} error: {self.envname}, {self.error}"
+
+
+class EnvixProviderNotFoundError(EnvixError, ValueError):
+    def __init__(self, type: str):
+        self.type = type
+
+    @property
+    def message(self) -> str:
+        return f"Envs provider not installed: {self.type}"
+
+
 class EnvixConfigFileNotFound(EnvixEnvInjectionError, FileNotFoundError):
     def __init__(self, filename: Path):
         self.filename = filename
@@ -78,3 +135,45 @@ class EnvixConfigFileParseError(EnvixEnvInjectionError, ValueError):
     @property
     def message(self) -> str:
         return f'Config file parse error: "{self.filename.absolute()}"'
+
+
+class EnvixCacheKeyError(EnvixError, ValueError):
+    def __init__(self, envname: str):
+        self.envname = envname
+
+    @property
+    def message(self) -> str:
+        return f"Invalid cache key: {self.envname} must be a url-safe base64-encoded 32-byte key"
+
+
+class EnvixConfigIncludeCycleError(EnvixEnvInjectionError, ValueError):
+    def __init__(self, cycle: list[Path]):
+        self.cycle = cycle
+
+    @property
+    def message(self) -> str:
+        return "Config include cycle detected: " + " -> ".join(
+            f'"{filepath}"' for filepath in self.cycle
+        )
+
+
+class EnvixAgentError(EnvixMessageError, EnvixEnvInjectionError):
+    pass
+
+
+class EnvixWatchOutputError(EnvixError, ValueError):
+    @property
+    def message(self) -> str:
+        return "--watch requires --output-file, since the file is rewritten on every change."
+
+
+class EnvixRotationError(EnvixMessageError, ValueError):
+    pass
+
+
+class EnvixSnapshotError(EnvixMessageError, ValueError):
+    pass
+
+
+class EnvixSelectionError(EnvixMessageError, ValueError):
+    pass
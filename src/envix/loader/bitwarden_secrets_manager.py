@@ -0,0 +1,65 @@
+from typing import Final
+
+# Name of the user agent sent to Bitwarden.
+USER_AGENT: Final[str] = "envix"
+
+
+class BitwardenSecretsManagerRequestError(Exception):
+    pass
+
+
+class BitwardenSecretsManagerClient:
+    """
+    Client of Bitwarden Secrets Manager, logged in with a machine account access token.
+
+    The SDK is synchronous, so the loader calls it in threads.
+    """
+
+    def __init__(
+        self,
+        access_token: str,
+        *,
+        api_url: str | None = None,
+        identity_url: str | None = None,
+    ) -> None:
+        from bitwarden_sdk import BitwardenClient, DeviceType, client_settings_from_dict
+
+        settings: dict[str, object] = {
+            "deviceType": DeviceType.SDK,
+            "userAgent": USER_AGENT,
+        }
+        if api_url is not None:
+            settings["apiUrl"] = api_url
+
+        if identity_url is not None:
+            settings["identityUrl"] = identity_url
+
+        self._client = BitwardenClient(client_settings_from_dict(settings))
+        try:
+            self._client.access_token_login(access_token)
+
+        except Exception as e:
+            # The SDK raises plain exceptions of its native client.
+            raise BitwardenSecretsManagerRequestError(f"Failed to log in: {e}") from e
+
+    def get_by_ids(self, secret_ids: list[str]) -> dict[str, str]:
+        """
+        Fetch the secrets at once, and return their values keyed by the lowercase IDs.
+        """
+
+        import uuid
+
+        try:
+            response = self._client.secrets().get_by_ids(
+                [uuid.UUID(secret_id) for secret_id in secret_ids]
+            )
+
+        except Exception as e:
+            raise BitwardenSecretsManagerRequestError(str(e)) from e
+
+        if not response.success or response.data is None:
+            raise BitwardenSecretsManagerRequestError(
+                response.error_message or "Failed to get the secrets."
+            )
+
+        return {str(secret.id).lower(): secret.value for secret in response.data.data}
@@ -0,0 +1,215 @@
+import asyncio
+import os
+import random
+import re
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Annotated, Any, Final, cast
+
+from google.api_core import exceptions
+from google.cloud import secretmanager
+from pydantic import BaseModel, Field
+
+from envix.envname import ENVIX_GCP_ENDPOINT
+
+# Endpoint scheme of the fake client, followed by the path of its fixture.
+FAKE_ENDPOINT_SCHEME: Final[str] = "fake:"
+
+_SECRET_VERSION_PATTERN: Final = re.compile(
+    r"^(projects/[^/]+/secrets/[^/]+)/versions/([^/]+)$"
+)
+
+
+def create_secret_manager_client(
+    endpoint: str | None = None,
+) -> secretmanager.SecretManagerServiceAsyncClient:
+    """
+    Create the client of the endpoint, which defaults to `ENVIX_GCP_ENDPOINT`.
+
+    `fake:FIXTURE` selects the in-process fake backed by the fixture file.
+    Any other endpoint is used as the API endpoint of the real client.
+    """
+
+    endpoint = endpoint or os.getenv(ENVIX_GCP_ENDPOINT)
+
+    if not endpoint:
+        return secretmanager.SecretManagerServiceAsyncClient()
+
+    if endpoint.startswith(FAKE_ENDPOINT_SCHEME):
+        return cast(
+            secretmanager.SecretManagerServiceAsyncClient,
+            FakeSecretManagerServiceAsyncClient.from_file(
+                Path(endpoint.removeprefix(FAKE_ENDPOINT_SCHEME))
+            ),
+        )
+
+    from google.api_core.client_options import ClientOptions
+
+    return secretmanager.SecretManagerServiceAsyncClient(
+        client_options=ClientOptions(api_endpoint=endpoint)
+    )
+
+
+class FakeSecretManagerFixture(BaseModel):
+    """
+    Secrets and behaviour of the fake Secret Manager.
+
+    e.g.
+
+    ```yaml
+    latency: 0.05
+    jitter: 0.01
+    error_rate: 0.01
+    rate_limit: 100
+    secrets:
+      projects/my-project/secrets/database_password:
+        - old-password
+        - new-password
+    ```
+    """
+
+    # Seconds each request takes, plus a uniform random jitter of up to `jitter` seconds.
+    latency: Annotated[float, Field(ge=0)] = 0.0
+    jitter: Annotated[float, Field(ge=0)] = 0.0
+    # Ratio of the requests which fail with ServiceUnavailable.
+    error_rate: Annotated[float, Field(ge=0, le=1)] = 0.0
+    # Requests per second. Requests beyond it fail with ResourceExhausted.
+    rate_limit: Annotated[int | None, Field(ge=1)] = None
+    seed: int | None = None
+    # Versions of each secret, numbered from 1. The last one is the latest.
+    secrets: dict[str, str | list[str]] = {}
+
+
+class FakeSecretManagerServiceAsyncClient:
+    """
+    In-process stand-in of `SecretManagerServiceAsyncClient`, for tests and benchmarks.
+
+    Only the methods envix calls are provided. The retry is applied as the real client does,
+    so quota errors are retried with the backoff of envix.
+    """
+
+    def __init__(self, fixture: FakeSecretManagerFixture | None = None) -> None:
+        self.fixture = fixture or FakeSecretManagerFixture()
+        self.transport = self
+        self.request_count = 0
+        self.error_count = 0
+        # Requests of the values, which excludes those of the version metadata.
+        self.access_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Errors raised by the next requests, in order, before the injected ones.
+        self.failures: list[exceptions.GoogleAPICallError] = []
+        self.closed = False
+        self._random = random.Random(self.fixture.seed)
+        self._request_times: deque[float] = deque()
+
+    @classmethod
+    def from_file(cls, filepath: Path) -> "FakeSecretManagerServiceAsyncClient":
+        content = filepath.read_bytes()
+
+        if filepath.suffix == ".json":
+            return cls(FakeSecretManagerFixture.model_validate_json(content))
+
+        import yaml
+
+        return cls(FakeSecretManagerFixture.model_validate(yaml.safe_load(content)))
+
+    async def get_secret_version(
+        self, request: dict[str, str], retry: Any = None
+    ) -> secretmanager.SecretVersion:
+        name, _ = await self._call(self._access, request["name"], retry)
+
+        return secretmanager.SecretVersion(
+            name=name, state=secretmanager.SecretVersion.State.ENABLED
+        )
+
+    async def access_secret_version(
+        self, request: dict[str, str], retry: Any = None
+    ) -> secretmanager.AccessSecretVersionResponse:
+        name, value = await self._call(self._access_value, request["name"], retry)
+
+        return secretmanager.AccessSecretVersionResponse(
+            name=name,
+            payload=secretmanager.SecretPayload(data=value.encode("UTF-8")),
+        )
+
+    async def _call(
+        self,
+        call: Callable[[str], Awaitable[tuple[str, str]]],
+        secret_name: str,
+        retry: Any,
+    ) -> tuple[str, str]:
+        return await (call if retry is None else retry(call))(secret_name)
+
+    async def _access_value(self, secret_name: str) -> tuple[str, str]:
+        self.access_count += 1
+
+        return await self._access(secret_name)
+
+    async def _access(self, secret_name: str) -> tuple[str, str]:
+        self.request_count += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            await asyncio.sleep(
+                self.fixture.latency + self._random.uniform(0, self.fixture.jitter)
+            )
+
+            self._check_rate_limit()
+
+            if self.failures:
+                raise self.failures.pop(0)
+
+            if self._random.random() < self.fixture.error_rate:
+                raise exceptions.ServiceUnavailable("Injected error.")
+
+            return self._get_version(secret_name)
+
+        except exceptions.GoogleAPICallError:
+            self.error_count += 1
+            raise
+
+        finally:
+            self.in_flight -= 1
+
+    def _check_rate_limit(self) -> None:
+        if self.fixture.rate_limit is None:
+            return
+
+        now = time.monotonic()
+        while self._request_times and self._request_times[0] <= now - 1.0:
+            self._request_times.popleft()
+
+        if len(self._request_times) >= self.fixture.rate_limit:
+            raise exceptions.ResourceExhausted("Quota exceeded.")
+
+        self._request_times.append(now)
+
+    def _get_version(self, secret_name: str) -> tuple[str, str]:
+        if (match := _SECRET_VERSION_PATTERN.match(secret_name)) is None:
+            raise exceptions.InvalidArgument(f"Invalid secret name: {secret_name}")
+
+        secret, version = match.groups()
+        if (versions := self.fixture.secrets.get(secret)) is None:
+            raise exceptions.NotFound(f"Secret not found: {secret}")
+
+        if isinstance(versions, str):
+            versions = [versions]
+
+        if version == "latest":
+            number = len(versions)
+        elif version.isdigit():
+            number = int(version)
+        else:
+            number = 0
+
+        if not 1 <= number <= len(versions):
+            raise exceptions.NotFound(f"Secret version not found: {secret_name}")
+
+        return f"{secret}/versions/{number}", versions[number - 1]
+
+    async def close(self) -> None:
+        self.closed = True
@@ -0,0 +1,409 @@
+import asyncio
+import os
+from collections import ChainMap
+from collections.abc import Callable, Iterable, MutableMapping
+from pathlib import Path
+from typing import Any, assert_never, cast
+
+from pydantic import BaseModel, ConfigDict, SecretStr, ValidationError
+
+from envix.config.config import Config
+from envix.config.v1.config import ConfigV1
+from envix.config.v1.envs import EnvsV1
+from envix.config.v1.envs.bitwarden_secrets_manager_envs_v1 import (
+    BitwardenSecretsManagerEnvsV1,
+)
+from envix.config.v1.envs.google_cloud_secret_manager_envs_v1 import (
+    GoogleCloudSecretManagerEnvsV1,
+)
+from envix.config.v1.envs.local_envs_v1 import LocalEnvsV1
+from envix.config.v1.envs.provider_envs_v1 import ProviderEnvsV1
+from envix.default import DEFAULT_CONCURRENCY
+from envix.exception import (
+    EnvixConfigFileNotFound,
+    EnvixConfigFileParseError,
+    EnvixConfigIncludeCycleError,
+    EnvixEnvInjectionError,
+)
+from envix.loader.selection import EnvnameSelection
+from envix.loader.session import LoaderSession
+from envix.loader.v1_loader import (
+    PrefetchableEnvsV1,
+    apply_envs_v1,
+    load_local_envs_v1,
+    resolve_envs_v1,
+)
+from envix.trace import span
+from envix.types import Environ, ResolvedSecrets, Secrets
+
+
+class PlannedEnvs(BaseModel):
+    config_filepath: Path
+    envs: EnvsV1
+
+
+class SecretsPlan(BaseModel):
+    """
+    Envs blocks of the whole include graph, in the order they are applied.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    entries: list[PlannedEnvs] = []
+    errors: list[EnvixEnvInjectionError] = []
+    # Every config file in the include graph, including the missing ones.
+    config_filepaths: list[Path] = []
+    # Env names to return. The entries are already narrowed down to them
+    # and to the env names which Local envs of them refer to.
+    selection: EnvnameSelection | None = None
+
+
+def plan_secrets(
+    config_filepath: Path | list[Path] | None = None,
+    *,
+    selection: EnvnameSelection | None = None,
+) -> SecretsPlan:
+    planner = _IncludeGraphPlanner(selection)
+
+    config_filepaths = (
+        config_filepath if isinstance(config_filepath, list) else [config_filepath]
+    )
+    with span("plan", "loader"):
+        for path in config_filepaths:
+            planner.visit(Config.load(path), path)
+
+    return planner.build()
+
+
+def plan_config(
+    config: Config,
+    config_filepath: Path | None,
+    *,
+    selection: EnvnameSelection | None = None,
+) -> SecretsPlan:
+    planner = _IncludeGraphPlanner(selection)
+    with span("plan", "loader"):
+        planner.visit(config, config_filepath)
+
+    return planner.build()
+
+
+class _IncludeGraphPlanner:
+    """
+    Resolve the include graph into a DAG of canonical config paths.
+
+    Every config file is loaded and planned once even if it is included many times,
+    but its envs are placed at every occurrence in the include order,
+    so the precedence of `overwrite` and the values Local envs read
+    are the same as loading every include in turn.
+    The executor fetches the remote values of the repeated envs only once.
+
+    With a selection, the items which are not selected are dropped from the entries,
+    and the entries left empty, e.g. of the includes which set none of them, are pruned.
+    """
+
+    def __init__(self, selection: EnvnameSelection | None = None) -> None:
+        self._selection = selection
+        self._entries: list[PlannedEnvs] = []
+        self._errors: list[EnvixEnvInjectionError] = []
+        self._visited: set[Path] = set()
+        self._planned: dict[Path, list[PlannedEnvs]] = {}
+        self._stack: list[Path] = []
+
+    def build(self) -> SecretsPlan:
+        return SecretsPlan(
+            entries=self._select(self._entries),
+            errors=self._errors,
+            config_filepaths=sorted(self._visited),
+            selection=self._selection,
+        )
+
+    def _select(self, entries: list[PlannedEnvs]) -> list[PlannedEnvs]:
+        """
+        Narrow down the entries to the selection.
+
+        Local envs read the values set by the preceding entries,
+        so the env names they refer to are selected for those entries as well.
+        To do so, the entries are walked in reverse order.
+        """
+
+        if (selection := self._selection) is None:
+            return entries
+
+        selected: list[PlannedEnvs] = []
+        for entry in reversed(entries):
+            envs = _select_envs(entry.envs, selection)
+            if envs is None:
+                continue
+
+            if isinstance(envs, LocalEnvsV1):
+                selection = selection.with_names(envs._items.values())
+
+            selected.append(entry.model_copy(update={"envs": envs}))
+
+        return list(reversed(selected))
+
+    def visit(self, config: Config, config_filepath: Path | None) -> None:
+        config_filepath = config_filepath or Path(os.getcwd(), "envix.yml")
+
+        self._entries.extend(self._plan(config, config_filepath))
+
+    def _plan(self, config: Config, config_filepath: Path) -> list[PlannedEnvs]:
+        canonical_filepath = config_filepath.resolve()
+        if (entries := self._planned.get(canonical_filepath)) is not None:
+            return entries
+
+        self._visited.add(canonical_filepath)
+
+        entries = []
+        config_root = config.root
+        match config_root:
+            case ConfigV1():
+                self._stack.append(canonical_filepath)
+                try:
+                    for include_path in config_root.includes:
+                        entries.extend(
+                            self._visit_include(config_filepath.parent / include_path)
+                        )
+                finally:
+                    self._stack.pop()
+
+                for envs in config_root.envs:
+                    if (
+                        isinstance(
+                            envs,
+                            GoogleCloudSecretManagerEnvsV1
+                            | BitwardenSecretsManagerEnvsV1
+                            | ProviderEnvsV1,
+                        )
+                        and envs.cache is None
+                        and config_root.envix.cache is not None
+                    ):
+                        envs = envs.model_copy(
+                            update={"cache": config_root.envix.cache}
+                        )
+
+                    entries.append(
+                        PlannedEnvs(config_filepath=canonical_filepath, envs=envs)
+                    )
+
+            case _:
+                assert_never(config_root)
+
+        self._planned[canonical_filepath] = entries
+
+        return entries
+
+    def _visit_include(self, include_path: Path) -> list[PlannedEnvs]:
+        with span("include", "loader", path=str(include_path)):
+            return self._visit_include_path(include_path)
+
+    def _visit_include_path(self, include_path: Path) -> list[PlannedEnvs]:
+        canonical_filepath = include_path.resolve()
+        if canonical_filepath in self._stack:
+            cycle = self._stack[self._stack.index(canonical_filepath) :]
+            self._errors.append(
+                EnvixConfigIncludeCycleError([*cycle, canonical_filepath])
+            )
+            return []
+
+        if canonical_filepath in self._planned:
+            return self._planned[canonical_filepath]
+
+        # The errors of a missing or broken include are reported once.
+        if canonical_filepath in self._visited:
+            return []
+
+        if not include_path.exists():
+            self._visited.add(canonical_filepath)
+            self._errors.append(EnvixConfigFileNotFound(include_path))
+            return []
+
+        try:
+            config = Config.load(include_path)
+        except ValidationError:
+            self._visited.add(canonical_filepath)
+            self._errors.append(EnvixConfigFileParseError(include_path))
+            return []
+
+        return self._plan(config, include_path)
+
+
+async def execute_plan(
+    plan: SecretsPlan,
+    *,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    session: LoaderSession | None = None,
+    environ: Environ | None = None,
+    on_secret: Callable[[str, SecretStr], None] | None = None,
+) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    """
+    Resolve every envs block concurrently, then apply them in the planned order.
+
+    The application order is the same as the sequential loading,
+    so the precedence of `overwrite` does not change.
+
+    `environ` is the base environment, which defaults to `os.environ`.
+    It is never changed: the applied values are merged into an overlay,
+    and the returned secrets are the overlay to be set on the base environment.
+
+    `on_secret` is called with each value as soon as it is final,
+    that is, once the last envs block which has its env name is applied.
+    """
+
+    total_secrets: Secrets = {}
+    total_errors: list[EnvixEnvInjectionError] = list(plan.errors)
+    selection = plan.selection
+
+    overlay: dict[str, str] = {}
+    # ChainMap only writes to the first mapping, so the base environment is read-only.
+    current_environ = ChainMap(
+        overlay,
+        cast(MutableMapping[str, str], os.environ if environ is None else environ),
+    )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def prefetch(
+        key: tuple[Path, str], envs: PrefetchableEnvsV1
+    ) -> ResolvedSecrets:
+        # Only remote values are reused, since the other blocks are cheap
+        # and their files are not watched.
+        memo = (
+            session.resolved_envs
+            if session
+            and isinstance(
+                envs,
+                GoogleCloudSecretManagerEnvsV1
+                | BitwardenSecretsManagerEnvsV1
+                | ProviderEnvsV1,
+            )
+            else None
+        )
+        if memo is not None and key in memo:
+            return memo[key]
+
+        async with semaphore:
+            with span("resolve", "envs", type=envs.type, config=str(key[0])):
+                resolved = await resolve_envs_v1(envs, current_environ, session)
+
+        # Failed blocks are resolved again next time, and so are the blocks
+        # whose env names were skipped, since the next environment may not have them.
+        if (
+            memo is not None
+            and not resolved[1]
+            and resolved[0].keys() >= set(envs.items)
+        ):
+            memo[key] = resolved
+
+        return resolved
+
+    # Env names whose values are final after each envs block is applied.
+    final_envnames: list[list[str]] = [[] for _ in plan.entries]
+    if on_secret is not None:
+        last_indices = {
+            envname: i
+            for i, entry in enumerate(plan.entries)
+            for envname in _envnames(entry.envs)
+        }
+        for envname, i in last_indices.items():
+            final_envnames[i].append(envname)
+
+    # The envs of a file included many times are fetched once, and applied at every place.
+    fetches: dict[tuple[Path, str], asyncio.Task[ResolvedSecrets]] = {}
+
+    def fetch(
+        entry: PlannedEnvs, envs: PrefetchableEnvsV1
+    ) -> asyncio.Task[ResolvedSecrets]:
+        key = (entry.config_filepath, envs.model_dump_json())
+        if key not in fetches:
+            fetches[key] = asyncio.create_task(prefetch(key, envs))
+
+        return fetches[key]
+
+    # Errors of the envs applied many times are reported once.
+    reported_errors: set[int] = set()
+
+    with span("execute", "loader"):
+        tasks = [
+            None if isinstance(entry.envs, LocalEnvsV1) else fetch(entry, entry.envs)
+            for entry in plan.entries
+        ]
+
+        try:
+            for i, (entry, task) in enumerate(zip(plan.entries, tasks)):
+                if isinstance(entry.envs, LocalEnvsV1):
+                    # Local envs may refer to values set by the preceding envs.
+                    with span(
+                        "resolve",
+                        "envs",
+                        type=entry.envs.type,
+                        config=str(entry.config_filepath),
+                    ):
+                        secrets, errors = await load_local_envs_v1(
+                            entry.envs, current_environ
+                        )
+
+                else:
+                    assert task is not None
+                    secrets, errors = apply_envs_v1(
+                        entry.envs, await task, current_environ
+                    )
+
+                overlay.update(
+                    (envname, secret.get_secret_value())
+                    for envname, secret in secrets.items()
+                )
+                total_secrets.update(
+                    secrets
+                    if selection is None
+                    else (
+                        (envname, secret)
+                        for envname, secret in secrets.items()
+                        if envname in selection
+                    )
+                )
+                for error in errors:
+                    if id(error) not in reported_errors:
+                        reported_errors.add(id(error))
+                        total_errors.append(error)
+
+                if on_secret is not None:
+                    for envname in final_envnames[i]:
+                        if envname in total_secrets:
+                            on_secret(envname, total_secrets[envname])
+
+        finally:
+            for task in fetches.values():
+                if not task.done():
+                    task.cancel()
+
+    return total_secrets, total_errors
+
+
+def _envnames(envs: EnvsV1) -> Iterable[str]:
+    return envs._items if isinstance(envs, LocalEnvsV1) else envs.items
+
+
+def _select_envs(envs: EnvsV1, selection: EnvnameSelection) -> EnvsV1 | None:
+    """
+    Copy of the envs with the selected items only, or None when nothing is selected.
+    """
+
+    items: Any
+    if isinstance(envs.items, list):
+        items = [envname for envname in envs.items if envname in selection]
+    else:
+        items = {
+            envname: value
+            for envname, value in envs.items.items()
+            if envname in selection
+        }
+
+    if not items:
+        return None
+
+    if len(items) == len(envs.items):
+        return envs
+
+    return envs.model_copy(update={"items": items})
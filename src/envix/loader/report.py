@@ -0,0 +1,186 @@
+import os
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Final
+
+from pydantic import BaseModel
+
+from envix.cache.secret_cache import SecretCache
+from envix.config.v1.envs import EnvsV1
+from envix.config.v1.envs.bitwarden_secrets_manager_envs_v1 import (
+    BitwardenSecretsManagerEnvsV1,
+)
+from envix.config.v1.envs.google_cloud_secret_manager_envs_v1 import (
+    GoogleCloudSecretManagerEnvsV1,
+)
+from envix.config.v1.envs.local_envs_v1 import LocalEnvsV1
+from envix.config.v1.envs.provider_envs_v1 import ProviderEnvsV1
+from envix.loader.planner import SecretsPlan
+from envix.loader.v1_loader import (
+    bitwarden_cache_key,
+    is_cacheable_secret,
+    provider_cache_key,
+)
+from envix.types import Environ
+
+# Source of the values which are set before envix runs.
+ENVIRONMENT: Final[str] = "environment"
+
+
+class EnvsReport(BaseModel):
+    config_filepath: Path
+    type: str
+    envnames: list[str]
+    # Env names already set, which the block overwrites, and where they were set.
+    shadows: dict[str, str] = {}
+    # Env names already set, which the block leaves as they are.
+    skips: list[str] = []
+    # Unique remote secrets the block fetches, and the ones found in the cache.
+    remote_secrets: list[str] = []
+    cache_hits: list[str] = []
+    remote_calls: int = 0
+
+
+class PlanReport(BaseModel):
+    """
+    What loading the plan would do, worked out without fetching any value.
+    """
+
+    config_filepaths: list[Path]
+    envs: list[EnvsReport]
+    errors: list[str]
+    # Unique remote secrets over the whole plan.
+    remote_secrets: int
+    cache_hits: int
+    remote_calls: int
+
+
+def report_plan(
+    plan: SecretsPlan,
+    *,
+    environ: Environ | None = None,
+    secret_cache: SecretCache | None = None,
+) -> PlanReport:
+    """
+    Report each envs block of the plan, following the same `overwrite` and cache rules as loading.
+
+    The secret cache is only read, so the expected cache hits are those of the next load.
+    """
+
+    environ = os.environ if environ is None else environ
+    sources: dict[str, str] = dict.fromkeys(environ, ENVIRONMENT)
+
+    # The envs of a file included many times are fetched only at the first place.
+    fetched: set[tuple[Path, str]] = set()
+
+    reports: list[EnvsReport] = []
+    for entry in plan.entries:
+        envs = entry.envs
+        report = EnvsReport(
+            config_filepath=entry.config_filepath,
+            type=envs.type,
+            envnames=list(_envnames(envs)),
+        )
+
+        applied: list[str] = []
+        for envname in report.envnames:
+            if envname not in sources:
+                applied.append(envname)
+            elif envs.overwrite:
+                report.shadows[envname] = sources[envname]
+                applied.append(envname)
+            else:
+                report.skips.append(envname)
+
+        key = (entry.config_filepath, envs.model_dump_json())
+        remote_secrets = {} if key in fetched else _remote_secrets(envs, applied)
+        fetched.add(key)
+        report.remote_secrets = list(remote_secrets)
+        report.cache_hits = [
+            key
+            for key, cacheable in remote_secrets.items()
+            if cacheable and _is_cache_hit(secret_cache, key)
+        ]
+        report.remote_calls = _count_remote_calls(
+            envs, len(report.remote_secrets) - len(report.cache_hits)
+        )
+
+        for envname in applied:
+            sources[envname] = os.fspath(entry.config_filepath)
+
+        reports.append(report)
+
+    return PlanReport(
+        config_filepaths=plan.config_filepaths,
+        envs=reports,
+        errors=[str(error) for error in plan.errors],
+        remote_secrets=len(
+            {key for report in reports for key in report.remote_secrets}
+        ),
+        cache_hits=sum(len(report.cache_hits) for report in reports),
+        remote_calls=sum(report.remote_calls for report in reports),
+    )
+
+
+def _envnames(envs: EnvsV1) -> list[str]:
+    return list(envs._items if isinstance(envs, LocalEnvsV1) else envs.items)
+
+
+def _remote_secrets(envs: EnvsV1, envnames: list[str]) -> Mapping[str, bool]:
+    """
+    Cache keys of the remote secrets of the env names, and whether they may be cached.
+    """
+
+    match envs:
+        case GoogleCloudSecretManagerEnvsV1():
+            secret_items = envs.secret_items
+            return {
+                secret_items[envname]: is_cacheable_secret(
+                    envs.cache,
+                    latest=secret_items[envname].endswith("/versions/latest"),
+                )
+                for envname in envnames
+            }
+
+        case BitwardenSecretsManagerEnvsV1():
+            return {
+                bitwarden_cache_key(
+                    envs, envs.items[envname].lower()
+                ): is_cacheable_secret(envs.cache)
+                for envname in envnames
+            }
+
+        case ProviderEnvsV1():
+            from envix.provider import get_provider_class
+
+            cacheable = get_provider_class(envs.type).cacheable and is_cacheable_secret(
+                envs.cache
+            )
+
+            return {
+                provider_cache_key(envs, envs.items[envname]): cacheable
+                for envname in envnames
+            }
+
+        case _:
+            return {}
+
+
+def _is_cache_hit(secret_cache: SecretCache | None, key: str) -> bool:
+    if secret_cache is None:
+        return False
+
+    entry = secret_cache.get(key)
+
+    return entry is not None and not entry.is_expired
+
+
+def _count_remote_calls(envs: EnvsV1, misses: int) -> int:
+    """
+    Secret Manager is called once per secret, and the other backends once per block.
+    """
+
+    if isinstance(envs, GoogleCloudSecretManagerEnvsV1):
+        return misses
+
+    return min(misses, 1)
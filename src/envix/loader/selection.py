@@ -0,0 +1,84 @@
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Self
+
+from pydantic import BaseModel, ConfigDict
+
+from envix.exception import EnvixSelectionError
+
+
+class EnvnameSelection(BaseModel):
+    """
+    Env names to load, given by `--only`, `--only-prefix` and `--allowlist-file`.
+
+    It is applied to the plan, so the items which are not selected are never resolved.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    names: frozenset[str] = frozenset()
+    prefixes: tuple[str, ...] = ()
+
+    def __contains__(self, envname: object) -> bool:
+        return isinstance(envname, str) and (
+            envname in self.names or envname.startswith(self.prefixes)
+        )
+
+    def with_names(self, names: Iterable[str]) -> Self:
+        return self.model_copy(update={"names": self.names | frozenset(names)})
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        only: Iterable[str] | None = None,
+        only_prefix: Iterable[str] | None = None,
+        allowlist_file: Path | None = None,
+    ) -> Self | None:
+        """
+        Create the selection of the options. None when nothing is given, that is, every env is loaded.
+
+        `only` accepts comma-separated names.
+        """
+
+        if only is None and only_prefix is None and allowlist_file is None:
+            return None
+
+        names = {
+            name
+            for value in only or []
+            for name in map(str.strip, value.split(","))
+            if name
+        }
+        prefixes = set(only_prefix or [])
+
+        if allowlist_file is not None:
+            allowlist_names, allowlist_prefixes = _read_allowlist(allowlist_file)
+            names |= allowlist_names
+            prefixes |= allowlist_prefixes
+
+        return cls(names=frozenset(names), prefixes=tuple(sorted(prefixes)))
+
+
+def _read_allowlist(filepath: Path) -> tuple[set[str], set[str]]:
+    """
+    One env name per line. Names ending with `*` are prefixes, and `#` starts a comment.
+    """
+
+    try:
+        lines = filepath.read_text().splitlines()
+    except OSError as e:
+        raise EnvixSelectionError(f"Failed to read the allowlist: {filepath}, {e}")
+
+    names: set[str] = set()
+    prefixes: set[str] = set()
+    for line in lines:
+        if not (line := line.split("#", 1)[0].strip()):
+            continue
+
+        if line.endswith("*"):
+            prefixes.add(line.removesuffix("*"))
+        else:
+            names.add(line)
+
+    return names, prefixes
@@ -0,0 +1,191 @@
+import asyncio
+import os
+from collections.abc import Callable, Iterable
+from logging import getLogger
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from envix.cache.secret_cache import SecretCache
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
+from envix.default import (
+    DEFAULT_BITWARDEN_SECRETS_MANAGER_CONCURRENCY,
+    DEFAULT_GOOGLE_CLOUD_SECRET_MANAGER_CONCURRENCY,
+)
+from envix.envname import ENVIX_GCP_ENDPOINT
+from envix.types import ResolvedSecrets
+
+if TYPE_CHECKING:
+    from google.cloud import secretmanager
+
+    from envix.loader.bitwarden_secrets_manager import BitwardenSecretsManagerClient
+    from envix.provider import EnvsProvider
+
+BitwardenSecretsManagerClientFactory = Callable[..., "BitwardenSecretsManagerClient"]
+
+logger = getLogger(__name__)
+
+
+class LoaderSession:
+    """
+    Clients and caches shared by every envs block and include while loading secrets.
+
+    Clients are created lazily on first use and closed when the session ends.
+    """
+
+    def __init__(
+        self,
+        *,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        persist_cache: bool = True,
+        default_cache: SecretCacheV1 | None = None,
+        memoize: bool = False,
+        google_cloud_secret_manager_endpoint: str | None = None,
+        google_cloud_secret_manager_concurrency: int = DEFAULT_GOOGLE_CLOUD_SECRET_MANAGER_CONCURRENCY,
+        bitwarden_secrets_manager_concurrency: int = DEFAULT_BITWARDEN_SECRETS_MANAGER_CONCURRENCY,
+        bitwarden_secrets_manager_client_factory: BitwardenSecretsManagerClientFactory
+        | None = None,
+    ) -> None:
+        # Endpoint of Secret Manager, which defaults to `ENVIX_GCP_ENDPOINT`.
+        self.google_cloud_secret_manager_endpoint = (
+            google_cloud_secret_manager_endpoint or os.getenv(ENVIX_GCP_ENDPOINT)
+        )
+        self.secret_cache = (
+            SecretCache(
+                refresh=refresh_cache,
+                # Values of another endpoint never mix with the real ones on disk.
+                persist=persist_cache and not self.google_cloud_secret_manager_endpoint,
+            )
+            if use_cache
+            else None
+        )
+        # Cache settings of the envs blocks which have none in their config.
+        self.default_cache = default_cache
+        # Resolved envs blocks keyed by their config file and content,
+        # reused across loads until their config file changes.
+        self.resolved_envs: dict[tuple[Path, str], ResolvedSecrets] | None = (
+            {} if memoize else None
+        )
+        # Resolved versions of the latest secrets, to tell when they are rotated.
+        self.secret_versions: dict[str, str] = {}
+        self._google_cloud_secret_manager_client: (
+            secretmanager.SecretManagerServiceAsyncClient | None
+        ) = None
+        self.google_cloud_secret_manager_client_count = 0
+        # Shared by every envs block, since the quota is per project and not per block.
+        self.google_cloud_secret_manager_semaphore = asyncio.Semaphore(
+            google_cloud_secret_manager_concurrency
+        )
+        self._bitwarden_secrets_manager_client_factory = (
+            bitwarden_secrets_manager_client_factory
+        )
+        self._bitwarden_secrets_manager_clients: dict[
+            tuple[str, str | None, str | None], BitwardenSecretsManagerClient
+        ] = {}
+        self._bitwarden_secrets_manager_lock = asyncio.Lock()
+        self.bitwarden_secrets_manager_client_count = 0
+        self.bitwarden_secrets_manager_semaphore = asyncio.Semaphore(
+            bitwarden_secrets_manager_concurrency
+        )
+        self._providers: dict[str, EnvsProvider] = {}
+
+    async def get_bitwarden_secrets_manager_client(
+        self,
+        access_token: str,
+        *,
+        api_url: str | None = None,
+        identity_url: str | None = None,
+    ) -> "BitwardenSecretsManagerClient":
+        """
+        Log in once per access token and server, even if many envs blocks refer to them.
+        """
+
+        key = (access_token, api_url, identity_url)
+        async with self._bitwarden_secrets_manager_lock:
+            if key not in self._bitwarden_secrets_manager_clients:
+                factory = self._bitwarden_secrets_manager_client_factory
+                if factory is None:
+                    from envix.loader.bitwarden_secrets_manager import (
+                        BitwardenSecretsManagerClient,
+                    )
+
+                    factory = BitwardenSecretsManagerClient
+
+                self._bitwarden_secrets_manager_clients[key] = await asyncio.to_thread(
+                    factory,
+                    access_token,
+                    api_url=api_url,
+                    identity_url=identity_url,
+                )
+                self.bitwarden_secrets_manager_client_count += 1
+
+        return self._bitwarden_secrets_manager_clients[key]
+
+    def get_provider(self, type: str) -> "EnvsProvider":
+        """
+        Create the provider of the type once, so that its clients are shared by the envs blocks.
+        """
+
+        if type not in self._providers:
+            from envix.provider import get_provider_class
+
+            self._providers[type] = get_provider_class(type)()
+
+        return self._providers[type]
+
+    @property
+    def google_cloud_secret_manager_client(
+        self,
+    ) -> "secretmanager.SecretManagerServiceAsyncClient":
+        if self._google_cloud_secret_manager_client is None:
+            from envix.loader.google_cloud_secret_manager import (
+                create_secret_manager_client,
+            )
+
+            self._google_cloud_secret_manager_client = create_secret_manager_client(
+                self.google_cloud_secret_manager_endpoint
+            )
+            self.google_cloud_secret_manager_client_count += 1
+
+        return self._google_cloud_secret_manager_client
+
+    def invalidate(self, config_filepaths: Iterable[Path]) -> None:
+        """
+        Forget the resolved envs blocks of the changed config files.
+        """
+
+        if self.resolved_envs is None:
+            return
+
+        changed = set(config_filepaths)
+        for key in [key for key in self.resolved_envs if key[0] in changed]:
+            del self.resolved_envs[key]
+
+    async def close(self) -> None:
+        if self._google_cloud_secret_manager_client is not None:
+            await self._google_cloud_secret_manager_client.transport.close()
+            self._google_cloud_secret_manager_client = None
+
+        for provider in self._providers.values():
+            await provider.close()
+        self._providers.clear()
+
+        logger.debug(
+            "Google Cloud Secret Manager clients created: "
+            f"{self.google_cloud_secret_manager_client_count}"
+        )
+
+        if self.secret_cache is not None:
+            logger.debug(f"Secret cache: {self.secret_cache.stats}")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
@@ -1,132 +1,743 @@
 import asyncio
+import hashlib
+import json
 import os
+from logging import getLogger
+from pathlib import Path
 from typing import TYPE_CHECKING, assert_never
 
 from pydantic import SecretStr
 
+from envix.cache.secret_cache import SecretCache
 from envix.config.v1.envs import EnvsV1
+from envix.config.v1.envs.bitwarden_secrets_manager_envs_v1 import (
+    BitwardenSecretsManagerEnvsV1,
+)
 from envix.config.v1.envs.file_envs_v1 import FileEnvsV1
 from envix.config.v1.envs.google_cloud_secret_manager_envs_v1 import (
     GoogleCloudSecretManagerEnvsV1,
 )
 from envix.config.v1.envs.local_envs_v1 import LocalEnvsV1
+from envix.config.v1.envs.provider_envs_v1 import ProviderEnvsV1
 from envix.config.v1.envs.raw_envs_v1 import RawEnvsV1
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
+from envix.default import (
+    DEFAULT_BITWARDEN_SECRETS_MANAGER_CONCURRENCY,
+    DEFAULT_GOOGLE_CLOUD_SECRET_MANAGER_CONCURRENCY,
+)
 from envix.exception import (
+    EnvixBitwardenSecretsManagerError,
     EnvixEnvInjectionError,
     EnvixEnvironmentFileLoadError,
+    EnvixEnvironmentFileTooLargeError,
     EnvixEnvironmentNotSetting,
     EnvixGoogleCloudSecretManagerError,
+    EnvixProviderError,
 )
-from envix.types import Secrets
+from envix.loader.session import LoaderSession
+from envix.trace import span
+from envix.types import Environ, ResolvedSecrets, Secrets
 
 if TYPE_CHECKING:
+    from google.api_core.retry import AsyncRetry
     from google.cloud import secretmanager
 
+    from envix.loader.bitwarden_secrets_manager import BitwardenSecretsManagerClient
 
-async def load_raw_envs_v1(
-    envs: RawEnvsV1,
+logger = getLogger(__name__)
+
+# Envs whose values do not depend on the environment, so they can be resolved ahead.
+PrefetchableEnvsV1 = (
+    RawEnvsV1
+    | FileEnvsV1
+    | GoogleCloudSecretManagerEnvsV1
+    | BitwardenSecretsManagerEnvsV1
+    | ProviderEnvsV1
+)
+
+
+def _is_skipped(envs: EnvsV1, envname: str, environ: Environ) -> bool:
+    return not envs.overwrite and envname in environ
+
+
+def is_cacheable_secret(
+    cache_settings: SecretCacheV1 | None, *, latest: bool = True
+) -> bool:
+    """
+    Pinned versions are cached whenever the cache is set,
+    and the latest versions only when they are enabled with a TTL.
+    """
+
+    if cache_settings is None:
+        return False
+
+    if latest:
+        return cache_settings.latest and cache_settings.ttl > 0
+
+    return True
+
+
+def apply_envs_v1(
+    envs: PrefetchableEnvsV1,
+    resolved: ResolvedSecrets,
+    environ: Environ | None = None,
 ) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    """
+    Select the resolved values to set on the environment, following the `overwrite` setting.
+
+    The environment itself is not changed. Merging the values is left to the caller.
+    """
+
+    environ = os.environ if environ is None else environ
+
     secrets: Secrets = {}
     errors: list[EnvixEnvInjectionError] = []
+    resolved_secrets, resolved_errors = resolved
+
+    for envname in envs.items:
+        if _is_skipped(envs, envname, environ):
+            continue
 
-    for envname, secret in envs.items.items():
-        if envs.overwrite or envname not in os.environ:
-            os.environ[envname] = secret
-            secrets[envname] = SecretStr(secret)
+        if envname in resolved_errors:
+            errors.append(resolved_errors[envname])
+
+        elif envname in resolved_secrets:
+            secrets[envname] = resolved_secrets[envname]
 
     return secrets, errors
 
 
-async def load_file_envs_v1(
+async def resolve_raw_envs_v1(envs: RawEnvsV1) -> ResolvedSecrets:
+    return {envname: SecretStr(secret) for envname, secret in envs.items.items()}, {}
+
+
+async def resolve_file_envs_v1(
     envs: FileEnvsV1,
-) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    environ: Environ | None = None,
+) -> ResolvedSecrets:
+    """
+    Read the files concurrently in threads, so that the event loop is not blocked
+    while the other envs blocks are fetched.
+    """
+
     secrets: Secrets = {}
-    errors: list[EnvixEnvInjectionError] = []
+    errors: dict[str, EnvixEnvInjectionError] = {}
+    environ = os.environ if environ is None else environ
+
+    async def resolve_file(envname: str, filepath: Path) -> None:
+        try:
+            content = await asyncio.to_thread(_read_env_file, filepath, envs.max_size)
+
+        except _FileTooLargeError:
+            errors[envname] = EnvixEnvironmentFileTooLargeError(
+                envname, filepath, envs.max_size
+            )
+
+        except Exception:
+            errors[envname] = EnvixEnvironmentFileLoadError(envname, filepath)
+
+        else:
+            secrets[envname] = SecretStr(content.strip())
+
+    await asyncio.gather(
+        *(
+            resolve_file(envname, filepath)
+            for envname, filepath in envs.items.items()
+            if not _is_skipped(envs, envname, environ)
+        )
+    )
+
+    return secrets, errors
+
+
+class _FileTooLargeError(Exception):
+    pass
+
+
+def _read_env_file(filepath: Path, max_size: int) -> str:
+    # Read in binary, since the limit is in bytes and not in characters.
+    with open(filepath, "rb") as f:
+        if os.fstat(f.fileno()).st_size > max_size:
+            raise _FileTooLargeError()
+
+        # Files such as those of procfs report no size, so the read is bounded as well.
+        content = f.read(max_size + 1)
+        if len(content) > max_size:
+            raise _FileTooLargeError()
+
+    return content.decode("UTF-8")
+
+
+async def resolve_google_cloud_secret_manager_envs_v1(
+    envs: GoogleCloudSecretManagerEnvsV1,
+    environ: Environ | None = None,
+    *,
+    client: "secretmanager.SecretManagerServiceAsyncClient | None" = None,
+    session: LoaderSession | None = None,
+) -> ResolvedSecrets:
+    from envix.loader.google_cloud_secret_manager import create_secret_manager_client
+
+    secrets: Secrets = {}
+    errors: dict[str, EnvixEnvInjectionError] = {}
+    environ = os.environ if environ is None else environ
+    secret_cache = session.secret_cache if session else None
+    cache_settings = envs.cache or (session.default_cache if session else None)
+    semaphore = (
+        session.google_cloud_secret_manager_semaphore
+        if session
+        else asyncio.Semaphore(DEFAULT_GOOGLE_CLOUD_SECRET_MANAGER_CONCURRENCY)
+    )
+    retry = _google_cloud_secret_manager_retry()
 
-    for envname, filepath in envs.items.items():
-        if envs.overwrite or envname not in os.environ:
+    def get_client() -> "secretmanager.SecretManagerServiceAsyncClient":
+        nonlocal client
+        if client is None:
+            client = (
+                session.google_cloud_secret_manager_client
+                if session
+                else create_secret_manager_client()
+            )
+
+        return client
+
+    def get_cache_ttl(secret_name: str) -> int | None:
+        """
+        Pinned versions never change, so they are cached without expiry.
+        """
+
+        if not secret_name.endswith("/versions/latest"):
+            return None
+
+        assert cache_settings is not None
+        return cache_settings.ttl
+
+    def record_version(secret_name: str, version: str | None) -> None:
+        if session and version and secret_name.endswith("/versions/latest"):
+            session.secret_versions[secret_name] = version
+
+    def is_cacheable(secret_name: str) -> bool:
+        return is_cacheable_secret(
+            cache_settings, latest=secret_name.endswith("/versions/latest")
+        )
+
+    async def get_cached_secret(
+        cache: SecretCache, secret_name: str, trace_args: dict[str, str]
+    ) -> SecretStr | None:
+        from google.api_core import exceptions
+
+        entry = cache.get(secret_name)
+
+        if entry is not None and not entry.is_expired:
+            cache.stats.hits += 1
+            trace_args["cache"] = "hit"
+            record_version(secret_name, entry.version)
+            return entry.value
+
+        if entry is not None and entry.version is not None:
+            # Revalidate the expired latest version with its metadata only.
             try:
-                with open(filepath, "r") as f:
-                    envvar = f.read().strip()
-                    os.environ[envname] = envvar
-                    secrets[envname] = SecretStr(envvar)
+                async with semaphore:
+                    version = await get_client().get_secret_version(
+                        request={"name": secret_name}, retry=retry
+                    )
+                if version.name == entry.version:
+                    cache.set(
+                        secret_name,
+                        entry.value,
+                        ttl=get_cache_ttl(secret_name),
+                        version=entry.version,
+                    )
+                    cache.stats.revalidated += 1
+                    trace_args["cache"] = "revalidated"
+                    record_version(secret_name, entry.version)
+                    return entry.value
+
+            except exceptions.GoogleAPIError as e:
+                logger.debug(f"Failed to revalidate secret cache: {secret_name}, {e}")
+
+        cache.stats.misses += 1
+        trace_args["cache"] = "miss"
+        return None
+
+    async def access_secret_version(
+        secret_name: str, trace_args: dict[str, str]
+    ) -> SecretStr:
+        cache = secret_cache if is_cacheable(secret_name) else None
+        if (
+            cache is not None
+            and (secret := await get_cached_secret(cache, secret_name, trace_args))
+            is not None
+        ):
+            return secret
+
+        async with semaphore:
+            response = await get_client().access_secret_version(
+                request={"name": secret_name}, retry=retry
+            )
+        secret = SecretStr(response.payload.data.decode("UTF-8"))
+        record_version(secret_name, response.name)
+
+        if cache is not None:
+            cache.set(
+                secret_name,
+                secret,
+                ttl=get_cache_ttl(secret_name),
+                version=response.name,
+            )
+
+        return secret
+
+    async def resolve_secret(secret_name: str, envnames: list[str]) -> None:
+        try:
+            with span(
+                "access_secret_version",
+                "secret",
+                secret=secret_name,
+                envnames=",".join(envnames),
+            ) as trace_args:
+                secret = await access_secret_version(secret_name, trace_args)
+
+        except Exception as e:
+            for envname in envnames:
+                errors[envname] = EnvixGoogleCloudSecretManagerError(envname, e)
+            return
+
+        for envname in envnames:
+            secrets[envname] = secret
+
+    # Env names which refer to the same secret version share a single RPC.
+    envnames_by_secret_name: dict[str, list[str]] = {}
+    for envname, secret_name in envs.secret_items.items():
+        if not _is_skipped(envs, envname, environ):
+            envnames_by_secret_name.setdefault(secret_name, []).append(envname)
+
+    await asyncio.gather(
+        *(
+            resolve_secret(secret_name, envnames)
+            for secret_name, envnames in envnames_by_secret_name.items()
+        ),
+    )
+
+    return secrets, errors
+
+
+async def resolve_bitwarden_secrets_manager_envs_v1(
+    envs: BitwardenSecretsManagerEnvsV1,
+    environ: Environ | None = None,
+    *,
+    client: "BitwardenSecretsManagerClient | None" = None,
+    session: LoaderSession | None = None,
+) -> ResolvedSecrets:
+    """
+    Fetch every secret of the block which is not cached with a single `get_by_ids` call.
+
+    Secrets have no versions, so they are cached as the latest versions.
+    The access token is read from the environment given, e.g. the one with the .env values.
+    """
+
+    from envix.loader.bitwarden_secrets_manager import (
+        BitwardenSecretsManagerRequestError,
+    )
+
+    secrets: Secrets = {}
+    errors: dict[str, EnvixEnvInjectionError] = {}
+    environ = os.environ if environ is None else environ
+    cache_settings = envs.cache or (session.default_cache if session else None)
+    cache = (
+        session.secret_cache
+        if session and is_cacheable_secret(cache_settings)
+        else None
+    )
+    semaphore = (
+        session.bitwarden_secrets_manager_semaphore
+        if session
+        else asyncio.Semaphore(DEFAULT_BITWARDEN_SECRETS_MANAGER_CONCURRENCY)
+    )
+
+    # Env names which refer to the same secret share a single entry of the request.
+    envnames_by_secret_id: dict[str, list[str]] = {}
+    for envname, secret_id in envs.items.items():
+        if not _is_skipped(envs, envname, environ):
+            envnames_by_secret_id.setdefault(secret_id.lower(), []).append(envname)
+
+    def set_secret(secret_id: str, secret: SecretStr) -> None:
+        for envname in envnames_by_secret_id[secret_id]:
+            secrets[envname] = secret
+
+    def set_error(secret_id: str, error: Exception) -> None:
+        for envname in envnames_by_secret_id[secret_id]:
+            errors[envname] = EnvixBitwardenSecretsManagerError(envname, error)
+
+    secret_ids: list[str] = []
+    for secret_id in envnames_by_secret_id:
+        entry = cache.get(bitwarden_cache_key(envs, secret_id)) if cache else None
+        if cache is not None and entry is not None and not entry.is_expired:
+            cache.stats.hits += 1
+            set_secret(secret_id, entry.value)
+            continue
+
+        if cache is not None:
+            cache.stats.misses += 1
+        secret_ids.append(secret_id)
+
+    if not secret_ids:
+        return secrets, errors
+
+    try:
+        with span("get_by_ids", "secret", secret=",".join(secret_ids)):
+            access_token = environ.get(envs.access_token_envname)
+            if not access_token:
+                raise EnvixEnvironmentNotSetting(envs.access_token_envname)
+
+            if client is None:
+                client = (
+                    await session.get_bitwarden_secrets_manager_client(
+                        access_token,
+                        api_url=envs.api_url,
+                        identity_url=envs.identity_url,
+                    )
+                    if session
+                    else await asyncio.to_thread(
+                        _create_bitwarden_secrets_manager_client, envs, access_token
+                    )
+                )
+
+            async with semaphore:
+                values = await asyncio.to_thread(client.get_by_ids, secret_ids)
+
+    except (EnvixEnvironmentNotSetting, BitwardenSecretsManagerRequestError) as e:
+        for secret_id in secret_ids:
+            set_error(secret_id, e)
 
-            except Exception:
-                errors.append(EnvixEnvironmentFileLoadError(envname, filepath))
+        return secrets, errors
+
+    for secret_id in secret_ids:
+        if secret_id not in values:
+            set_error(secret_id, KeyError(f"Secret not found: {secret_id}"))
+            continue
+
+        secret = SecretStr(values[secret_id])
+        set_secret(secret_id, secret)
+
+        if cache is not None and cache_settings is not None:
+            cache.set(
+                bitwarden_cache_key(envs, secret_id), secret, ttl=cache_settings.ttl
+            )
 
     return secrets, errors
 
 
+async def resolve_provider_envs_v1(
+    envs: ProviderEnvsV1,
+    environ: Environ | None = None,
+    *,
+    session: LoaderSession | None = None,
+) -> ResolvedSecrets:
+    """
+    Resolve every item of the block which is not cached with a single call of the provider.
+
+    Values of cacheable providers are cached as the latest versions, keyed by their references.
+    """
+
+    secrets: Secrets = {}
+    errors: dict[str, EnvixEnvInjectionError] = {}
+    environ = os.environ if environ is None else environ
+
+    try:
+        if session is not None:
+            provider = session.get_provider(envs.type)
+        else:
+            from envix.provider import get_provider_class
+
+            provider = get_provider_class(envs.type)()
+
+    except Exception as e:
+        # Providers are third-party code, so any failure is an error of the block,
+        # and its traceback is logged with --verbose for the provider authors.
+        logger.debug(f"Failed to create the {envs.type} provider.", exc_info=True)
+        for envname in envs.items:
+            errors[envname] = EnvixProviderError(envname, envs.type, e)
+
+        return secrets, errors
+
+    # The provider created for this block is closed however the block ends.
+    try:
+        cache_settings = envs.cache or (session.default_cache if session else None)
+        cache = (
+            session.secret_cache
+            if session and provider.cacheable and is_cacheable_secret(cache_settings)
+            else None
+        )
+
+        items: dict[str, object] = {}
+        for envname, ref in envs.items.items():
+            if _is_skipped(envs, envname, environ):
+                continue
+
+            entry = cache.get(provider_cache_key(envs, ref)) if cache else None
+            if cache is not None and entry is not None and not entry.is_expired:
+                cache.stats.hits += 1
+                secrets[envname] = entry.value
+                continue
+
+            if cache is not None:
+                cache.stats.misses += 1
+            items[envname] = ref
+
+        if not items:
+            return secrets, errors
+
+        try:
+            with span("resolve", "provider", type=envs.type):
+                values = await provider.resolve(envs.settings, items)
+
+        except Exception as e:
+            logger.debug(f"Failed to resolve the {envs.type} envs.", exc_info=True)
+            for envname in items:
+                errors[envname] = EnvixProviderError(envname, envs.type, e)
+
+            return secrets, errors
+
+        for envname, ref in items.items():
+            if envname not in values:
+                errors[envname] = EnvixProviderError(
+                    envname, envs.type, KeyError(f"Value not found: {envname}")
+                )
+                continue
+
+            secret = SecretStr(values[envname])
+            secrets[envname] = secret
+
+            if cache is not None and cache_settings is not None:
+                cache.set(provider_cache_key(envs, ref), secret, ttl=cache_settings.ttl)
+
+        return secrets, errors
+
+    finally:
+        if session is None:
+            await provider.close()
+
+
+def provider_cache_key(envs: ProviderEnvsV1, ref: object) -> str:
+    """
+    The references are unique only within the settings of the block, e.g. the server,
+    so a digest of the settings is a part of the key.
+    References which JSON does not support are keyed by their repr.
+    """
+
+    settings = envs.settings.model_dump_json(exclude={"items"})
+    digest = hashlib.sha256(settings.encode("UTF-8")).hexdigest()
+
+    return f"{envs.type}/{digest}/{json.dumps(ref, sort_keys=True, default=repr)}"
+
+
+def bitwarden_cache_key(envs: BitwardenSecretsManagerEnvsV1, secret_id: str) -> str:
+    """
+    The secret ids are unique only within the server, so its urls are a part of the key.
+    """
+
+    server = json.dumps([envs.api_url, envs.identity_url])
+
+    return f"bitwarden/{server}/{secret_id}"
+
+
+def _create_bitwarden_secrets_manager_client(
+    envs: BitwardenSecretsManagerEnvsV1, access_token: str
+) -> "BitwardenSecretsManagerClient":
+    from envix.loader.bitwarden_secrets_manager import BitwardenSecretsManagerClient
+
+    return BitwardenSecretsManagerClient(
+        access_token, api_url=envs.api_url, identity_url=envs.identity_url
+    )
+
+
+async def check_google_cloud_secret_manager_versions(
+    session: LoaderSession,
+) -> set[str]:
+    """
+    Return the latest secrets of the session whose versions have changed since they were resolved.
+
+    Only the version metadata is fetched, not the payloads.
+    """
+
+    from google.api_core import exceptions
+
+    retry = _google_cloud_secret_manager_retry()
+
+    async def is_rotated(secret_name: str, version: str) -> bool:
+        try:
+            async with session.google_cloud_secret_manager_semaphore:
+                response = (
+                    await session.google_cloud_secret_manager_client.get_secret_version(
+                        request={"name": secret_name}, retry=retry
+                    )
+                )
+
+        except exceptions.GoogleAPIError as e:
+            logger.debug(f"Failed to check secret version: {secret_name}, {e}")
+            return False
+
+        return response.name != version
+
+    secret_versions = list(session.secret_versions.items())
+    rotated = await asyncio.gather(
+        *(is_rotated(secret_name, version) for secret_name, version in secret_versions)
+    )
+
+    return {
+        secret_name
+        for (secret_name, _), is_changed in zip(secret_versions, rotated)
+        if is_changed
+    }
+
+
+def _google_cloud_secret_manager_retry() -> "AsyncRetry":
+    """
+    Retry on quota errors with a jittered exponential backoff.
+
+    The default retry of the client starts at 2 seconds,
+    which is too long for a command wrapper.
+    """
+
+    from google.api_core import exceptions
+    from google.api_core.retry import AsyncRetry, if_exception_type
+
+    return AsyncRetry(
+        predicate=if_exception_type(
+            exceptions.ResourceExhausted,
+            exceptions.ServiceUnavailable,
+        ),
+        initial=0.1,
+        maximum=5.0,
+        multiplier=2.0,
+        deadline=30.0,
+    )
+
+
+async def resolve_envs_v1(
+    envs: PrefetchableEnvsV1,
+    environ: Environ,
+    session: LoaderSession | None = None,
+) -> ResolvedSecrets:
+    match envs:
+        case RawEnvsV1():
+            return await resolve_raw_envs_v1(envs)
+
+        case FileEnvsV1():
+            return await resolve_file_envs_v1(envs, environ)
+
+        case GoogleCloudSecretManagerEnvsV1():
+            return await resolve_google_cloud_secret_manager_envs_v1(
+                envs, environ, session=session
+            )
+
+        case BitwardenSecretsManagerEnvsV1():
+            return await resolve_bitwarden_secrets_manager_envs_v1(
+                envs, environ, session=session
+            )
+
+        case ProviderEnvsV1():
+            return await resolve_provider_envs_v1(envs, environ, session=session)
+
+        case _:
+            assert_never(envs)
+
+
+async def load_raw_envs_v1(
+    envs: RawEnvsV1,
+    environ: Environ | None = None,
+) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    return apply_envs_v1(envs, await resolve_raw_envs_v1(envs), environ)
+
+
+async def load_file_envs_v1(
+    envs: FileEnvsV1,
+    environ: Environ | None = None,
+) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    return apply_envs_v1(envs, await resolve_file_envs_v1(envs, environ), environ)
+
+
 async def load_local_envs_v1(
     envs: LocalEnvsV1,
+    environ: Environ | None = None,
 ) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
     secrets: Secrets = {}
     errors: list[EnvixEnvInjectionError] = []
+    environ = os.environ if environ is None else environ
 
     for envname, envvar in envs._items.items():
-        if envvar not in os.environ:
+        if envvar not in environ:
             errors.append(EnvixEnvironmentNotSetting(envvar))
             continue
 
-        if envs.overwrite or envname not in os.environ:
-            os.environ[envname] = os.environ[envvar]
-            secrets[envname] = SecretStr(os.environ[envvar])
+        if envs.overwrite or envname not in environ:
+            secrets[envname] = SecretStr(environ[envvar])
 
     return secrets, errors
 
 
 async def load_google_cloud_secret_manager_envs_v1(
     envs: GoogleCloudSecretManagerEnvsV1,
+    environ: Environ | None = None,
     *,
     client: "secretmanager.SecretManagerServiceAsyncClient | None" = None,
 ) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
-    from google.cloud import secretmanager
-
-    secrets: Secrets = {}
-    errors: list[EnvixEnvInjectionError] = []
-    client = client or secretmanager.SecretManagerServiceAsyncClient()
-
-    async def access_secret_version(envname: str, secret_name: str):
-        if envs.overwrite or envname not in os.environ:
-            try:
-                response = await client.access_secret_version(
-                    request={"name": secret_name}
-                )
-                envvar = response.payload.data.decode("UTF-8")
-                os.environ[envname] = envvar
-                secrets[envname] = SecretStr(envvar)
+    return apply_envs_v1(
+        envs,
+        await resolve_google_cloud_secret_manager_envs_v1(envs, environ, client=client),
+        environ,
+    )
 
-            except Exception as e:
-                errors.append(EnvixGoogleCloudSecretManagerError(envname, e))
 
-    await asyncio.gather(
-        *(
-            access_secret_version(envname, secret_name)
-            for envname, secret_name in envs.secret_items.items()
-        ),
+async def load_bitwarden_secrets_manager_envs_v1(
+    envs: BitwardenSecretsManagerEnvsV1,
+    environ: Environ | None = None,
+    *,
+    client: "BitwardenSecretsManagerClient | None" = None,
+) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    return apply_envs_v1(
+        envs,
+        await resolve_bitwarden_secrets_manager_envs_v1(envs, environ, client=client),
+        environ,
     )
 
-    return secrets, errors
+
+async def load_provider_envs_v1(
+    envs: ProviderEnvsV1,
+    environ: Environ | None = None,
+) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    return apply_envs_v1(envs, await resolve_provider_envs_v1(envs, environ), environ)
 
 
 async def load_envs_v1(
     envs: EnvsV1,
     google_cloud_secret_manager_client: "secretmanager.SecretManagerServiceAsyncClient | None" = None,
+    environ: Environ | None = None,
 ) -> tuple[Secrets, list[EnvixEnvInjectionError]]:
+    """
+    Load the envs block. The values are returned and not set on the environment.
+    """
+
     match envs:
         case RawEnvsV1():
-            return await load_raw_envs_v1(envs)
+            return await load_raw_envs_v1(envs, environ)
 
         case FileEnvsV1():
-            return await load_file_envs_v1(envs)
+            return await load_file_envs_v1(envs, environ)
 
         case LocalEnvsV1():
-            return await load_local_envs_v1(envs)
+            return await load_local_envs_v1(envs, environ)
 
         case GoogleCloudSecretManagerEnvsV1():
             return await load_google_cloud_secret_manager_envs_v1(
-                envs, client=google_cloud_secret_manager_client
+                envs, environ, client=google_cloud_secret_manager_client
             )
 
+        case BitwardenSecretsManagerEnvsV1():
+            return await load_bitwarden_secrets_manager_envs_v1(envs, environ)
+
+        case ProviderEnvsV1():
+            return await load_provider_envs_v1(envs, environ)
+
         case _:
             assert_never(envs)
@@ -1,8 +1,16 @@
 import os
+from logging import getLogger
 from pathlib import Path
+from typing import Final
 
-from envix.envname import ENVIX_CONFIG_DIR
+from envix.envname import ENVIX_AGENT_SOCKET, ENVIX_CONFIG_DIR
 from envix.exception import EnvixConfigFileNotFound
+from envix.trace import span
+
+logger = getLogger(__name__)
+
+# Config file names searched from the working directory up to the root, in order.
+CONFIG_FILENAMES: Final = ("envix.yml", "envix.yaml", "envix.toml", "envix.json")
 
 
 def get_user_config_path(name: str, *, exist_ok=False) -> Path:
@@ -25,15 +33,7 @@ def list_user_config() -> list[Path]:
 
 
 def get_user_config_dir() -> Path:
-    config_dir: Path
-    if path := os.getenv(ENVIX_CONFIG_DIR):
-        config_dir = Path(path)
-
-    elif path := os.getenv("XDG_CONFIG_HOME"):
-        config_dir = Path(path).joinpath("envix")
-
-    else:
-        config_dir = Path.home().joinpath(".config/envix")
+    config_dir = _user_config_dir()
 
     if not config_dir.exists():
         config_dir.mkdir(parents=True, exist_ok=True)
@@ -41,6 +41,17 @@ def get_user_config_dir() -> Path:
     return config_dir
 
 
+def _user_config_dir() -> Path:
+    if path := os.getenv(ENVIX_CONFIG_DIR):
+        return Path(path)
+
+    elif path := os.getenv("XDG_CONFIG_HOME"):
+        return Path(path).joinpath("envix")
+
+    else:
+        return Path.home().joinpath(".config/envix")
+
+
 def get_registerd_config_dir() -> Path:
     registerd_config_dir = get_user_config_dir().joinpath("registered")
 
@@ -48,3 +59,57 @@ def get_registerd_config_dir() -> Path:
         registerd_config_dir.mkdir(parents=True, exist_ok=True)
 
     return registerd_config_dir
+
+
+def get_user_cache_dir(*, create: bool = True) -> Path:
+    cache_dir = _user_config_dir().joinpath("cache")
+
+    if create and not cache_dir.exists():
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    return cache_dir
+
+
+def get_agent_socket_path() -> Path:
+    """
+    The directory is not created, so that looking for the agent never writes anything.
+    """
+
+    if path := os.getenv(ENVIX_AGENT_SOCKET):
+        return Path(path)
+
+    return _user_config_dir().joinpath("agent.sock")
+
+
+def find_config_file() -> Path | None:
+    from envix.cache.discovery_cache import discovery_cache
+
+    with span("find_config_file", "config"):
+        config_filepath = discovery_cache.find(Path(os.getcwd()), CONFIG_FILENAMES)
+
+    if config_filepath is not None:
+        logger.debug(f"Found config file: {config_filepath}")
+
+    return config_filepath
+
+
+def collect_config_filepaths(
+    config_filepath: Path | None, config_names: list[str] | None = None
+) -> list[Path]:
+    """
+    The config files are looked up apart from `envix.config`,
+    so that the models are not imported when there is no config to load.
+    """
+
+    config_filepaths = [
+        get_user_config_path(config_name) for config_name in config_names or []
+    ]
+
+    if config_filepath:
+        config_filepaths = [config_filepath] + config_filepaths
+
+    if not config_filepaths:
+        if config_path := find_config_file():
+            config_filepaths.append(config_path)
+
+    return config_filepaths
@@ -0,0 +1,80 @@
+import os
+import signal
+import subprocess
+import sys
+import threading
+from collections.abc import Mapping
+from logging import getLogger
+from typing import NoReturn
+
+logger = getLogger(__name__)
+
+# Signals relayed to the child process. SIGINT is not relayed,
+# because the terminal already sends it to the whole process group.
+FORWARDED_SIGNALS = tuple(
+    getattr(signal, name)
+    for name in ("SIGTERM", "SIGHUP", "SIGQUIT", "SIGUSR1", "SIGUSR2", "SIGWINCH")
+    if hasattr(signal, name)
+)
+
+
+def can_exec() -> bool:
+    """
+    Whether the current process can be replaced by the command.
+    """
+
+    return os.name == "posix"
+
+
+def exec_command(command: list[str], env: Mapping[str, str] | None = None) -> NoReturn:
+    """
+    Replace the current process with the command.
+
+    Signals and the exit code of the command are delivered directly,
+    and nothing of envix stays resident.
+    """
+
+    logger.debug(f"Exec command: {command[0]}")
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    if env is None:
+        os.execvp(command[0], command)
+
+    else:
+        os.execvpe(command[0], command, env)
+
+
+def run_command(command: list[str], env: Mapping[str, str] | None = None) -> int:
+    """
+    Run the command as a child process and return its exit code.
+
+    Signals received by envix are relayed to the child while it is running.
+    As with shells, the exit code of a command killed by a signal is 128 + signal.
+    """
+
+    process = subprocess.Popen(command, env=env)
+
+    if threading.current_thread() is not threading.main_thread():
+        returncode = process.wait()
+
+    else:
+
+        def forward(signum: int, _frame: object) -> None:
+            process.send_signal(signum)
+
+        previous_handlers = {
+            signum: signal.signal(signum, forward) for signum in FORWARDED_SIGNALS
+        }
+        previous_sigint_handler = signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+        try:
+            returncode = process.wait()
+
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            signal.signal(signal.SIGINT, previous_sigint_handler)
+
+    return 128 - returncode if returncode < 0 else returncode
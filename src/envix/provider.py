@@ -0,0 +1,74 @@
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import Any, ClassVar, Final
+
+from pydantic import BaseModel
+
+from envix.exception import EnvixProviderNotFoundError
+
+# Entry point group of the envs providers. The name of an entry point is the `type`
+# of the envs block, and its object is the provider class.
+PROVIDER_ENTRY_POINT_GROUP: Final[str] = "envix.providers"
+
+
+class EnvsProvider(ABC):
+    """
+    Backend of an envs block type, installed as a plugin.
+
+    e.g. in `pyproject.toml` of the plugin package:
+
+    ```toml
+    [project.entry-points."envix.providers"]
+    Vault = "envix_vault:VaultProvider"
+    ```
+
+    The module of a provider is imported only when a config uses its type.
+    A provider is created once per load, so it can keep its clients across the envs blocks.
+    """
+
+    # Config model of the envs block. It is validated with the whole block,
+    # so it declares `type`, `items` and its own settings.
+    model: ClassVar[type[BaseModel]]
+
+    # Whether the values may be kept in the secret cache of envix.
+    cacheable: ClassVar[bool] = False
+
+    @abstractmethod
+    async def resolve(
+        self, envs: BaseModel, items: Mapping[str, Any]
+    ) -> Mapping[str, str]:
+        """
+        Resolve the items of the envs block at once.
+
+        `envs` is the block validated with `model`, and `items` are the env names
+        to resolve and their references. Env names missing from the result are errors.
+        """
+
+    async def close(self) -> None:
+        pass
+
+
+_providers: dict[str, type[EnvsProvider]] = {}
+
+
+def register_provider(type: str, provider: type[EnvsProvider]) -> None:
+    """
+    Register the provider in the process, without the entry point.
+    """
+
+    _providers[type] = provider
+
+
+def get_provider_class(type: str) -> type[EnvsProvider]:
+    if (provider := _providers.get(type)) is not None:
+        return provider
+
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=PROVIDER_ENTRY_POINT_GROUP, name=type):
+        provider = entry_point.load()
+        _providers[type] = provider
+
+        return provider
+
+    raise EnvixProviderNotFoundError(type)
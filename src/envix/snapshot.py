@@ -0,0 +1,208 @@
+import hashlib
+import os
+import struct
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from pydantic import BaseModel, SecretStr
+
+from envix.envname import ENVIX_SNAPSHOT_KEY
+from envix.exception import EnvixSnapshotError
+from envix.types import Secrets
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+MAGIC: Final[bytes] = b"ENVIXSNP"
+FORMAT_VERSION: Final[int] = 1
+
+_FLAG_ENCRYPTED: Final[int] = 0x01
+
+# magic, format version, flags, created at, ttl, number of config hashes
+_HEADER: Final = struct.Struct("<8sBBqIH")
+_U16: Final = struct.Struct("<H")
+_U32: Final = struct.Struct("<I")
+_DIGEST_SIZE: Final[int] = 32
+
+
+class Snapshot(BaseModel):
+    """
+    Resolved secrets, which can be replayed without the config and the remote fetches.
+
+    The binary layout is a fixed header, the SHA-256 hashes of the source configs,
+    and a table of length-prefixed names and values, which is encrypted with Fernet
+    when a key is given.
+    """
+
+    secrets: Secrets
+    created_at: int
+    # Seconds the snapshot stays fresh. It never expires when 0.
+    ttl: int = 0
+    config_hashes: dict[Path, bytes] = {}
+
+    @property
+    def is_expired(self) -> bool:
+        return self.ttl > 0 and self.created_at + self.ttl < time.time()
+
+    def is_fresh(self) -> bool:
+        """
+        Whether the snapshot is neither expired nor older than its configs.
+
+        Configs which do not exist, e.g. in a container image, are not checked.
+        """
+
+        if self.is_expired:
+            return False
+
+        for filepath, digest in self.config_hashes.items():
+            try:
+                content = filepath.read_bytes()
+            except FileNotFoundError:
+                continue
+
+            if hashlib.sha256(content).digest() != digest:
+                return False
+
+        return True
+
+    def dump(self, key: bytes | None = None) -> bytes:
+        table = bytearray(_U32.pack(len(self.secrets)))
+        for envname, secret in self.secrets.items():
+            name = envname.encode("UTF-8")
+            value = secret.get_secret_value().encode("UTF-8")
+            table += _U16.pack(len(name)) + name + _U32.pack(len(value)) + value
+
+        body = bytes(table) if key is None else _fernet(key).encrypt(bytes(table))
+
+        header = bytearray(
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                0 if key is None else _FLAG_ENCRYPTED,
+                self.created_at,
+                self.ttl,
+                len(self.config_hashes),
+            )
+        )
+        for filepath, digest in self.config_hashes.items():
+            path = os.fsencode(filepath)
+            header += _U16.pack(len(path)) + path + digest
+
+        return bytes(header) + body
+
+    @classmethod
+    def load(cls, content: bytes, key: bytes | None = None) -> "Snapshot":
+        try:
+            return cls._load(content, key)
+
+        except (struct.error, UnicodeDecodeError) as e:
+            raise EnvixSnapshotError("Broken snapshot.") from e
+
+    @classmethod
+    def _load(cls, content: bytes, key: bytes | None) -> "Snapshot":
+        magic, version, flags, created_at, ttl, config_count = _HEADER.unpack_from(
+            content
+        )
+        if magic != MAGIC:
+            raise EnvixSnapshotError("Not an envix snapshot.")
+
+        if version != FORMAT_VERSION:
+            raise EnvixSnapshotError(f"Unsupported snapshot version: {version}")
+
+        header = _Reader(content, _HEADER.size)
+        config_hashes: dict[Path, bytes] = {}
+        for _ in range(config_count):
+            filepath = Path(os.fsdecode(header.read(header.u16())))
+            config_hashes[filepath] = header.read(_DIGEST_SIZE)
+
+        body = content[header.offset :]
+        if flags & _FLAG_ENCRYPTED:
+            if key is None:
+                raise EnvixSnapshotError(
+                    f"The snapshot is encrypted. Set the key to {ENVIX_SNAPSHOT_KEY}."
+                )
+
+            body = _decrypt(key, body)
+
+        table = _Reader(body)
+        secrets: Secrets = {}
+        for _ in range(table.u32()):
+            envname = table.read(table.u16()).decode("UTF-8")
+            secrets[envname] = SecretStr(table.read(table.u32()).decode("UTF-8"))
+
+        return cls(
+            secrets=secrets,
+            created_at=created_at,
+            ttl=ttl,
+            config_hashes=config_hashes,
+        )
+
+
+class _Reader:
+    def __init__(self, content: bytes, offset: int = 0) -> None:
+        self.content = content
+        self.offset = offset
+
+    def read(self, size: int) -> bytes:
+        if self.offset + size > len(self.content):
+            raise EnvixSnapshotError("Broken snapshot.")
+
+        data = self.content[self.offset : self.offset + size]
+        self.offset += size
+
+        return data
+
+    def u16(self) -> int:
+        return _U16.unpack(self.read(_U16.size))[0]
+
+    def u32(self) -> int:
+        return _U32.unpack(self.read(_U32.size))[0]
+
+
+def create_snapshot(
+    secrets: Secrets, config_filepaths: Iterable[Path], *, ttl: int = 0
+) -> Snapshot:
+    config_hashes: dict[Path, bytes] = {}
+    for filepath in config_filepaths:
+        try:
+            config_hashes[filepath.resolve()] = hashlib.sha256(
+                filepath.read_bytes()
+            ).digest()
+        except FileNotFoundError:
+            continue
+
+    return Snapshot(
+        secrets=secrets,
+        created_at=int(time.time()),
+        ttl=ttl,
+        config_hashes=config_hashes,
+    )
+
+
+def get_snapshot_key() -> bytes | None:
+    if key := os.getenv(ENVIX_SNAPSHOT_KEY):
+        return key.encode("UTF-8")
+
+    return None
+
+
+def _fernet(key: bytes) -> "Fernet":
+    from cryptography.fernet import Fernet
+
+    try:
+        return Fernet(key)
+    except ValueError as e:
+        raise EnvixSnapshotError(f"Invalid key of {ENVIX_SNAPSHOT_KEY}.") from e
+
+
+def _decrypt(key: bytes, token: bytes) -> bytes:
+    from cryptography.fernet import InvalidToken
+
+    try:
+        return _fernet(key).decrypt(token)
+    except InvalidToken as e:
+        raise EnvixSnapshotError(
+            f"Failed to decrypt the snapshot with {ENVIX_SNAPSHOT_KEY}."
+        ) from e
@@ -0,0 +1,186 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Span:
+    """
+    Timing of a single phase.
+
+    Only names are recorded in `args`, never secret values.
+    """
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    tid: int
+    args: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1_000_000
+
+
+class Tracer:
+    """
+    Collect the spans of a run.
+
+    Tracing is enabled only within `tracing()`, so `span()` costs almost nothing otherwise.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+        self._start_ns = time.perf_counter_ns()
+        self._tids: dict[int, int] = {}
+
+    def add(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def current_tid(self) -> int:
+        """
+        Concurrent asyncio tasks get their own track, so that their spans do not overlap.
+        """
+
+        import asyncio
+
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        key = id(task) if task is not None else threading.get_ident()
+
+        return self._tids.setdefault(key, len(self._tids) + 1)
+
+    def format_table(self) -> str:
+        phases: dict[tuple[str, str], list[Span]] = {}
+        for span in self.spans:
+            phases.setdefault((span.category, span.name), []).append(span)
+
+        lines = [f"{'phase':<40} {'count':>6} {'total ms':>10} {'max ms':>10}"]
+        for (category, name), spans in phases.items():
+            lines.append(
+                f"{category + '.' + name:<40} {len(spans):>6}"
+                f" {sum(span.duration_ms for span in spans):>10.2f}"
+                f" {max(span.duration_ms for span in spans):>10.2f}"
+            )
+
+        secrets = [span for span in self.spans if span.category == "secret"]
+        if secrets:
+            lines.append("")
+            lines.append(f"{'secret':<80} {'ms':>10}")
+            for span in secrets:
+                lines.append(
+                    f"{span.args.get('secret', span.name):<80} {span.duration_ms:>10.2f}"
+                )
+
+        return "\n".join(lines)
+
+    def dump_chrome_trace(self, filepath: Path) -> None:
+        """
+        Write the spans in the Chrome trace event format,
+        which can be opened with chrome://tracing or Perfetto.
+        """
+
+        pid = os.getpid()
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self._start_ns) / 1_000,
+                "dur": span.duration_ns / 1_000,
+                "pid": pid,
+                "tid": span.tid,
+                "args": span.args,
+            }
+            for span in self.spans
+        ]
+
+        with open(filepath, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, indent=2)
+
+
+_tracer: ContextVar[Tracer | None] = ContextVar("envix_tracer", default=None)
+
+
+@contextmanager
+def trace_command(trace_file: Path | None) -> Iterator[None]:
+    """
+    Trace the block only when the timing is reported, that is, with `--verbose` or `--trace-file`.
+
+    The timing is reported when the block ends, even if it fails.
+    """
+
+    if trace_file is None and not logger.isEnabledFor(logging.DEBUG):
+        yield
+        return
+
+    with tracing() as tracer:
+        try:
+            yield
+
+        finally:
+            report_trace(tracer, trace_file)
+
+
+@contextmanager
+def tracing() -> Iterator[Tracer]:
+    tracer = Tracer()
+    token = _tracer.set(tracer)
+    try:
+        yield tracer
+
+    finally:
+        _tracer.reset(token)
+
+
+@contextmanager
+def span(name: str, category: str, **args: str) -> Iterator[dict[str, str]]:
+    """
+    Time the block as a span of the current tracer.
+
+    The yielded args can be updated within the block, e.g. with the cache status.
+    """
+
+    tracer = _tracer.get()
+    if tracer is None:
+        yield args
+        return
+
+    tid = tracer.current_tid()
+    start_ns = time.perf_counter_ns()
+    try:
+        yield args
+
+    finally:
+        tracer.add(
+            Span(
+                name=name,
+                category=category,
+                start_ns=start_ns,
+                duration_ns=time.perf_counter_ns() - start_ns,
+                tid=tid,
+                args=args,
+            )
+        )
+
+
+def report_trace(tracer: Tracer, trace_file: Path | None) -> None:
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Timing:\n{tracer.format_table()}", extra={"markup": False})
+
+    if trace_file is not None:
+        tracer.dump_chrome_trace(trace_file)
+        logger.debug(f"Trace written: {trace_file}")
@@ -1,3 +1,11 @@
+from collections.abc import Mapping
+
 from pydantic import SecretStr
 
+from envix.exception import EnvixEnvInjectionError
+
 Secrets = dict[str, SecretStr]
+
+Environ = Mapping[str, str]
+
+ResolvedSecrets = tuple[Secrets, dict[str, EnvixEnvInjectionError]]
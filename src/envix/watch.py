@@ -0,0 +1,185 @@
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import sys
+from collections.abc import Iterable
+from logging import getLogger
+from pathlib import Path
+from typing import Final
+
+logger = getLogger(__name__)
+
+# Seconds to wait for the burst of events of a single save to settle.
+DEFAULT_DEBOUNCE: Final[float] = 0.1
+
+# Seconds between the stats of the files when inotify is not available.
+DEFAULT_POLL_INTERVAL: Final[float] = 1.0
+
+_IN_NONBLOCK: Final[int] = os.O_NONBLOCK
+_IN_CLOEXEC: Final[int] = os.O_CLOEXEC
+_IN_MODIFY: Final[int] = 0x00000002
+_IN_ATTRIB: Final[int] = 0x00000004
+_IN_CLOSE_WRITE: Final[int] = 0x00000008
+_IN_MOVED_FROM: Final[int] = 0x00000040
+_IN_MOVED_TO: Final[int] = 0x00000080
+_IN_CREATE: Final[int] = 0x00000100
+_IN_DELETE: Final[int] = 0x00000200
+
+_IN_MASK: Final[int] = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+
+FileSignature = tuple[int, int, int] | None
+
+
+def _signature(filepath: Path) -> FileSignature:
+    try:
+        stat = filepath.stat()
+    except OSError:
+        return None
+
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _Inotify:
+    """
+    Minimal inotify binding, which only tells that something in the directories changed.
+    """
+
+    def __init__(self) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self.fd: int = fd
+        self._directories: set[Path] = set()
+
+    def add(self, directory: Path) -> None:
+        if directory in self._directories:
+            return
+
+        if self._add_watch(self.fd, os.fsencode(directory), _IN_MASK) < 0:
+            logger.debug(f"Failed to watch the directory: {directory}")
+            return
+
+        self._directories.add(directory)
+
+    def drain(self) -> None:
+        try:
+            while os.read(self.fd, 64 * 1024):
+                pass
+
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FileWatcher:
+    """
+    Wait for changes of the watched files.
+
+    On Linux, inotify on their directories wakes the watcher up,
+    so that a file replaced by an editor with a rename is noticed as well.
+    Otherwise, the files are polled.
+    Either way, changed files are told by their stats, not by the events.
+    """
+
+    def __init__(
+        self,
+        filepaths: Iterable[Path] = (),
+        *,
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool = sys.platform == "linux",
+    ) -> None:
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._signatures: dict[Path, FileSignature] = {}
+        self._inotify: _Inotify | None = None
+
+        if use_inotify:
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError) as e:
+                logger.debug(f"inotify is not available, polling instead: {e}")
+
+        self.update(filepaths)
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._inotify is not None
+
+    @property
+    def filepaths(self) -> list[Path]:
+        return list(self._signatures)
+
+    def update(self, filepaths: Iterable[Path]) -> None:
+        """
+        Replace the watched files, e.g. when the include graph has changed.
+        """
+
+        signatures: dict[Path, FileSignature] = {}
+        for filepath in filepaths:
+            filepath = filepath.resolve()
+            signatures[filepath] = self._signatures.get(filepath, _signature(filepath))
+
+            if self._inotify is not None:
+                self._inotify.add(filepath.parent)
+
+        self._signatures = signatures
+
+    def changed(self) -> set[Path]:
+        changed: set[Path] = set()
+        for filepath, signature in self._signatures.items():
+            if (current := _signature(filepath)) != signature:
+                self._signatures[filepath] = current
+                changed.add(filepath)
+
+        return changed
+
+    async def wait(self) -> set[Path]:
+        """
+        Wait until any of the watched files changes, and return the changed files.
+        """
+
+        while True:
+            await self._wait_event()
+            await asyncio.sleep(self.debounce)
+
+            if self._inotify is not None:
+                self._inotify.drain()
+
+            if changed := self.changed():
+                return changed
+
+    async def _wait_event(self) -> None:
+        if self._inotify is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        loop.add_reader(self._inotify.fd, event.set)
+        try:
+            await event.wait()
+
+        finally:
+            loop.remove_reader(self._inotify.fd)
+
+    def close(self) -> None:
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
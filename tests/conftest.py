@@ -1,8 +1,9 @@
 import os
 from pathlib import Path
 
+from envix.cache import config_cache, discovery_cache, secret_cache
 from envix.envname import ENVIX_CONFIG_DIR
-from pytest import fixture
+from pytest import MonkeyPatch, fixture
 
 from tests.config_builder import ConfigV1Builder
 
@@ -13,6 +14,29 @@ def setup_env(data_dir: Path) -> None:
     os.environ[ENVIX_CONFIG_DIR] = os.fspath(data_dir)
 
 
+@fixture(autouse=True)
+def cache_dir(monkeypatch: MonkeyPatch, tmp_path: Path) -> Path:
+    """キャッシュをテストごとの一時ディレクトリに書き込む。"""
+    cache_dir = tmp_path.joinpath("cache")
+
+    monkeypatch.setattr(
+        config_cache, "get_config_cache_dir", lambda: cache_dir.joinpath("configs")
+    )
+    monkeypatch.setattr(
+        discovery_cache,
+        "get_discovery_cache_path",
+        lambda: cache_dir.joinpath("discovery.json"),
+    )
+    monkeypatch.setattr(
+        secret_cache,
+        "get_secret_cache_dir",
+        lambda create=True: cache_dir.joinpath("secrets"),
+    )
+    monkeypatch.setattr(discovery_cache.discovery_cache, "_entries", None)
+
+    return cache_dir
+
+
 @fixture
 def data_dir() -> Path:
     return Path(__file__).parent.joinpath("data")
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import socket
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from envix.agent.client import request_secrets
+from envix.agent.server import AgentServer
+from envix.envname import ENVIX_AGENT_SOCKET, ENVIX_CONFIG_DIR
+from envix.exception import EnvixAgentError
+from envix.loader.session import LoaderSession
+from tests.config_builder import ConfigV1Builder
+
+
+@pytest_asyncio.fixture
+async def agent(tmp_path: Path) -> AsyncIterator[AgentServer]:
+    server = AgentServer(
+        tmp_path.joinpath("agent.sock"), LoaderSession(persist_cache=False)
+    )
+    await server.start()
+    try:
+        yield server
+
+    finally:
+        await server.close()
+
+
+def write_config(config_builder: ConfigV1Builder, tmp_path: Path) -> Path:
+    config_filepath = tmp_path.joinpath("envix.json")
+    config_filepath.write_text(config_builder.build().model_dump_json())
+
+    return config_filepath
+
+
+class TestAgent:
+    @pytest.mark.asyncio
+    async def test_request_secrets(
+        self, agent: AgentServer, config_builder: ConfigV1Builder, tmp_path: Path
+    ):
+        config_filepath = write_config(
+            config_builder.add_env("ENVIX_TEST_FOO", "1234567890"), tmp_path
+        )
+
+        resolved = await asyncio.to_thread(
+            request_secrets,
+            [config_filepath],
+            environ={},
+            socket_path=agent.socket_path,
+        )
+
+        assert resolved is not None
+        secrets, errors = resolved
+        assert secrets["ENVIX_TEST_FOO"].get_secret_value() == "1234567890"
+        assert errors == []
+
+    @pytest.mark.asyncio
+    async def test_environ_of_client(
+        self, agent: AgentServer, config_builder: ConfigV1Builder, tmp_path: Path
+    ):
+        config_builder.add_env("ENVIX_TEST_FOO", "1234567890")
+        config_builder.build().envs[0].overwrite = False
+        config_filepath = write_config(config_builder, tmp_path)
+
+        resolved = await asyncio.to_thread(
+            request_secrets,
+            [config_filepath],
+            environ={"ENVIX_TEST_FOO": "abcdefghijklmn"},
+            socket_path=agent.socket_path,
+        )
+
+        assert resolved == ({}, [])
+
+    @pytest.mark.asyncio
+    async def test_request_error(self, agent: AgentServer, tmp_path: Path):
+        with pytest.raises(EnvixAgentError, match="Config file not found"):
+            await asyncio.to_thread(
+                request_secrets,
+                [tmp_path.joinpath("not_found.yml")],
+                environ={},
+                socket_path=agent.socket_path,
+            )
+
+    @pytest.mark.asyncio
+    async def test_socket_permission(self, agent: AgentServer):
+        assert agent.socket_path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_already_running(self, agent: AgentServer):
+        with pytest.raises(EnvixAgentError, match="already running"):
+            await AgentServer(agent.socket_path, LoaderSession()).start()
+
+    def test_no_agent(self, tmp_path: Path):
+        assert request_secrets([], socket_path=tmp_path.joinpath("agent.sock")) is None
+
+    def test_stale_socket(self, tmp_path: Path):
+        socket_path = tmp_path.joinpath("agent.sock")
+        socket_path.touch()
+
+        assert request_secrets([], socket_path=socket_path) is None
+
+    def test_config_dir_not_a_directory(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv(ENVIX_AGENT_SOCKET, raising=False)
+        monkeypatch.setenv(ENVIX_CONFIG_DIR, "/dev/null/envix")
+
+        assert request_secrets([]) is None
+        assert not Path("/dev/null/envix").exists()
+
+    def test_hung_agent(self, tmp_path: Path):
+        socket_path = tmp_path.joinpath("agent.sock")
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(os.fspath(socket_path))
+            server.listen()
+
+            assert request_secrets([], socket_path=socket_path, timeout=0.1) is None
@@ -0,0 +1,83 @@
+import os
+from pathlib import Path
+
+from envix.cache.config_cache import ConfigCache
+from envix.config.config import Config
+from tests.config_builder import ConfigV1Builder
+
+
+class TestConfigCache:
+    def test_reuse_in_memory(self, config_builder: ConfigV1Builder, tmp_path: Path):
+        cache = ConfigCache(tmp_path, persist=False)
+
+        with config_builder.add_env("FOO", "1234567890").build_file() as config_file:
+            filepath = Path(config_file.name)
+            config = cache.load(
+                filepath, lambda content: Config.parse(filepath, content)
+            )
+
+            assert cache.load(filepath, _fail_parse) is config
+
+    def test_reload_changed_file(self, tmp_path: Path):
+        cache = ConfigCache(tmp_path, persist=False)
+        filepath = tmp_path.joinpath("envix.json")
+
+        filepath.write_text('{"envix": {"version": 1}}')
+        config = cache.load(filepath, lambda content: Config.parse(filepath, content))
+
+        filepath.write_text('{"envix": {"version": 1}, "includes": ["other.yml"]}')
+        reloaded = cache.load(filepath, lambda content: Config.parse(filepath, content))
+
+        assert reloaded is not config
+        assert reloaded.root.includes == [Path("other.yml")]
+
+    def test_reuse_pickle(self, tmp_path: Path):
+        filepath = tmp_path.joinpath("envix.json")
+        filepath.write_text('{"envix": {"version": 1}}')
+
+        config = ConfigCache(tmp_path, persist=True).load(
+            filepath, lambda content: Config.parse(filepath, content)
+        )
+
+        os.utime(filepath, ns=(0, 0))
+        assert ConfigCache(tmp_path, persist=True).load(filepath, _fail_parse) == config
+
+    def test_ignore_pickle_of_changed_content(self, tmp_path: Path):
+        filepath = tmp_path.joinpath("envix.json")
+        filepath.write_text('{"envix": {"version": 1}}')
+
+        ConfigCache(tmp_path, persist=True).load(
+            filepath, lambda content: Config.parse(filepath, content)
+        )
+
+        filepath.write_text('{"envix": {"version": 1}, "includes": ["other.yml"]}')
+        config = ConfigCache(tmp_path, persist=True).load(
+            filepath, lambda content: Config.parse(filepath, content)
+        )
+
+        assert config.root.includes == [Path("other.yml")]
+
+    def test_reuse_validated_content(self, tmp_path: Path):
+        cache = ConfigCache(tmp_path, persist=False)
+        filepath = tmp_path.joinpath("envix.json")
+
+        filepath.write_text('{"envix": {"version": 1}}')
+        config = cache.load(filepath, lambda content: Config.parse(filepath, content))
+
+        # Saved without changes.
+        os.utime(filepath, ns=(0, 0))
+        assert cache.load(filepath, _fail_parse) is config
+
+    def test_unusable_cache_dir(self, tmp_path: Path):
+        cache = ConfigCache(Path("/dev/null/envix"), persist=True)
+        filepath = tmp_path.joinpath("envix.json")
+        filepath.write_text('{"envix": {"version": 1}}')
+
+        config = cache.load(filepath, lambda content: Config.parse(filepath, content))
+
+        assert config.root.includes == []
+        assert cache.clear() == 0
+
+
+def _fail_parse(content: bytes) -> Config:
+    raise AssertionError("config must not be parsed again.")
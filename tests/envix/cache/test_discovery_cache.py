@@ -0,0 +1,85 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from envix.cache import discovery_cache as discovery_cache_module
+from envix.cache.discovery_cache import DiscoveryCache
+from envix.path import CONFIG_FILENAMES
+
+
+@pytest.fixture
+def scandir_count(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    count = [0]
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        count[0] += 1
+        return scandir(path)
+
+    monkeypatch.setattr(discovery_cache_module.os, "scandir", counting_scandir)
+
+    return count
+
+
+class TestDiscoveryCache:
+    def test_find_nearest(self, tmp_path: Path):
+        cwd = tmp_path.joinpath("a/b/c")
+        cwd.mkdir(parents=True)
+        tmp_path.joinpath("envix.yml").touch()
+        tmp_path.joinpath("a/envix.toml").touch()
+        tmp_path.joinpath("a/envix.json").touch()
+
+        cache = DiscoveryCache(tmp_path.joinpath("discovery.json"))
+
+        assert cache.find(cwd, CONFIG_FILENAMES) == tmp_path.joinpath("a/envix.toml")
+
+    def test_reuse(self, tmp_path: Path, scandir_count: list[int]):
+        root = tmp_path.joinpath("root")
+        cwd = root.joinpath("a/b")
+        cwd.mkdir(parents=True)
+        root.joinpath("envix.yml").touch()
+        cache_path = tmp_path.joinpath("cache/discovery.json")
+
+        assert DiscoveryCache(cache_path).find(cwd, CONFIG_FILENAMES) == (
+            root.joinpath("envix.yml")
+        )
+        assert scandir_count[0] == 3
+
+        # The result is reused from the disk by another run.
+        assert DiscoveryCache(cache_path).find(cwd, CONFIG_FILENAMES) == (
+            root.joinpath("envix.yml")
+        )
+        assert scandir_count[0] == 3
+
+    def test_invalidate_by_directory_mtime(self, tmp_path: Path):
+        cwd = tmp_path.joinpath("a")
+        cwd.mkdir()
+        tmp_path.joinpath("envix.yml").touch()
+        cache = DiscoveryCache(tmp_path.joinpath("discovery.json"), persist=False)
+
+        assert cache.find(cwd, CONFIG_FILENAMES) == tmp_path.joinpath("envix.yml")
+
+        cwd.joinpath("envix.yml").touch()
+        os.utime(cwd, ns=(0, 0))
+
+        assert cache.find(cwd, CONFIG_FILENAMES) == cwd.joinpath("envix.yml")
+
+    def test_not_found(self, tmp_path: Path):
+        cache = DiscoveryCache(tmp_path.joinpath("discovery.json"), persist=False)
+
+        assert cache.find(tmp_path, ("envix_not_exists.yml",)) is None
+
+    def test_unusable_cache_path(self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+        def raise_error() -> Path:
+            raise NotADirectoryError("Not a directory")
+
+        monkeypatch.setattr(
+            discovery_cache_module, "get_discovery_cache_path", raise_error
+        )
+        tmp_path.joinpath("envix.yml").touch()
+
+        cache = DiscoveryCache()
+
+        assert cache.find(tmp_path, CONFIG_FILENAMES) == tmp_path.joinpath("envix.yml")
+        assert cache.clear() == 1
@@ -0,0 +1,108 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from envix.cache.secret_cache import SecretCache
+from envix.envname import ENVIX_CACHE_KEY
+from envix.exception import EnvixCacheKeyError
+
+SECRET_NAME = "projects/my-project/secrets/FOO/versions/1"
+
+
+class TestSecretCache:
+    def test_get_cached_secret(self, tmp_path: Path):
+        cache = SecretCache(tmp_path)
+        cache.set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        entry = SecretCache(tmp_path).get(SECRET_NAME)
+
+        assert entry is not None
+        assert entry.value.get_secret_value() == "1234567890"
+        assert not entry.is_expired
+
+    def test_encrypted_at_rest(self, tmp_path: Path):
+        SecretCache(tmp_path).set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        for filepath in tmp_path.glob("*.entry"):
+            assert b"1234567890" not in filepath.read_bytes()
+            assert filepath.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_secret(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = SecretCache(tmp_path)
+        cache.set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+
+        entry = cache.get(SECRET_NAME)
+        assert entry is not None
+        assert entry.is_expired
+
+    def test_no_expiry(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        cache = SecretCache(tmp_path)
+        cache.set(SECRET_NAME, SecretStr("1234567890"), ttl=None)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 365 * 24 * 60 * 60)
+
+        entry = cache.get(SECRET_NAME)
+        assert entry is not None
+        assert not entry.is_expired
+
+    def test_refresh(self, tmp_path: Path):
+        SecretCache(tmp_path).set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        assert SecretCache(tmp_path, refresh=True).get(SECRET_NAME) is None
+
+    def test_clear(self, tmp_path: Path):
+        cache = SecretCache(tmp_path)
+        cache.set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        assert cache.clear() == 1
+        assert cache.get(SECRET_NAME) is None
+
+    def test_invalid_key(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setitem(os.environ, ENVIX_CACHE_KEY, "invalid")
+
+        with pytest.raises(EnvixCacheKeyError):
+            SecretCache(tmp_path).set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+    def test_in_memory(self, tmp_path: Path):
+        cache = SecretCache(tmp_path, persist=False)
+        cache.set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        entry = cache.get(SECRET_NAME)
+
+        assert entry is not None
+        assert entry.value.get_secret_value() == "1234567890"
+        assert list(tmp_path.glob("*")) == []
+
+    def test_unusable_cache_dir(self):
+        cache_dir = Path("/dev/null/envix")
+
+        cache = SecretCache(cache_dir)
+        cache.set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        assert SecretCache(cache_dir).get(SECRET_NAME) is None
+        assert cache.get(SECRET_NAME) is not None
+
+    def test_no_key_on_miss(self, tmp_path: Path):
+        assert SecretCache(tmp_path).get(SECRET_NAME) is None
+        assert list(tmp_path.glob("*")) == []
+
+    def test_read_only(self, tmp_path: Path):
+        cache_dir = tmp_path.joinpath("secrets")
+        cache = SecretCache(cache_dir, read_only=True)
+        cache.set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+
+        assert SecretCache(cache_dir, read_only=True).get(SECRET_NAME) is None
+        assert not cache_dir.exists()
+
+        SecretCache(cache_dir).set(SECRET_NAME, SecretStr("1234567890"), ttl=60)
+        entry = SecretCache(cache_dir, read_only=True).get(SECRET_NAME)
+
+        assert entry is not None
+        assert entry.value.get_secret_value() == "1234567890"
@@ -1,8 +1,19 @@
+import asyncio
+import json
+from contextlib import suppress
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
 from envix.cli.app import App
-from envix.exception import EnvixConfigFileNotFound
+from envix.cli.commands.export import Args, watch_export
+from envix.exception import (
+    EnvixConfigFileNotFound,
+    EnvixLoadEnvsError,
+    EnvixWatchOutputError,
+)
+from envix.snapshot import Snapshot
+from pydantic import ValidationError
 
 from tests.config_builder import ConfigV1Builder
 
@@ -37,6 +48,33 @@ class TestCliAppExportCommand:
         )
         assert err == ""
 
+    def test_only_options(
+        self,
+        config_builder: ConfigV1Builder,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        with (
+            config_builder.chain()
+            .add_env("FOO", "1234567890")
+            .add_env("BAR", "abcdefghijklmn")
+            .add_env("BAZ_QUX", "qux")
+            .build_file()
+        ) as config_file:
+            App.run(
+                [
+                    "export",
+                    "--config-file",
+                    config_file.name,
+                    "--only",
+                    "FOO",
+                    "--only-prefix",
+                    "BAZ_",
+                ]
+            )
+
+        out, _ = capsys.readouterr()
+        assert out == "FOO=1234567890\nBAZ_QUX=qux\n"
+
     def test_format_options(
         self,
         config_builder: ConfigV1Builder,
@@ -54,6 +92,18 @@ class TestCliAppExportCommand:
         assert out == '{"FOO": "1234567890", "BAR": "abcdefghijklmn"}\n'
         assert err == ""
 
+    def test_ndjson_format(
+        self,
+        config_builder: ConfigV1Builder,
+        capsys: pytest.CaptureFixture[str],
+    ):
+        with config_builder.add_env("FOO", "1234567890").build_file() as config_file:
+            App.run(["export", "--config-file", config_file.name, "--format", "ndjson"])
+
+        out, err = capsys.readouterr()
+        assert out == '{"name": "FOO", "value": "1234567890"}\n'
+        assert err == ""
+
     def test_config_name(self):
         App.run(["export", "--config-name", "sample"])
 
@@ -86,3 +136,161 @@ class TestCliAppExportCommand:
             ).lstrip()
         )
         assert err == ""
+
+    def test_dotenv_interpolated_with_secrets(
+        self,
+        config_builder: ConfigV1Builder,
+        capsys: pytest.CaptureFixture[str],
+        tmp_path: Path,
+    ):
+        dotenv = tmp_path / ".env"
+        dotenv.write_text("DERIVED=prefix-${SECRET}\nFOO=\nBAR=overridden\n")
+
+        with (
+            config_builder.chain()
+            .add_env("SECRET", "s3cr3t")
+            .add_env("FOO", "1234567890")
+            .add_env("BAR", "abcdefghijklmn")
+            .build_file()
+        ) as config_file:
+            App.run(
+                ["export", "--config-file", config_file.name, "--dotenv", str(dotenv)]
+            )
+
+        out, _ = capsys.readouterr()
+        assert (
+            out
+            == dedent(
+                """
+                SECRET=s3cr3t
+                FOO=1234567890
+                DERIVED=prefix-s3cr3t
+                BAR=overridden
+                """
+            ).lstrip()
+        )
+
+    def test_watch_without_output_file(self):
+        with pytest.raises(EnvixWatchOutputError):
+            App.run(["export", "--watch"])
+
+    @pytest.mark.asyncio
+    async def test_watch(self, tmp_path: Path):
+        def write_config(filepath: Path, includes: list[str], value: str) -> None:
+            filepath.write_text(
+                json.dumps(
+                    {
+                        "envix": {"version": 1},
+                        "includes": includes,
+                        "envs": [
+                            {"type": "Raw", "items": {filepath.stem.upper(): value}}
+                        ],
+                    }
+                )
+            )
+
+        config_filepath = tmp_path.joinpath("envix.json")
+        write_config(config_filepath, ["foo.json"], "1")
+        write_config(tmp_path.joinpath("foo.json"), [], "2")
+        output_filepath = tmp_path.joinpath(".env")
+
+        args = Args(
+            config_file=config_filepath,
+            config_name=None,
+            only=None,
+            only_prefix=None,
+            allowlist_file=None,
+            output_file=output_filepath,
+            format="dotenv",
+            dotenv=None,
+            concurrency=1,
+            no_cache=True,
+            refresh=False,
+            gcp_endpoint=None,
+            trace_file=None,
+            watch=True,
+            snapshot_ttl=0,
+            encrypt=False,
+        )
+
+        async def wait_output(expected: str) -> None:
+            for _ in range(500):
+                if output_filepath.exists() and output_filepath.read_text() == expected:
+                    return
+                await asyncio.sleep(0.01)
+
+            assert output_filepath.read_text() == expected
+
+        task = asyncio.create_task(watch_export(args))
+        try:
+            await wait_output("FOO=2\nENVIX=1\n")
+
+            # The included file is watched as well.
+            write_config(tmp_path.joinpath("foo.json"), [], "3")
+            await wait_output("FOO=3\nENVIX=1\n")
+
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def test_snapshot_format(self, config_builder: ConfigV1Builder, tmp_path: Path):
+        snapshot_filepath = tmp_path.joinpath("envix.snapshot")
+        with config_builder.add_env("FOO", "1234567890").build_file() as config_file:
+            App.run(
+                [
+                    "export",
+                    "--config-file",
+                    config_file.name,
+                    "--format",
+                    "snapshot",
+                    "--output-file",
+                    str(snapshot_filepath),
+                ]
+            )
+
+            snapshot = Snapshot.load(snapshot_filepath.read_bytes())
+
+            assert snapshot.is_fresh()
+            assert list(snapshot.config_hashes) == [Path(config_file.name).resolve()]
+
+        assert {
+            envname: secret.get_secret_value()
+            for envname, secret in snapshot.secrets.items()
+        } == {"FOO": "1234567890"}
+        assert snapshot_filepath.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.parametrize("ttl", ["-1", str(2**32)])
+    def test_snapshot_ttl_out_of_range(self, ttl: str):
+        with pytest.raises(ValidationError):
+            App.run(["export", "--format", "snapshot", "--snapshot-ttl", ttl])
+
+    def test_output_file_kept_on_error(self, tmp_path: Path):
+        config_filepath = tmp_path.joinpath("envix.json")
+        config_filepath.write_text(
+            json.dumps(
+                {
+                    "envix": {"version": 1},
+                    "envs": [
+                        {"type": "Raw", "items": {"FOO": "new"}},
+                        {"type": "File", "items": {"BAR": "missing.txt"}},
+                    ],
+                }
+            )
+        )
+        output_filepath = tmp_path.joinpath(".env")
+        output_filepath.write_text("FOO=old\n")
+
+        with pytest.raises(EnvixLoadEnvsError):
+            App.run(
+                [
+                    "export",
+                    "--config-file",
+                    str(config_filepath),
+                    "--output-file",
+                    str(output_filepath),
+                ]
+            )
+
+        assert output_filepath.read_text() == "FOO=old\n"
+        assert sorted(tmp_path.iterdir()) == [output_filepath, config_filepath]
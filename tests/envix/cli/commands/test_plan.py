@@ -0,0 +1,129 @@
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import SecretStr
+
+from envix.cache.secret_cache import SecretCache
+from envix.cli.app import App
+from envix.envname import ENVIX_CONFIG_DIR
+
+
+def write_config(filepath: Path, config: dict[str, Any]) -> Path:
+    filepath.write_text(json.dumps({"envix": {"version": 1}, **config}))
+
+    return filepath
+
+
+@pytest.fixture
+def config_file(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setitem(os.environ, ENVIX_CONFIG_DIR, os.fspath(tmp_path))
+    monkeypatch.setitem(os.environ, "ENVIX_TEST_HOME", "home")
+
+    write_config(
+        tmp_path.joinpath("base.json"),
+        {
+            "envs": [
+                {
+                    "type": "Raw",
+                    "items": {"ENVIX_TEST_FOO": "foo", "ENVIX_TEST_BAR": "bar"},
+                }
+            ]
+        },
+    )
+
+    return write_config(
+        tmp_path.joinpath("envix.json"),
+        {
+            "envix": {"version": 1, "cache": {"ttl": 60}},
+            "includes": ["base.json"],
+            "envs": [
+                {
+                    "type": "GoogleCloudSecretManager",
+                    "project_id": "my-project",
+                    "items": {
+                        "ENVIX_TEST_FOO": "secrets/foo/versions/latest",
+                        "ENVIX_TEST_HOME": "secrets/home/versions/1",
+                        "ENVIX_TEST_BAZ": "secrets/foo/versions/latest",
+                    },
+                },
+                {
+                    "type": "Raw",
+                    "items": {"ENVIX_TEST_BAR": "qux"},
+                    "overwrite": False,
+                },
+            ],
+        },
+    )
+
+
+class TestCliAppPlanCommand:
+    def test_plan_command_with_help(self):
+        with pytest.raises(SystemExit):
+            App.run(["plan", "--help"])
+
+    def test_plan_json(self, config_file: Path, capsys: pytest.CaptureFixture[str]):
+        SecretCache().set(
+            "projects/my-project/secrets/home/versions/1",
+            SecretStr("cached"),
+            ttl=None,
+        )
+
+        App.run(["plan", "--config-file", os.fspath(config_file), "--format", "json"])
+
+        report = json.loads(capsys.readouterr().out)
+        base, secret_manager, raw = report["envs"]
+
+        assert base["config_filepath"] == os.fspath(config_file.with_name("base.json"))
+        assert secret_manager["shadows"] == {
+            "ENVIX_TEST_FOO": base["config_filepath"],
+            "ENVIX_TEST_HOME": "environment",
+        }
+        assert secret_manager["remote_secrets"] == [
+            "projects/my-project/secrets/foo/versions/latest",
+            "projects/my-project/secrets/home/versions/1",
+        ]
+        assert secret_manager["cache_hits"] == [
+            "projects/my-project/secrets/home/versions/1"
+        ]
+        assert raw["skips"] == ["ENVIX_TEST_BAR"]
+        assert (report["remote_secrets"], report["cache_hits"]) == (2, 1)
+        assert report["remote_calls"] == 1
+
+    def test_plan_text(self, config_file: Path, capsys: pytest.CaptureFixture[str]):
+        App.run(
+            [
+                "plan",
+                "--config-file",
+                os.fspath(config_file),
+                "--clear-environments",
+                "--no-cache",
+            ]
+        )
+
+        out = capsys.readouterr().out
+        assert "GoogleCloudSecretManager: 3 envs, 2 remote secrets" in out
+        assert "ENVIX_TEST_HOME (environment)" not in out
+        assert out.endswith(
+            "Total: 3 envs blocks, 2 remote secrets, 0 cache hits, 2 remote calls\n"
+        )
+
+    def test_plan_without_cache_key(
+        self, config_file: Path, cache_dir: Path, capsys: pytest.CaptureFixture[str]
+    ):
+        App.run(["plan", "--config-file", os.fspath(config_file), "--format", "json"])
+
+        assert json.loads(capsys.readouterr().out)["cache_hits"] == 0
+        assert not cache_dir.exists()
+
+    def test_plan_errors(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+        config_file = write_config(
+            tmp_path.joinpath("envix.json"), {"includes": ["missing.json"], "envs": []}
+        )
+
+        with pytest.raises(SystemExit):
+            App.run(["plan", "--config-file", os.fspath(config_file)])
+
+        assert "error: " in capsys.readouterr().out
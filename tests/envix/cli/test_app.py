@@ -1,8 +1,115 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
 import pytest
 from envix.cli.app import App
+from envix.envname import ENVIX_CONFIG_DIR
+
+# Cold start of `envix inject -- true`, on top of the interpreter importing pydantic
+# and building a model, which every command pays to validate its arguments.
+COLD_START_BUDGET_S = 0.1
+
+# The first model pays for the lazy imports of pydantic as well.
+PYDANTIC_STARTUP = """
+from pydantic import BaseModel
+
+class Args(BaseModel):
+    command: str
+
+Args(command="true")
+"""
+
+# Modules which must be imported only when they are actually needed.
+DEFERRED_MODULES = [
+    "asyncio",
+    "cryptography",
+    "dotenv",
+    "envix.config",
+    "envix.loader",
+    "google.cloud",
+    "pydantic",
+    "rich",
+    "rich_argparse",
+    "yaml",
+]
+
+
+def import_times(module: str) -> dict[str, int]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+def cold_starts(commands: list[list[str]], cwd: Path) -> list[float]:
+    """
+    The fastest cold start of each command.
+
+    The commands are run in turn, so that a load on the machine slows them alike.
+    """
+
+    env = {**os.environ, ENVIX_CONFIG_DIR: str(cwd)}
+
+    elapsed: list[list[float]] = [[] for _ in commands]
+    for _ in range(10):
+        for args, times in zip(commands, elapsed):
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, *args],
+                cwd=cwd,
+                env=env,
+                capture_output=True,
+                check=True,
+            )
+            times.append(time.perf_counter() - start)
+
+    return [min(times) for times in elapsed]
 
 
 class TestApp:
     def test_app(self):
         with pytest.raises(SystemExit):
             App.run(["--help"])
+
+    def test_version(self, capsys: pytest.CaptureFixture[str]):
+        with pytest.raises(SystemExit):
+            App.run(["--version"])
+
+        assert "envix" in capsys.readouterr().out
+
+
+@pytest.fixture(scope="module")
+def app_import_times() -> dict[str, int]:
+    return import_times("envix.cli.app")
+
+
+class TestImportTime:
+    @pytest.mark.parametrize("module", DEFERRED_MODULES)
+    def test_deferred_module(self, module: str, app_import_times: dict[str, int]):
+        assert module not in app_import_times
+
+
+class TestColdStart:
+    def test_inject_cold_start_budget(self, tmp_path: Path):
+        inject, pydantic = cold_starts(
+            [["-m", "envix.cli", "inject", "--", "true"], ["-c", PYDANTIC_STARTUP]],
+            tmp_path,
+        )
+
+        assert inject - pydantic < COLD_START_BUDGET_S
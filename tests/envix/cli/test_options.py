@@ -0,0 +1,64 @@
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from envix.cli.options import add_selection_arguments, get_selection, use_agent
+from envix.envname import ENVIX_GCP_ENDPOINT
+
+
+@dataclass
+class OptionArgs:
+    only: list[str] | None
+    only_prefix: list[str] | None
+    allowlist_file: Path | None
+    no_cache: bool
+    refresh: bool
+    gcp_endpoint: str | None
+
+
+def parse_args(*args: str) -> OptionArgs:
+    parser = ArgumentParser()
+    add_selection_arguments(parser)
+    parser.add_argument("--no-cache", action="store_true", default=False)
+    parser.add_argument("--refresh", action="store_true", default=False)
+    parser.add_argument("--gcp-endpoint", type=str, default=None)
+
+    return OptionArgs(**vars(parser.parse_args(args)))
+
+
+class TestOptions:
+    def test_selection(self, tmp_path: Path):
+        allowlist_filepath = tmp_path / "allowlist"
+        allowlist_filepath.write_text("BAR\n")
+
+        assert get_selection(parse_args()) is None
+
+        selection = get_selection(
+            parse_args(
+                "--only",
+                "FOO",
+                "--only-prefix",
+                "BAZ_",
+                "--allowlist-file",
+                str(allowlist_filepath),
+            )
+        )
+        assert selection is not None
+        assert "FOO" in selection
+        assert "BAZ_QUX" in selection
+        assert "QUX" not in selection
+
+    def test_use_agent(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv(ENVIX_GCP_ENDPOINT, raising=False)
+        assert use_agent(parse_args(), None)
+
+        for args in [["--no-cache"], ["--refresh"], ["--gcp-endpoint", "fake:x"]]:
+            assert not use_agent(parse_args(*args), None)
+
+        args = parse_args("--only", "FOO")
+        assert not use_agent(args, get_selection(args))
+
+        monkeypatch.setenv(ENVIX_GCP_ENDPOINT, "fake:x")
+        assert not use_agent(parse_args(), None)
@@ -0,0 +1,90 @@
+import signal
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from envix.cli.choices import RotationAction
+from envix.cli.rotation import RotationSupervisor
+from envix.loader import v1_loader
+from envix.loader.session import LoaderSession
+from envix.types import Secrets
+
+# Append FOO to the output, and wait for SIGHUP unless FOO is final.
+COMMAND = """
+import os, signal, sys, time
+signal.signal(signal.SIGHUP, lambda *_: sys.exit(0))
+with open(sys.argv[1], "a") as f:
+    f.write(os.environ["FOO"] + "\\n")
+if os.environ["FOO"] != "final":
+    time.sleep(10)
+"""
+
+
+@pytest.fixture
+def rotated(monkeypatch: pytest.MonkeyPatch) -> list[set[str]]:
+    """
+    Secret names to report as rotated on each check.
+    """
+
+    rotated: list[set[str]] = [{"secrets/FOO/versions/latest"}]
+
+    async def check_google_cloud_secret_manager_versions(
+        session: LoaderSession,
+    ) -> set[str]:
+        return rotated.pop(0) if rotated else set()
+
+    monkeypatch.setattr(
+        v1_loader,
+        "check_google_cloud_secret_manager_versions",
+        check_google_cloud_secret_manager_versions,
+    )
+
+    return rotated
+
+
+class TestRotationSupervisor:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("action", "values", "output"),
+        [
+            ("restart", ["initial", "final"], "initial\nfinal\n"),
+            ("signal", ["initial", "rotated"], "initial\n"),
+        ],
+    )
+    async def test_rotation(
+        self,
+        tmp_path: Path,
+        rotated: list[set[str]],
+        action: RotationAction,
+        values: list[str],
+        output: str,
+    ):
+        output_filepath = tmp_path.joinpath("output")
+        env_filepath = tmp_path.joinpath(".env")
+
+        async def load() -> Secrets:
+            return {"FOO": SecretStr(values.pop(0))}
+
+        async with LoaderSession(use_cache=False) as session:
+            supervisor = RotationSupervisor(
+                [sys.executable, "-c", COMMAND, str(output_filepath)],
+                {},
+                load=load,
+                session=session,
+                interval=0.5,
+                action=action,
+                rotation_signal=signal.SIGHUP,
+                env_file=env_filepath,
+            )
+            returncode = await supervisor.run()
+
+        assert returncode == 0
+        assert supervisor.rotation_count == 1
+        assert output_filepath.read_text() == output
+        assert (
+            env_filepath.read_text()
+            == f"FOO={'final' if action == 'restart' else 'rotated'}\n"
+        )
+        assert env_filepath.stat().st_mode & 0o777 == 0o600
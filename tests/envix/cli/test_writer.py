@@ -0,0 +1,95 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from pydantic import SecretStr
+
+from envix.cli.writer import OutputFormat, create_writer, open_atomic
+
+SECRETS = {"FOO": SecretStr("1234567890"), "BAR": SecretStr("abc def")}
+
+
+class TestSecretsWriter:
+    @pytest.mark.parametrize(
+        ("format", "expected"),
+        [
+            ("dotenv", "FOO=1234567890\nBAR='abc def'\n"),
+            ("json", '{"FOO": "1234567890", "BAR": "abc def"}\n'),
+            (
+                "ndjson",
+                (
+                    '{"name": "FOO", "value": "1234567890"}\n'
+                    '{"name": "BAR", "value": "abc def"}\n'
+                ),
+            ),
+        ],
+    )
+    def test_write(self, format: OutputFormat, expected: str):
+        file = StringIO()
+        with create_writer(format, file) as writer:
+            for envname, secret in SECRETS.items():
+                writer.write(envname, secret)
+
+        assert file.getvalue() == expected
+
+    @pytest.mark.parametrize(
+        ("format", "expected"),
+        [("dotenv", "\n"), ("json", "{}\n"), ("ndjson", "")],
+    )
+    def test_write_empty(self, format: OutputFormat, expected: str):
+        file = StringIO()
+        with create_writer(format, file):
+            pass
+
+        assert file.getvalue() == expected
+
+    def test_flush_in_chunks(self):
+        file = StringIO()
+        with create_writer("dotenv", file, chunk_size=1) as writer:
+            writer.write("FOO", SECRETS["FOO"])
+
+            assert file.getvalue() == "FOO=1234567890\n"
+
+    def test_error_before_entries(self):
+        file = StringIO()
+        with pytest.raises(ValueError), create_writer("json", file):
+            raise ValueError()
+
+        assert file.getvalue() == ""
+
+
+class TestOpenAtomic:
+    def test_replace(self, tmp_path: Path):
+        filepath = tmp_path.joinpath(".env")
+        filepath.write_text("FOO=old\n")
+        filepath.chmod(0o600)
+
+        with open_atomic(filepath) as file:
+            file.write("FOO=new\n")
+
+            assert filepath.read_text() == "FOO=old\n"
+
+        assert filepath.read_text() == "FOO=new\n"
+        assert filepath.stat().st_mode & 0o777 == 0o600
+        assert list(tmp_path.iterdir()) == [filepath]
+
+    def test_mode(self, tmp_path: Path):
+        filepath = tmp_path.joinpath(".env")
+        filepath.write_text("FOO=old\n")
+        filepath.chmod(0o644)
+
+        with open_atomic(filepath, mode=0o600) as file:
+            file.write("FOO=new\n")
+
+        assert filepath.stat().st_mode & 0o777 == 0o600
+
+    def test_keep_on_error(self, tmp_path: Path):
+        filepath = tmp_path.joinpath(".env")
+        filepath.write_text("FOO=old\n")
+
+        with pytest.raises(ValueError), open_atomic(filepath) as file:
+            file.write("FOO=new\n")
+            raise ValueError()
+
+        assert filepath.read_text() == "FOO=old\n"
+        assert list(tmp_path.iterdir()) == [filepath]
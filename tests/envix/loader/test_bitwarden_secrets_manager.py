@@ -0,0 +1,219 @@
+import os
+from pathlib import Path
+from typing import Self
+
+import pytest
+
+from envix.config.config import Config
+from envix.config.v1.envs.bitwarden_secrets_manager_envs_v1 import (
+    BitwardenSecretsManagerEnvsV1,
+)
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
+from envix.envname import ENVIX_CONFIG_DIR
+from envix.exception import EnvixBitwardenSecretsManagerError
+from envix.loader import collect_secrets
+from envix.loader.bitwarden_secrets_manager import BitwardenSecretsManagerClient
+from envix.loader.session import LoaderSession
+from tests.config_builder import ConfigV1Builder
+
+FOO_ID = "be8e0ad8-d545-4017-a55a-b02f014d4158"
+BAR_ID = "2863ced6-eba1-48b4-b5c0-afa30104877a"
+MISSING_ID = "00000000-0000-0000-0000-000000000000"
+
+
+class FakeBitwardenSecretsManagerClient(BitwardenSecretsManagerClient):
+    def __init__(self) -> None:
+        self.access_tokens: list[str] = []
+        self.requests: list[list[str]] = []
+
+    def login(
+        self,
+        access_token: str,
+        *,
+        api_url: str | None = None,
+        identity_url: str | None = None,
+    ) -> Self:
+        self.access_tokens.append(access_token)
+
+        return self
+
+    def get_by_ids(self, secret_ids: list[str]) -> dict[str, str]:
+        self.requests.append(secret_ids)
+
+        return {
+            secret_id: f"value of {secret_id}"
+            for secret_id in secret_ids
+            if secret_id != MISSING_ID
+        }
+
+
+@pytest.fixture
+def bitwarden_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> FakeBitwardenSecretsManagerClient:
+    monkeypatch.setitem(os.environ, "BWS_ACCESS_TOKEN", "token")
+
+    return FakeBitwardenSecretsManagerClient()
+
+
+@pytest.fixture
+def config_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setitem(os.environ, ENVIX_CONFIG_DIR, os.fspath(tmp_path))
+
+    return tmp_path
+
+
+def bitwarden_envs(items: dict[str, str]) -> BitwardenSecretsManagerEnvsV1:
+    return BitwardenSecretsManagerEnvsV1(type="BitwardenSecretsManager", items=items)
+
+
+class TestBitwardenSecretsManager:
+    @pytest.mark.asyncio
+    async def test_get_by_ids(
+        self,
+        config_builder: ConfigV1Builder,
+        bitwarden_client: FakeBitwardenSecretsManagerClient,
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            bitwarden_envs(
+                {
+                    "ENVIX_TEST_FOO": FOO_ID,
+                    "ENVIX_TEST_BAR": BAR_ID,
+                    "ENVIX_TEST_BAZ": FOO_ID.upper(),
+                }
+            )
+        )
+        config.envs.append(bitwarden_envs({"ENVIX_TEST_QUX": BAR_ID}))
+
+        async with LoaderSession(
+            use_cache=False,
+            bitwarden_secrets_manager_client_factory=bitwarden_client.login,
+        ) as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+        assert not errors
+        assert secrets["ENVIX_TEST_FOO"].get_secret_value() == f"value of {FOO_ID}"
+        assert secrets["ENVIX_TEST_BAZ"] == secrets["ENVIX_TEST_FOO"]
+        assert secrets["ENVIX_TEST_QUX"] == secrets["ENVIX_TEST_BAR"]
+        # Logged in once, and a single request per envs block.
+        assert bitwarden_client.access_tokens == ["token"]
+        assert sorted(bitwarden_client.requests) == [
+            [BAR_ID],
+            [FOO_ID, BAR_ID],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_secret_cache(
+        self,
+        config_builder: ConfigV1Builder,
+        config_dir: Path,
+        bitwarden_client: FakeBitwardenSecretsManagerClient,
+    ):
+        config = config_builder.build()
+        config.envix.cache = SecretCacheV1(ttl=60)
+        config.envs.append(bitwarden_envs({"ENVIX_TEST_FOO": FOO_ID}))
+
+        for _ in range(2):
+            async with LoaderSession(
+                bitwarden_secrets_manager_client_factory=bitwarden_client.login,
+            ) as session:
+                secrets, errors = await collect_secrets(
+                    Config(config), None, session=session
+                )
+
+            assert not errors
+            assert "ENVIX_TEST_FOO" in secrets
+
+        assert bitwarden_client.requests == [[FOO_ID]]
+
+    @pytest.mark.asyncio
+    async def test_errors(
+        self,
+        config_builder: ConfigV1Builder,
+        bitwarden_client: FakeBitwardenSecretsManagerClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            bitwarden_envs({"ENVIX_TEST_FOO": FOO_ID, "ENVIX_TEST_BAR": MISSING_ID})
+        )
+
+        async with LoaderSession(
+            use_cache=False,
+            bitwarden_secrets_manager_client_factory=bitwarden_client.login,
+        ) as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+            assert list(secrets) == ["ENVIX_TEST_FOO"]
+            assert [type(error) for error in errors] == [
+                EnvixBitwardenSecretsManagerError
+            ]
+
+            monkeypatch.delitem(os.environ, "BWS_ACCESS_TOKEN")
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+        assert not secrets
+        assert len(errors) == 2
+
+    @pytest.mark.asyncio
+    async def test_secret_cache_by_server(
+        self,
+        config_builder: ConfigV1Builder,
+        config_dir: Path,
+        bitwarden_client: FakeBitwardenSecretsManagerClient,
+    ):
+        for api_url in ["https://api.bitwarden.com", "https://api.bitwarden.eu"]:
+            config = config_builder.build()
+            config.envix.cache = SecretCacheV1(ttl=60)
+            config.envs.append(
+                BitwardenSecretsManagerEnvsV1(
+                    type="BitwardenSecretsManager",
+                    items={"ENVIX_TEST_FOO": FOO_ID},
+                    api_url=api_url,
+                )
+            )
+
+            async with LoaderSession(
+                bitwarden_secrets_manager_client_factory=bitwarden_client.login,
+            ) as session:
+                secrets, errors = await collect_secrets(
+                    Config(config), None, session=session
+                )
+
+            assert not errors
+            assert "ENVIX_TEST_FOO" in secrets
+
+        assert bitwarden_client.requests == [[FOO_ID], [FOO_ID]]
+
+    @pytest.mark.asyncio
+    async def test_access_token_from_environ(
+        self,
+        config_builder: ConfigV1Builder,
+        bitwarden_client: FakeBitwardenSecretsManagerClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.delitem(os.environ, "BWS_ACCESS_TOKEN")
+        config = config_builder.build()
+        config.envs.append(bitwarden_envs({"ENVIX_TEST_FOO": FOO_ID}))
+
+        async with LoaderSession(
+            use_cache=False,
+            bitwarden_secrets_manager_client_factory=bitwarden_client.login,
+        ) as session:
+            secrets, errors = await collect_secrets(
+                Config(config),
+                None,
+                session=session,
+                environ={"BWS_ACCESS_TOKEN": "dotenv-token"},
+            )
+
+        assert not errors
+        assert "ENVIX_TEST_FOO" in secrets
+        assert bitwarden_client.access_tokens == ["dotenv-token"]
@@ -0,0 +1,139 @@
+import os
+from pathlib import Path
+from typing import cast
+
+import pytest
+import yaml
+from google.cloud import secretmanager
+
+from envix.config.config import Config
+from envix.config.v1.envs.google_cloud_secret_manager_envs_v1 import (
+    GoogleCloudSecretManagerEnvsV1,
+)
+from envix.envname import ENVIX_GCP_ENDPOINT
+from envix.exception import EnvixGoogleCloudSecretManagerError
+from envix.loader import collect_secrets
+from envix.loader.google_cloud_secret_manager import (
+    FakeSecretManagerFixture,
+    FakeSecretManagerServiceAsyncClient,
+    create_secret_manager_client,
+)
+from envix.loader.session import LoaderSession
+from envix.loader.v1_loader import load_google_cloud_secret_manager_envs_v1
+from tests.config_builder import ConfigV1Builder
+
+
+@pytest.fixture
+def fixture_file(tmp_path: Path) -> Path:
+    filepath = tmp_path.joinpath("secrets.yml")
+    filepath.write_text(
+        yaml.safe_dump(
+            {
+                "secrets": {
+                    "projects/my-project/secrets/foo": ["old", "new"],
+                    "projects/my-project/secrets/bar": "bar",
+                }
+            }
+        )
+    )
+
+    return filepath
+
+
+def secret_manager_envs(items: dict[str, str]) -> GoogleCloudSecretManagerEnvsV1:
+    return GoogleCloudSecretManagerEnvsV1(
+        type="GoogleCloudSecretManager", project_id="my-project", items={**items}
+    )
+
+
+class TestFakeSecretManager:
+    @pytest.mark.asyncio
+    async def test_fake_endpoint(
+        self, config_builder: ConfigV1Builder, fixture_file: Path
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            secret_manager_envs(
+                {
+                    "ENVIX_TEST_FOO": "secrets/foo/versions/latest",
+                    "ENVIX_TEST_OLD_FOO": "secrets/foo/versions/1",
+                    "ENVIX_TEST_BAR": "secrets/bar/versions/latest",
+                    "ENVIX_TEST_BAZ": "secrets/baz/versions/latest",
+                    "ENVIX_TEST_QUX": "secrets/foo/versions/3",
+                }
+            )
+        )
+
+        async with LoaderSession(
+            google_cloud_secret_manager_endpoint=f"fake:{fixture_file}"
+        ) as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+            # The values of the fake are never written to the disk cache.
+            assert session.secret_cache is not None
+            assert not session.secret_cache.persist
+
+        assert {
+            envname: secret.get_secret_value() for envname, secret in secrets.items()
+        } == {
+            "ENVIX_TEST_FOO": "new",
+            "ENVIX_TEST_OLD_FOO": "old",
+            "ENVIX_TEST_BAR": "bar",
+        }
+        assert [type(error) for error in errors] == [
+            EnvixGoogleCloudSecretManagerError
+        ] * 2
+
+    def test_endpoint_from_environment(
+        self, monkeypatch: pytest.MonkeyPatch, fixture_file: Path
+    ):
+        monkeypatch.setitem(os.environ, ENVIX_GCP_ENDPOINT, f"fake:{fixture_file}")
+
+        client = create_secret_manager_client()
+
+        assert isinstance(client, FakeSecretManagerServiceAsyncClient)
+        assert "projects/my-project/secrets/bar" in client.fixture.secrets
+
+    @pytest.mark.asyncio
+    async def test_retry_rate_limit(self):
+        client = FakeSecretManagerServiceAsyncClient(
+            FakeSecretManagerFixture(
+                rate_limit=5,
+                secrets={
+                    f"projects/my-project/secrets/secret_{i}": f"value-{i}"
+                    for i in range(10)
+                },
+            )
+        )
+        envs = secret_manager_envs(
+            {
+                f"ENVIX_TEST_{chr(ord('A') + i)}": f"secrets/secret_{i}/versions/1"
+                for i in range(10)
+            }
+        )
+
+        secrets, errors = await load_google_cloud_secret_manager_envs_v1(
+            envs, {}, client=cast(secretmanager.SecretManagerServiceAsyncClient, client)
+        )
+
+        # Requests over the rate limit are retried with the backoff.
+        assert not errors
+        assert len(secrets) == 10
+        assert client.error_count > 0
+        assert client.request_count == 10 + client.error_count
+
+    @pytest.mark.asyncio
+    async def test_error_rate(self):
+        client = FakeSecretManagerServiceAsyncClient(
+            FakeSecretManagerFixture(
+                error_rate=1.0,
+                secrets={"projects/my-project/secrets/foo": "foo"},
+            )
+        )
+
+        with pytest.raises(Exception, match="Injected error"):
+            await client.access_secret_version(
+                request={"name": "projects/my-project/secrets/foo/versions/latest"}
+            )
@@ -0,0 +1,293 @@
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from envix.config.config import Config
+from envix.config.v1.envs.local_envs_v1 import LocalEnvsV1
+from envix.config.v1.envs.raw_envs_v1 import RawEnvsV1
+from envix.exception import EnvixConfigIncludeCycleError
+from envix.loader import planner
+from envix.loader.planner import execute_plan, plan_config, plan_secrets
+from envix.loader.selection import EnvnameSelection
+from envix.loader.session import LoaderSession
+from envix.types import Environ, ResolvedSecrets
+from tests.config_builder import ConfigV1Builder
+
+
+class TestPlanner:
+    @pytest.mark.asyncio
+    async def test_overwrite_precedence(self, config_builder: ConfigV1Builder):
+        os.environ.pop("ENVIX_TEST_PRECEDENCE", None)
+        config = config_builder.build()
+        config.envs.extend(
+            [
+                RawEnvsV1(type="Raw", items={"ENVIX_TEST_PRECEDENCE": "first"}),
+                RawEnvsV1(
+                    type="Raw",
+                    items={"ENVIX_TEST_PRECEDENCE": "second"},
+                    overwrite=False,
+                ),
+                LocalEnvsV1(
+                    type="Local", items={"ENVIX_TEST_LOCAL": "$ENVIX_TEST_PRECEDENCE"}
+                ),
+            ]
+        )
+
+        secrets, errors = await execute_plan(plan_config(Config(config), None))
+
+        assert not errors
+        assert secrets["ENVIX_TEST_PRECEDENCE"].get_secret_value() == "first"
+        assert secrets["ENVIX_TEST_LOCAL"].get_secret_value() == "first"
+
+    @pytest.mark.asyncio
+    async def test_on_secret_when_final(self, config_builder: ConfigV1Builder):
+        config = config_builder.build()
+        config.envs.extend(
+            [
+                RawEnvsV1(
+                    type="Raw",
+                    items={"ENVIX_TEST_FOO": "first", "ENVIX_TEST_BAR": "first"},
+                ),
+                RawEnvsV1(type="Raw", items={"ENVIX_TEST_FOO": "second"}),
+            ]
+        )
+        written: list[tuple[str, str]] = []
+
+        secrets, errors = await execute_plan(
+            plan_config(Config(config), None),
+            environ={},
+            on_secret=lambda envname, secret: written.append(
+                (envname, secret.get_secret_value())
+            ),
+        )
+
+        assert not errors
+        assert written == [("ENVIX_TEST_BAR", "first"), ("ENVIX_TEST_FOO", "second")]
+        assert len(secrets) == len(written)
+
+    @pytest.mark.asyncio
+    async def test_environ_not_mutated(self, config_builder: ConfigV1Builder):
+        environ = {"ENVIX_TEST_BASE": "base"}
+        config = config_builder.add_env("ENVIX_TEST_OVERLAY", "overlay").build()
+        config.envs.append(
+            LocalEnvsV1(type="Local", items={"ENVIX_TEST_LOCAL": "$ENVIX_TEST_OVERLAY"})
+        )
+
+        secrets, errors = await execute_plan(
+            plan_config(Config(config), None), environ=environ
+        )
+
+        assert not errors
+        assert list(secrets) == ["ENVIX_TEST_OVERLAY", "ENVIX_TEST_LOCAL"]
+        assert environ == {"ENVIX_TEST_BASE": "base"}
+        assert "ENVIX_TEST_OVERLAY" not in os.environ
+
+    @pytest.mark.asyncio
+    async def test_resolve_concurrently(
+        self,
+        config_builder: ConfigV1Builder,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        async def slow_resolve_envs_v1(
+            envs: RawEnvsV1, environ: Environ, session: LoaderSession | None = None
+        ) -> ResolvedSecrets:
+            await asyncio.sleep(0.1)
+            return {}, {}
+
+        monkeypatch.setattr(planner, "resolve_envs_v1", slow_resolve_envs_v1)
+
+        config = config_builder.build()
+        config.envs.extend(RawEnvsV1(type="Raw", items={}) for _ in range(4))
+        plan = plan_config(Config(config), None)
+
+        start = time.perf_counter()
+        await execute_plan(plan, concurrency=4)
+        assert time.perf_counter() - start < 0.3
+
+    def test_include_diamond(self, tmp_path: Path):
+        _write_config(tmp_path, "shared.yml", [], {"ENVIX_TEST_DIAMOND": "shared"})
+        _write_config(tmp_path, "b.yml", ["shared.yml"], {"ENVIX_TEST_DIAMOND": "b"})
+        _write_config(tmp_path, "c.yml", ["shared.yml"], {})
+        config_filepath = _write_config(tmp_path, "a.yml", ["b.yml", "c.yml"], {})
+
+        plan = plan_secrets(config_filepath)
+
+        assert not plan.errors
+        assert [entry.config_filepath.name for entry in plan.entries] == [
+            "shared.yml",
+            "b.yml",
+            "shared.yml",
+            "c.yml",
+            "a.yml",
+        ]
+        # The shared file is planned once, and its envs are placed at every include.
+        assert plan.entries[0] is plan.entries[2]
+        assert len(plan.config_filepaths) == 4
+
+    @pytest.mark.asyncio
+    async def test_include_diamond_precedence(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        def write_config(filename: str, includes: list[str], envs: list[dict]) -> Path:
+            config_filepath = tmp_path.joinpath(filename)
+            config_filepath.write_text(
+                json.dumps(
+                    {"envix": {"version": 1}, "includes": includes, "envs": envs}
+                )
+            )
+
+            return config_filepath
+
+        write_config(
+            "shared.yml",
+            [],
+            [
+                {
+                    "type": "Raw",
+                    "items": {"ENVIX_TEST_DIAMOND": "shared"},
+                    "overwrite": False,
+                },
+                {"type": "Local", "items": {"ENVIX_TEST_SEEN": "$ENVIX_TEST_DIAMOND"}},
+            ],
+        )
+        write_config(
+            "b.yml",
+            ["shared.yml"],
+            [
+                {
+                    "type": "Raw",
+                    "items": {"ENVIX_TEST_DIAMOND": "b"},
+                    "overwrite": False,
+                }
+            ],
+        )
+        write_config(
+            "c.yml",
+            ["shared.yml"],
+            [{"type": "Raw", "items": {"ENVIX_TEST_STAGE": "c"}}],
+        )
+        config_filepath = write_config(
+            "a.yml",
+            ["b.yml", "c.yml"],
+            [{"type": "Local", "items": {"ENVIX_TEST_ALL": "$ENVIX_TEST_DIAMOND"}}],
+        )
+        resolved: list[str] = []
+
+        async def resolve_envs_v1(
+            envs: RawEnvsV1, environ: Environ, session: LoaderSession | None = None
+        ) -> ResolvedSecrets:
+            resolved.append(envs.model_dump_json())
+            return await original_resolve_envs_v1(envs, environ, session)
+
+        original_resolve_envs_v1 = planner.resolve_envs_v1
+        monkeypatch.setattr(planner, "resolve_envs_v1", resolve_envs_v1)
+
+        secrets, errors = await execute_plan(plan_secrets(config_filepath), environ={})
+
+        assert not errors
+        # Applied in the include order, as if every include were loaded in turn.
+        assert {
+            envname: secret.get_secret_value() for envname, secret in secrets.items()
+        } == {
+            "ENVIX_TEST_DIAMOND": "shared",
+            "ENVIX_TEST_SEEN": "shared",
+            "ENVIX_TEST_STAGE": "c",
+            "ENVIX_TEST_ALL": "shared",
+        }
+        # But the envs of the shared file are resolved once.
+        assert len(resolved) == 3
+
+    def test_include_cycle(self, tmp_path: Path):
+        _write_config(tmp_path, "b.yml", ["a.yml"], {})
+        config_filepath = _write_config(tmp_path, "a.yml", ["b.yml"], {})
+
+        plan = plan_secrets(config_filepath)
+
+        assert [type(error) for error in plan.errors] == [EnvixConfigIncludeCycleError]
+        assert [entry.config_filepath.name for entry in plan.entries] == [
+            "b.yml",
+            "a.yml",
+        ]
+
+    def test_config_filepaths(self, tmp_path: Path):
+        _write_config(tmp_path, "b.yml", ["missing.yml"], {})
+        config_filepath = _write_config(tmp_path, "a.yml", ["b.yml"], {})
+
+        plan = plan_secrets(config_filepath)
+
+        assert [filepath.name for filepath in plan.config_filepaths] == [
+            "a.yml",
+            "b.yml",
+            "missing.yml",
+        ]
+
+    def test_select_prunes_includes(self, tmp_path: Path):
+        _write_config(tmp_path, "b.yml", [], {"ENVIX_TEST_B": "b"})
+        _write_config(tmp_path, "c.yml", [], {"ENVIX_TEST_C_FOO": "c"})
+        config_filepath = _write_config(
+            tmp_path,
+            "a.yml",
+            ["b.yml", "c.yml"],
+            {"ENVIX_TEST_A": "a", "ENVIX_TEST_OTHER": "other"},
+        )
+
+        plan = plan_secrets(
+            config_filepath,
+            selection=EnvnameSelection(
+                names=frozenset({"ENVIX_TEST_A"}), prefixes=("ENVIX_TEST_C_",)
+            ),
+        )
+
+        assert [
+            (entry.config_filepath.name, list(entry.envs.items))
+            for entry in plan.entries
+        ] == [("c.yml", ["ENVIX_TEST_C_FOO"]), ("a.yml", ["ENVIX_TEST_A"])]
+        # Pruned includes are still a part of the include graph.
+        assert len(plan.config_filepaths) == 3
+
+    @pytest.mark.asyncio
+    async def test_select_local_dependency(self, config_builder: ConfigV1Builder):
+        config = (
+            config_builder.chain()
+            .add_env("ENVIX_TEST_BASE", "base")
+            .add_env("ENVIX_TEST_UNUSED", "unused")
+            .build()
+        )
+        config.envs.append(
+            LocalEnvsV1(type="Local", items={"ENVIX_TEST_LOCAL": "$ENVIX_TEST_BASE"})
+        )
+
+        plan = plan_config(
+            Config(config),
+            None,
+            selection=EnvnameSelection(names=frozenset({"ENVIX_TEST_LOCAL"})),
+        )
+        secrets, errors = await execute_plan(plan, environ={})
+
+        assert not errors
+        assert list(plan.entries[0].envs.items) == ["ENVIX_TEST_BASE"]
+        # The env names which are only referred to by Local envs are not returned.
+        assert {
+            envname: secret.get_secret_value() for envname, secret in secrets.items()
+        } == {"ENVIX_TEST_LOCAL": "base"}
+
+
+def _write_config(
+    directory: Path, filename: str, includes: list[str], items: dict[str, str]
+) -> Path:
+    config_filepath = directory.joinpath(filename)
+    config_filepath.write_text(
+        json.dumps(
+            {
+                "envix": {"version": 1},
+                "includes": includes,
+                "envs": [{"type": "Raw", "items": items}],
+            }
+        )
+    )
+
+    return config_filepath
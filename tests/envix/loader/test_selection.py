@@ -0,0 +1,32 @@
+from pathlib import Path
+
+import pytest
+
+from envix.exception import EnvixSelectionError
+from envix.loader.selection import EnvnameSelection
+
+
+class TestEnvnameSelection:
+    def test_no_selection(self):
+        assert EnvnameSelection.create() is None
+
+    def test_create(self, tmp_path: Path):
+        allowlist_file = tmp_path.joinpath("allowlist")
+        allowlist_file.write_text("# database\nDATABASE_URL\n\nREDIS_*  # cache\n")
+
+        selection = EnvnameSelection.create(
+            only=["FOO,BAR", " BAZ "],
+            only_prefix=["AWS_"],
+            allowlist_file=allowlist_file,
+        )
+
+        assert selection is not None
+        assert selection.names == {"FOO", "BAR", "BAZ", "DATABASE_URL"}
+        assert selection.prefixes == ("AWS_", "REDIS_")
+        assert "AWS_REGION" in selection
+        assert "REDIS_HOST" in selection
+        assert "QUX" not in selection
+
+    def test_missing_allowlist_file(self, tmp_path: Path):
+        with pytest.raises(EnvixSelectionError):
+            EnvnameSelection.create(allowlist_file=tmp_path.joinpath("missing"))
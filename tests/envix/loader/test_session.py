@@ -0,0 +1,363 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+from google.api_core import exceptions
+
+from envix.config.config import Config
+from envix.config.v1.envs.google_cloud_secret_manager_envs_v1 import (
+    GoogleCloudSecretManagerEnvsV1,
+)
+from envix.config.v1.secret_cache_v1 import SecretCacheV1
+from envix.envname import ENVIX_CONFIG_DIR
+from envix.loader import collect_secrets, google_cloud_secret_manager
+from envix.loader.google_cloud_secret_manager import (
+    FakeSecretManagerFixture,
+    FakeSecretManagerServiceAsyncClient,
+)
+from envix.loader.session import LoaderSession
+from envix.loader.v1_loader import check_google_cloud_secret_manager_versions
+from tests.config_builder import ConfigV1Builder
+
+
+def secret_name(name: str) -> str:
+    return f"projects/my-project/secrets/{name}"
+
+
+@pytest.fixture(autouse=True)
+def secret_manager(
+    monkeypatch: pytest.MonkeyPatch,
+) -> FakeSecretManagerServiceAsyncClient:
+    client = FakeSecretManagerServiceAsyncClient(
+        FakeSecretManagerFixture(
+            secrets={
+                secret_name(name): [f"{name}-1"]
+                for name in (
+                    "FOO",
+                    "BAR",
+                    "ENVIX_TEST_FOO",
+                    "ENVIX_TEST_BAR",
+                    *"ABCDEFGH",
+                )
+            }
+        )
+    )
+    monkeypatch.setattr(
+        google_cloud_secret_manager,
+        "create_secret_manager_client",
+        lambda endpoint=None: client,
+    )
+
+    return client
+
+
+@pytest.fixture
+def config_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    monkeypatch.setitem(os.environ, ENVIX_CONFIG_DIR, os.fspath(tmp_path))
+
+    return tmp_path
+
+
+class TestLoaderSession:
+    @pytest.mark.asyncio
+    async def test_share_google_cloud_secret_manager_client(
+        self,
+        config_builder: ConfigV1Builder,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+    ):
+        config = config_builder.build()
+        config.envs.extend(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={envname: f"secrets/{envname}/versions/latest"},
+            )
+            for envname in ("ENVIX_TEST_FOO", "ENVIX_TEST_BAR")
+        )
+
+        async with LoaderSession() as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+            client = session.google_cloud_secret_manager_client
+
+        assert not errors
+        assert list(secrets) == ["ENVIX_TEST_FOO", "ENVIX_TEST_BAR"]
+        assert session.google_cloud_secret_manager_client_count == 1
+        assert client is secret_manager
+        assert secret_manager.closed
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("use_cache", "refresh_cache", "access_count"),
+        [
+            (True, False, 1),
+            (True, True, 2),
+            (False, False, 2),
+        ],
+    )
+    async def test_secret_cache(
+        self,
+        config_builder: ConfigV1Builder,
+        config_dir: Path,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+        use_cache: bool,
+        refresh_cache: bool,
+        access_count: int,
+    ):
+        config = config_builder.build()
+        config.envix.cache = SecretCacheV1(ttl=60)
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={"ENVIX_TEST_FOO": "secrets/FOO/versions/latest"},
+            )
+        )
+
+        async with LoaderSession() as session:
+            await collect_secrets(Config(config), None, session=session)
+
+        async with LoaderSession(
+            use_cache=use_cache, refresh_cache=refresh_cache
+        ) as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+        assert not errors
+        assert secrets["ENVIX_TEST_FOO"].get_secret_value() == "FOO-1"
+        assert secret_manager.access_count == access_count
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("secret", "latest_version", "stats"),
+        [
+            ("secrets/FOO/versions/1", 2, "1 hits, 0 misses, 0 revalidated"),
+            ("secrets/FOO/versions/latest", 1, "0 hits, 0 misses, 1 revalidated"),
+            ("secrets/FOO/versions/latest", 2, "0 hits, 1 misses, 0 revalidated"),
+        ],
+    )
+    async def test_secret_cache_expiry(
+        self,
+        config_builder: ConfigV1Builder,
+        config_dir: Path,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+        monkeypatch: pytest.MonkeyPatch,
+        secret: str,
+        latest_version: int,
+        stats: str,
+    ):
+        config = config_builder.build()
+        config.envix.cache = SecretCacheV1(ttl=60)
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={"ENVIX_TEST_FOO": secret},
+            )
+        )
+
+        async with LoaderSession() as session:
+            await collect_secrets(Config(config), None, session=session)
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+        secret_manager.fixture.secrets[secret_name("FOO")] = [
+            f"FOO-{version}" for version in range(1, latest_version + 1)
+        ]
+
+        async with LoaderSession() as session:
+            _, errors = await collect_secrets(Config(config), None, session=session)
+
+        assert not errors
+        assert session.secret_cache is not None
+        assert str(session.secret_cache.stats) == stats
+
+    @pytest.mark.asyncio
+    async def test_deduplicate_secret_names(
+        self,
+        config_builder: ConfigV1Builder,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={
+                    "ENVIX_TEST_FOO": "secrets/FOO/versions/1",
+                    "ENVIX_TEST_BAR": "secrets/FOO/versions/1",
+                },
+            )
+        )
+
+        async with LoaderSession(use_cache=False) as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+        assert not errors
+        assert secrets["ENVIX_TEST_FOO"] == secrets["ENVIX_TEST_BAR"]
+        assert secret_manager.access_count == 1
+
+    @pytest.mark.asyncio
+    async def test_google_cloud_secret_manager_concurrency(
+        self,
+        config_builder: ConfigV1Builder,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={
+                    f"ENVIX_TEST_{name}": f"secrets/{name}/versions/1"
+                    for name in ("A", "B", "C", "D", "E", "F", "G", "H")
+                },
+            )
+        )
+
+        async with LoaderSession(
+            use_cache=False, google_cloud_secret_manager_concurrency=2
+        ) as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+        assert not errors
+        assert len(secrets) == 8
+        assert secret_manager.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("failure", "access_count", "has_error"),
+        [
+            (exceptions.ResourceExhausted("quota"), 2, False),
+            (exceptions.ServiceUnavailable("unavailable"), 2, False),
+            (exceptions.PermissionDenied("denied"), 1, True),
+        ],
+    )
+    async def test_retry(
+        self,
+        config_builder: ConfigV1Builder,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+        failure: exceptions.GoogleAPICallError,
+        access_count: int,
+        has_error: bool,
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={"ENVIX_TEST_FOO": "secrets/FOO/versions/1"},
+            )
+        )
+        secret_manager.failures.append(failure)
+
+        async with LoaderSession(use_cache=False) as session:
+            secrets, errors = await collect_secrets(
+                Config(config), None, session=session
+            )
+
+        assert bool(errors) == has_error
+        assert ("ENVIX_TEST_FOO" in secrets) != has_error
+        assert secret_manager.access_count == access_count
+
+    @pytest.mark.asyncio
+    async def test_memoize(
+        self,
+        config_builder: ConfigV1Builder,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+        tmp_path: Path,
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={"ENVIX_TEST_FOO": "secrets/FOO/versions/latest"},
+            )
+        )
+        config_filepath = tmp_path.joinpath("envix.yml")
+
+        async with LoaderSession(use_cache=False, memoize=True) as session:
+            for _ in range(2):
+                _, errors = await collect_secrets(
+                    Config(config), config_filepath, session=session
+                )
+            assert secret_manager.access_count == 1
+
+            session.invalidate([config_filepath])
+            _, errors = await collect_secrets(
+                Config(config), config_filepath, session=session
+            )
+            assert secret_manager.access_count == 2
+
+        assert not errors
+
+    @pytest.mark.asyncio
+    async def test_memoize_skipped(
+        self, config_builder: ConfigV1Builder, tmp_path: Path
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={"ENVIX_TEST_FOO": "secrets/FOO/versions/latest"},
+                overwrite=False,
+            )
+        )
+        config_filepath = tmp_path.joinpath("envix.yml")
+
+        async with LoaderSession(use_cache=False, memoize=True) as session:
+            secrets, _ = await collect_secrets(
+                Config(config),
+                config_filepath,
+                session=session,
+                environ={"ENVIX_TEST_FOO": "foo"},
+            )
+            assert secrets == {}
+
+            secrets, _ = await collect_secrets(
+                Config(config), config_filepath, session=session, environ={}
+            )
+            assert "ENVIX_TEST_FOO" in secrets
+
+    @pytest.mark.asyncio
+    async def test_check_secret_versions(
+        self,
+        config_builder: ConfigV1Builder,
+        secret_manager: FakeSecretManagerServiceAsyncClient,
+    ):
+        config = config_builder.build()
+        config.envs.append(
+            GoogleCloudSecretManagerEnvsV1(
+                type="GoogleCloudSecretManager",
+                project_id="my-project",
+                items={
+                    "ENVIX_TEST_FOO": "secrets/FOO/versions/latest",
+                    "ENVIX_TEST_BAR": "secrets/BAR/versions/1",
+                },
+            )
+        )
+
+        async with LoaderSession(use_cache=False) as session:
+            _, errors = await collect_secrets(Config(config), None, session=session)
+            assert session.secret_versions == {
+                "projects/my-project/secrets/FOO/versions/latest": "projects/my-project/secrets/FOO/versions/1"
+            }
+            assert await check_google_cloud_secret_manager_versions(session) == set()
+
+            secret_manager.fixture.secrets[secret_name("FOO")] = ["FOO-1", "FOO-2"]
+            assert await check_google_cloud_secret_manager_versions(session) == {
+                "projects/my-project/secrets/FOO/versions/latest"
+            }
+
+        assert not errors
+        # Only the version metadata is fetched.
+        assert secret_manager.access_count == 2
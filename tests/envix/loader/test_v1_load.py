@@ -2,8 +2,14 @@ from pathlib import Path
 
 import pytest
 from envix.config.config import Config
-from envix.exception import EnvixConfigFileNotFound
+from envix.config.v1.envs.file_envs_v1 import FileEnvsV1
+from envix.exception import (
+    EnvixConfigFileNotFound,
+    EnvixEnvironmentFileLoadError,
+    EnvixEnvironmentFileTooLargeError,
+)
 from envix.loader import collect_secrets, load_secrets
+from envix.loader.v1_loader import resolve_file_envs_v1
 
 from tests.config_builder import ConfigV1Builder
 
@@ -43,3 +49,28 @@ class TestV1Load:
         assert not errors
         assert not caplog.records
         assert list(secrets.keys()) == expected_keys
+
+    @pytest.mark.asyncio
+    async def test_resolve_file_envs(self, tmp_path: Path):
+        tmp_path.joinpath("foo").write_text("  1234567890\n")
+        # 9 characters, but 18 bytes.
+        tmp_path.joinpath("large").write_text("é" * 9, encoding="UTF-8")
+        envs = FileEnvsV1(
+            type="File",
+            items={
+                "ENVIX_TEST_FOO": tmp_path.joinpath("foo"),
+                "ENVIX_TEST_LARGE": tmp_path.joinpath("large"),
+                "ENVIX_TEST_MISSING": tmp_path.joinpath("missing"),
+            },
+            max_size=16,
+        )
+
+        secrets, errors = await resolve_file_envs_v1(envs, {})
+
+        assert {
+            envname: secret.get_secret_value() for envname, secret in secrets.items()
+        } == {"ENVIX_TEST_FOO": "1234567890"}
+        assert {envname: type(error) for envname, error in errors.items()} == {
+            "ENVIX_TEST_LARGE": EnvixEnvironmentFileTooLargeError,
+            "ENVIX_TEST_MISSING": EnvixEnvironmentFileLoadError,
+        }
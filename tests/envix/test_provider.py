@@ -0,0 +1,211 @@
+from collections.abc import Mapping
+from datetime import date
+from importlib.metadata import EntryPoint
+from typing import Any, Literal
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from envix.config.config import Config
+from envix.config.v1.config import ConfigV1
+from envix.config.v1.envs.provider_envs_v1 import ProviderEnvsV1
+from envix.exception import EnvixProviderError
+from envix.loader import collect_secrets
+from envix.loader.session import LoaderSession
+from envix.loader.v1_loader import load_provider_envs_v1, provider_cache_key
+from envix.provider import EnvsProvider, get_provider_class
+
+
+class EchoEnvsModel(BaseModel):
+    type: Literal["Echo"]
+    items: dict[str, str]
+    prefix: str = ""
+
+
+class EchoProvider(EnvsProvider):
+    model = EchoEnvsModel
+    cacheable = True
+
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+        self.closed = False
+
+    async def resolve(
+        self, envs: BaseModel, items: Mapping[str, Any]
+    ) -> Mapping[str, str]:
+        assert isinstance(envs, EchoEnvsModel)
+        self.requests.append(list(items))
+
+        return {
+            envname: f"{envs.prefix}{ref}"
+            for envname, ref in items.items()
+            if ref != "missing"
+        }
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def echo_providers(monkeypatch: pytest.MonkeyPatch) -> list[EchoProvider]:
+    """
+    The providers created in the test, in order.
+    """
+
+    providers: list[EchoProvider] = []
+
+    class RecordedEchoProvider(EchoProvider):
+        def __init__(self) -> None:
+            super().__init__()
+            providers.append(self)
+
+    monkeypatch.setattr("envix.provider._providers", {"Echo": RecordedEchoProvider})
+
+    return providers
+
+
+def echo_config(*envs: dict[str, Any]) -> Config:
+    return Config(
+        ConfigV1.model_validate({"envix": {"version": 1}, "envs": list(envs)})
+    )
+
+
+class TestProvider:
+    def test_validate_with_provider_model(self):
+        envs = echo_config(
+            {"type": "Echo", "items": {"ENVIX_TEST_FOO": "foo"}, "prefix": "p-"}
+        ).root.envs[0]
+
+        assert isinstance(envs, ProviderEnvsV1)
+        assert envs.settings == EchoEnvsModel(
+            type="Echo", items={"ENVIX_TEST_FOO": "foo"}, prefix="p-"
+        )
+
+        with pytest.raises(ValidationError):
+            echo_config({"type": "Echo", "items": {}, "prefix": 1})
+
+    def test_unknown_type(self):
+        with pytest.raises(ValidationError):
+            echo_config({"type": "Unknown", "items": {}})
+
+    def test_misspelled_builtin_type(self):
+        with pytest.raises(
+            ValidationError, match="Did you mean GoogleCloudSecretManager"
+        ):
+            echo_config({"type": "GoogleCloudSecretManger", "items": {}})
+
+    def test_builtin_type(self):
+        with pytest.raises(ValidationError, match="Built-in envs type"):
+            ProviderEnvsV1.model_validate({"type": "Raw", "items": {}})
+
+    def test_load_from_entry_point(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("envix.provider._providers", {})
+        monkeypatch.setattr(
+            "importlib.metadata.entry_points",
+            lambda group, name: (
+                [
+                    EntryPoint(
+                        name=name,
+                        value=f"{__name__}:EchoProvider",
+                        group=group,
+                    )
+                ]
+                if name == "Echo"
+                else []
+            ),
+        )
+
+        assert get_provider_class("Echo") is EchoProvider
+
+    @pytest.mark.asyncio
+    async def test_resolve(self, echo_providers: list[EchoProvider]):
+        config = echo_config(
+            {
+                "type": "Echo",
+                "items": {"ENVIX_TEST_FOO": "foo", "ENVIX_TEST_BAR": "missing"},
+                "prefix": "p-",
+            },
+            {"type": "Echo", "items": {"ENVIX_TEST_BAZ": "baz"}},
+        )
+
+        async with LoaderSession(use_cache=False) as session:
+            secrets, errors = await collect_secrets(config, None, session=session)
+
+        assert {
+            envname: secret.get_secret_value() for envname, secret in secrets.items()
+        } == {"ENVIX_TEST_FOO": "p-foo", "ENVIX_TEST_BAZ": "baz"}
+        assert [type(error) for error in errors] == [EnvixProviderError]
+        # A request per envs block, and the provider is shared by the session.
+        [provider] = echo_providers
+        assert sorted(provider.requests) == [
+            ["ENVIX_TEST_BAZ"],
+            ["ENVIX_TEST_FOO", "ENVIX_TEST_BAR"],
+        ]
+        assert provider.closed
+
+    @pytest.mark.asyncio
+    async def test_secret_cache(self, echo_providers: list[EchoProvider]):
+        config = echo_config(
+            {
+                "type": "Echo",
+                "items": {"ENVIX_TEST_FOO": "foo"},
+                "cache": {"ttl": 60},
+            }
+        )
+
+        for _ in range(2):
+            async with LoaderSession() as session:
+                secrets, errors = await collect_secrets(config, None, session=session)
+
+            assert not errors
+            assert secrets["ENVIX_TEST_FOO"].get_secret_value() == "foo"
+
+        assert [provider.requests for provider in echo_providers] == [
+            [["ENVIX_TEST_FOO"]],
+            [],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_secret_cache_by_settings(self, echo_providers: list[EchoProvider]):
+        for prefix in ["a-", "b-"]:
+            config = echo_config(
+                {
+                    "type": "Echo",
+                    "items": {"ENVIX_TEST_FOO": "foo"},
+                    "prefix": prefix,
+                    "cache": {"ttl": 60},
+                }
+            )
+
+            async with LoaderSession() as session:
+                secrets, errors = await collect_secrets(config, None, session=session)
+
+            assert not errors
+            assert secrets["ENVIX_TEST_FOO"].get_secret_value() == f"{prefix}foo"
+
+        assert [provider.requests for provider in echo_providers] == [
+            [["ENVIX_TEST_FOO"]],
+            [["ENVIX_TEST_FOO"]],
+        ]
+
+    def test_cache_key_with_non_json_ref(self):
+        envs = echo_config({"type": "Echo", "items": {}}).root.envs[0]
+        assert isinstance(envs, ProviderEnvsV1)
+
+        assert provider_cache_key(envs, date(2024, 1, 1)) != provider_cache_key(
+            envs, "2024-01-01"
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_without_session(self, echo_providers: list[EchoProvider]):
+        envs = echo_config(
+            {"type": "Echo", "items": {"ENVIX_TEST_FOO": "foo"}, "overwrite": False}
+        ).root.envs[0]
+        assert isinstance(envs, ProviderEnvsV1)
+
+        secrets, errors = await load_provider_envs_v1(envs, {"ENVIX_TEST_FOO": "set"})
+
+        assert (secrets, errors) == ({}, [])
+        [provider] = echo_providers
+        assert provider.requests == []
+        assert provider.closed
@@ -0,0 +1,71 @@
+import time
+from pathlib import Path
+
+import pytest
+from cryptography.fernet import Fernet
+from pydantic import SecretStr
+
+from envix.exception import EnvixSnapshotError
+from envix.snapshot import Snapshot, create_snapshot
+
+SECRETS = {"FOO": SecretStr("1234567890"), "BAR": SecretStr("日本語\n=")}
+
+
+def values(snapshot: Snapshot) -> dict[str, str]:
+    return {
+        envname: secret.get_secret_value()
+        for envname, secret in snapshot.secrets.items()
+    }
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize("encrypted", [False, True])
+    def test_dump_and_load(self, tmp_path: Path, encrypted: bool):
+        config_filepath = tmp_path.joinpath("envix.yml")
+        config_filepath.write_text("envix:\n  version: 1\n")
+        key = Fernet.generate_key() if encrypted else None
+
+        content = create_snapshot(SECRETS, [config_filepath], ttl=60).dump(key)
+        snapshot = Snapshot.load(content, key)
+
+        assert values(snapshot) == values(Snapshot(secrets=SECRETS, created_at=0))
+        assert snapshot.ttl == 60
+        assert list(snapshot.config_hashes) == [config_filepath.resolve()]
+        assert (b"1234567890" in content) != encrypted
+
+    def test_fresh(self, tmp_path: Path):
+        config_filepath = tmp_path.joinpath("envix.yml")
+        config_filepath.write_text("envix:\n  version: 1\n")
+
+        snapshot = create_snapshot(SECRETS, [config_filepath], ttl=60)
+        assert snapshot.is_fresh()
+
+        config_filepath.write_text("envix:\n  version: 1\nenvs: []\n")
+        assert not snapshot.is_fresh()
+
+        # Configs which do not exist are not checked.
+        config_filepath.unlink()
+        assert snapshot.is_fresh()
+
+    def test_expired(self):
+        snapshot = Snapshot(secrets=SECRETS, created_at=int(time.time()) - 120, ttl=60)
+
+        assert snapshot.is_expired
+        assert not snapshot.is_fresh()
+        assert not Snapshot(secrets=SECRETS, created_at=0).is_expired
+
+    @pytest.mark.parametrize(
+        ("content", "key"),
+        [
+            (b"not a snapshot", None),
+            (Snapshot(secrets=SECRETS, created_at=0).dump()[:-1], None),
+            (Snapshot(secrets=SECRETS, created_at=0).dump(Fernet.generate_key()), None),
+            (
+                Snapshot(secrets=SECRETS, created_at=0).dump(Fernet.generate_key()),
+                Fernet.generate_key(),
+            ),
+        ],
+    )
+    def test_broken(self, content: bytes, key: bytes | None):
+        with pytest.raises(EnvixSnapshotError):
+            Snapshot.load(content, key)
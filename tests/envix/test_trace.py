@@ -0,0 +1,76 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from envix import trace as trace_module
+from envix.trace import span, trace_command, tracing
+
+
+def test_span_without_tracer():
+    with span("load", "config", path="envix.yml") as args:
+        args["cache"] = "hit"
+
+
+def test_span():
+    with tracing() as tracer, span("load", "config", path="envix.yml") as args:
+        args["cache"] = "hit"
+
+    assert [(span.category, span.name) for span in tracer.spans] == [("config", "load")]
+    assert tracer.spans[0].args == {"path": "envix.yml", "cache": "hit"}
+    assert "config.load" in tracer.format_table()
+
+
+def test_span_of_concurrent_tasks():
+    async def access(secret: str) -> None:
+        with span("access_secret_version", "secret", secret=secret):
+            await asyncio.sleep(0)
+
+    async def main() -> None:
+        await asyncio.gather(access("FOO"), access("BAR"))
+
+    with tracing() as tracer:
+        asyncio.run(main())
+
+    assert len({span.tid for span in tracer.spans}) == 2
+    assert "FOO" in tracer.format_table()
+
+
+def test_dump_chrome_trace(tmp_path: Path):
+    trace_file = tmp_path.joinpath("trace.json")
+
+    with (
+        tracing() as tracer,
+        span("plan", "loader"),
+        span("include", "loader", path="envix_sample.yml"),
+    ):
+        pass
+
+    tracer.dump_chrome_trace(trace_file)
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["include", "plan"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[1]["ts"] <= events[0]["ts"]
+
+
+def test_trace_command_disabled(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(trace_module.logger, "isEnabledFor", lambda level: False)
+
+    with trace_command(None):
+        assert trace_module._tracer.get() is None
+
+
+def test_trace_command(tmp_path: Path):
+    trace_file = tmp_path.joinpath("trace.json")
+
+    with (
+        pytest.raises(RuntimeError),
+        trace_command(trace_file),
+        span("plan", "loader"),
+    ):
+        raise RuntimeError()
+
+    events = json.loads(trace_file.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["plan"]
@@ -0,0 +1,53 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+
+from envix.watch import FileWatcher
+
+
+class TestFileWatcher:
+    def test_changed(self, tmp_path: Path):
+        filepath = tmp_path.joinpath("envix.yml")
+        filepath.write_text("a")
+        missing_filepath = tmp_path.joinpath("missing.yml")
+
+        watcher = FileWatcher([filepath, missing_filepath], use_inotify=False)
+
+        assert watcher.changed() == set()
+
+        filepath.write_text("ab")
+        missing_filepath.write_text("a")
+
+        assert watcher.changed() == {filepath, missing_filepath}
+        assert watcher.changed() == set()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_inotify", [True, False])
+    async def test_wait(self, tmp_path: Path, use_inotify: bool):
+        filepath = tmp_path.joinpath("envix.yml")
+        filepath.write_text("a")
+        other_filepath = tmp_path.joinpath("other.yml")
+
+        watcher = FileWatcher(
+            [filepath], debounce=0.01, poll_interval=0.01, use_inotify=use_inotify
+        )
+        try:
+            task = asyncio.create_task(watcher.wait())
+            await asyncio.sleep(0.05)
+
+            # Files which are not watched are ignored.
+            other_filepath.write_text("a")
+            await asyncio.sleep(0.05)
+            assert not task.done()
+
+            # Editors replace the file with a rename.
+            tmp_filepath = tmp_path.joinpath(".envix.yml.swp")
+            tmp_filepath.write_text("ab")
+            os.replace(tmp_filepath, filepath)
+
+            assert await asyncio.wait_for(task, timeout=5) == {filepath}
+
+        finally:
+            watcher.close()